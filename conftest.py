@@ -0,0 +1,38 @@
+"""
+Shared pytest fixtures for the JARVIS AI Hub integration tests
+The expensive objects are built once per test session and injected by name
+"""
+
+import pytest
+
+@pytest.fixture(scope="session")
+def app():
+    """The Flask application"""
+    from src.main import app
+    return app
+
+@pytest.fixture(scope="session")
+def client(app):
+    """In-process test client of the Flask application"""
+    return app.test_client()
+
+@pytest.fixture(scope="session")
+def schemas():
+    """All loaded skill schemas"""
+    from src.schema_loader import get_all_schemas
+    return get_all_schemas()
+
+@pytest.fixture(scope="session")
+def http_session():
+    """Pooled HTTP session for probing a live server"""
+    from test_integration import SESSION
+    return SESSION
+
+def pytest_generate_tests(metafunc):
+    """Runs the skill and orchestrator tests once per request in test_integration"""
+    if "skill_request" in metafunc.fixturenames:
+        from test_integration import SKILL_REQUESTS
+        metafunc.parametrize("skill_request", SKILL_REQUESTS, ids=[label for label, _, _ in SKILL_REQUESTS])
+    if "test_request" in metafunc.fixturenames:
+        from test_integration import TEST_REQUESTS
+        metafunc.parametrize("test_request", TEST_REQUESTS, ids=[request["message"] for request in TEST_REQUESTS])
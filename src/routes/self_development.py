@@ -36,7 +36,7 @@ def get_self_development_history():
     API endpoint to retrieve the history of self-development activities.
     """
     try:
-        history = sdo.knowledge_repository.get_self_development_history()
+        history = sdo.get_self_development_history()
         return jsonify({"success": True, "data": history}), 200
     except Exception as e:
         logger.error(f"Error retrieving self-development history: {str(e)}")
@@ -7,6 +7,7 @@ import json
 import os
 import glob
 import logging
+from functools import lru_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -14,10 +15,19 @@ logger = logging.getLogger(__name__)
 
 SCHEMAS = {}
 
+# Lowercased action and intent -> (skill_name, schema) of the first schema declaring it
+_BY_ACTION = {}
+_BY_INTENT = {}
+
+MATCH_CACHE_SIZE = 1024  # Matched inputs kept for repeated requests
+
 def load_schemas():
     """Load all skill schemas from the schemas directory"""
-    global SCHEMAS
+    global SCHEMAS, _BY_ACTION, _BY_INTENT
     SCHEMAS = {}
+    _BY_ACTION = {}
+    _BY_INTENT = {}
+    _match_schema_cached.cache_clear()
     
     # Get the base schemas directory
     base_dir = os.path.dirname(os.path.abspath(__file__))
@@ -50,6 +60,15 @@ def load_schemas():
         except Exception as e:
             logger.error(f"Failed to load schema from {schema_path}: {e}")
     
+    # Index the schemas by action and intent, in matching order
+    for skill_name, schema in SCHEMAS.items():
+        schema_action = schema.get("action")
+        if schema_action:
+            _BY_ACTION.setdefault(schema_action.lower(), (skill_name, schema))
+        schema_intent = schema.get("intent")
+        if schema_intent:
+            _BY_INTENT.setdefault(schema_intent.lower(), (skill_name, schema))
+    
     logger.info(f"Loaded {len(SCHEMAS)} skill schemas")
 
 def match_schema(input_data: dict):
@@ -65,26 +84,36 @@ def match_schema(input_data: dict):
     if not isinstance(input_data, dict):
         return None, None
     
+    fields = (input_data.get("action"), input_data.get("intent"), input_data.get("message", ""))
+    try:
+        return _match_schema_cached(*fields)
+    except TypeError:
+        # Unhashable field values are matched without the cache
+        return _match_fields(*fields)
+
+@lru_cache(maxsize=MATCH_CACHE_SIZE)
+def _match_schema_cached(input_action, input_intent, input_message):
+    """Matches the fields of an input, caching the result until schemas are reloaded"""
+    return _match_fields(input_action, input_intent, input_message)
+
+def _match_fields(input_action, input_intent, input_message):
+    """Matches the action, intent and message of an input to a skill schema"""
     # Try to match by action field (primary matching method)
-    input_action = input_data.get("action")
     if input_action:
-        for skill_name, schema in SCHEMAS.items():
-            schema_action = schema.get("action")
-            if schema_action and input_action.lower() == schema_action.lower():
-                logger.info(f"Matched skill '{skill_name}' by action: {input_action}")
-                return skill_name, schema
+        match = _BY_ACTION.get(input_action.lower())
+        if match:
+            logger.info(f"Matched skill '{match[0]}' by action: {input_action}")
+            return match
     
     # Try to match by intent field (secondary matching method)
-    input_intent = input_data.get("intent")
     if input_intent:
-        for skill_name, schema in SCHEMAS.items():
-            schema_intent = schema.get("intent")
-            if schema_intent and input_intent.lower() == schema_intent.lower():
-                logger.info(f"Matched skill '{skill_name}' by intent: {input_intent}")
-                return skill_name, schema
+        match = _BY_INTENT.get(input_intent.lower())
+        if match:
+            logger.info(f"Matched skill '{match[0]}' by intent: {input_intent}")
+            return match
     
     # Try to match by keywords (tertiary matching method)
-    input_text = input_data.get("message", "").lower()
+    input_text = input_message.lower()
     if input_text:
         for skill_name, schema in SCHEMAS.items():
             keywords = schema.get("keywords", [])
@@ -92,7 +121,7 @@ def match_schema(input_data: dict):
                 logger.info(f"Matched skill '{skill_name}' by keywords in: {input_text}")
                 return skill_name, schema
     
-    logger.debug(f"No schema match found for input: {input_data}")
+    logger.debug(f"No schema match found for input: action={input_action}, intent={input_intent}, message={input_message}")
     return None, None
 
 def get_all_schemas():
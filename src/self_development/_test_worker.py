@@ -0,0 +1,67 @@
+"""
+Unit Test Worker for JARVIS AI Hub Self-Development Module
+
+Helper process used by the Validation Framework. It reads one JSON job
+line from stdin, runs the generated tests of the job, writes one JSON
+result line to stdout and exits. The framework starts each worker before
+its job arrives, so the interpreter start-up and test imports are off the
+critical path, while code tested by one job can never affect another.
+
+Run it as a script: it must not import the rest of the package.
+"""
+
+import io
+import importlib.util
+import json
+import os
+import sys
+import unittest
+from typing import Dict, Any
+
+def _load_module(name: str, path: str):
+    """Loads a source file as a module registered under the given name."""
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    sys.modules[name] = module
+    spec.loader.exec_module(module)
+    return module
+
+def run_job(job: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Runs the tests of a generated test module.
+
+    Args:
+        job: Dictionary with the path of the code under test ('code_path'),
+            imported by the test module, and of the test module ('test_path')
+
+    Returns:
+        Dictionary with whether the tests succeeded and their output
+    """
+    code_name = os.path.basename(job['code_path'])[:-3]
+    test_name = os.path.basename(job['test_path'])[:-3]
+    stream = io.StringIO()
+    try:
+        _load_module(code_name, job['code_path'])
+        test_module = _load_module(test_name, job['test_path'])
+        suite = unittest.TestLoader().loadTestsFromModule(test_module)
+        result = unittest.TextTestRunner(stream=stream).run(suite)
+        return {'successful': result.wasSuccessful(), 'output': stream.getvalue()}
+    except BaseException as e:  # Tested code may call sys.exit
+        return {'successful': False, 'output': stream.getvalue() + f"{type(e).__name__}: {e}"}
+
+def main():
+    # Keep the script's own directory off the path of the tested code
+    if sys.path and sys.path[0] == os.path.dirname(os.path.abspath(__file__)):
+        del sys.path[0]
+
+    # Results get a private copy of stdout; anything the tested code prints goes to stderr
+    results = os.fdopen(os.dup(sys.stdout.fileno()), 'w')
+    os.dup2(sys.stderr.fileno(), sys.stdout.fileno())
+
+    line = sys.stdin.readline()
+    if line:
+        results.write(json.dumps(run_job(json.loads(line))) + "\n")
+        results.flush()
+
+if __name__ == "__main__":
+    main()
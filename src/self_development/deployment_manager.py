@@ -11,31 +11,81 @@ import json
 import logging
 import shutil
 import subprocess
-from typing import Dict, List, Any, Optional
+import sys
+from typing import Dict, List, Any, Optional, Tuple
 from datetime import datetime
 import tempfile
-import git
+import uuid
+from collections import deque
+from itertools import islice
+from dataclasses import dataclass, fields
 
 logger = logging.getLogger(__name__)
 
+# Interned vocabularies so retained records share one object per value
+_STATUS = {s: sys.intern(s) for s in (
+    'initiated', 'completed', 'failed', 'failed_validation', 'failed_backup',
+    'failed_verification', 'error'
+)}
+_STRATEGY = {s: sys.intern(s) for s in ('safe', 'gradual', 'canary', 'blue_green')}
+_PHASE = {s: sys.intern(s) for s in ('staging_deployment', 'limited_testing', 'full_deployment')}
+
+@dataclass(slots=True)
+class DeploymentRecord:
+    """
+    Record of a single deployment, kept in the deployment history.
+    Converted to a dictionary only when handed to callers or the knowledge repository.
+    """
+    deployment_id: str
+    timestamp: str
+    target_file: str
+    strategy: str
+    validation_required: bool = True
+    status: str = _STATUS['initiated']
+    code_hash: int = 0
+    backup_created: bool = False
+    validation_passed: bool = False
+    deployment_successful: bool = False
+    rollback_available: bool = False
+    backup_path: Optional[str] = None
+    deployment_details: Optional[str] = None
+    validation_result: Optional[Dict[str, Any]] = None
+    verification_result: Optional[Dict[str, Any]] = None
+    rollback_result: Optional[Dict[str, Any]] = None
+    emergency_rollback: Optional[Dict[str, Any]] = None
+    phases: Optional[List[Dict[str, Any]]] = None
+    canary_metrics: Optional[Dict[str, Any]] = None
+    environments: Optional[Dict[str, Any]] = None
+    error: Optional[str] = None
+
+    def update(self, values: Dict[str, Any]):
+        """Applies a strategy result dictionary to the record."""
+        for key, value in values.items():
+            setattr(self, key, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the record to a dictionary, omitting unset optional fields."""
+        result = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value is not None:
+                result[f.name] = value
+        return result
+
 class DeploymentManager:
     """
     The Deployment Manager ensures safe deployment of self-modified code
     with proper version control, testing, and rollback capabilities.
     """
 
+    _STRATEGY_NAMES = tuple(_STRATEGY.values())
+
     def __init__(self, knowledge_repository=None, validation_framework=None):
         self.knowledge_repository = knowledge_repository
         self.validation_framework = validation_framework
-        self.deployment_history = []
+        self.deployment_history: deque = deque(maxlen=50)
         self.backup_directory = os.path.join(os.getcwd(), "backups")
         self.staging_directory = os.path.join(os.getcwd(), "staging")
-        self.deployment_strategies = {
-            'safe': self._safe_deployment,
-            'gradual': self._gradual_deployment,
-            'canary': self._canary_deployment,
-            'blue_green': self._blue_green_deployment
-        }
         self._ensure_directories()
         logger.info("Deployment Manager initialized")
 
@@ -60,100 +110,167 @@ class DeploymentManager:
         """
         logger.info(f"Initiating {strategy} deployment to {target_file}")
         
-        deployment_record = {
-            'deployment_id': f"deploy_{int(datetime.now().timestamp())}",
-            'timestamp': datetime.now().isoformat(),
-            'target_file': target_file,
-            'strategy': strategy,
-            'validation_required': validation_required,
-            'status': 'initiated',
-            'code_hash': hash(code),
-            'backup_created': False,
-            'validation_passed': False,
-            'deployment_successful': False,
-            'rollback_available': False
-        }
+        deployment_record, finished = self._execute_deployment(
+            code, target_file, strategy, validation_required
+        )
+        if finished:
+            self._store_deployment_record(deployment_record)
+        
+        return deployment_record.to_dict()
+
+    def deploy_many(self, items: List[Tuple[str, str]], strategy: str = "safe",
+                    validation_required: bool = True) -> List[Dict[str, Any]]:
+        """
+        Deploys a bundle of files, validating every item up front and storing
+        all resulting records with a single knowledge repository write.
+        
+        Args:
+            items: List of (code, target_file) pairs
+            strategy: Deployment strategy applied to every item
+            validation_required: Whether to validate code before deployment
+            
+        Returns:
+            List of deployment result dictionaries, in input order
+        """
+        logger.info(f"Initiating batched {strategy} deployment of {len(items)} files")
+        
+        validation_results = [None] * len(items)
+        if validation_required and self.validation_framework and items:
+            try:
+                validation_results = [
+                    self.validation_framework.validate_code(
+                        code, language="python", validation_level="comprehensive"
+                    )
+                    for code, _ in items
+                ]
+            except Exception as e:
+                # Fall back to per-item validation inside the deployment step
+                logger.error(f"Batch validation failed: {str(e)}")
+                validation_results = [None] * len(items)
+        
+        records = []
+        finished_records = []
+        for (code, target_file), validation_result in zip(items, validation_results):
+            deployment_record, finished = self._execute_deployment(
+                code, target_file, strategy, validation_required, validation_result
+            )
+            records.append(deployment_record)
+            if finished:
+                finished_records.append(deployment_record)
+        
+        self._store_deployment_records(finished_records)
+        
+        return [record.to_dict() for record in records]
+
+    def _execute_deployment(self, code: str, target_file: str, strategy: str,
+                            validation_required: bool,
+                            validation_result: Optional[Dict[str, Any]] = None
+                            ) -> Tuple[DeploymentRecord, bool]:
+        """
+        Runs validation, backup, strategy and verification for a single deployment.
+        
+        Args:
+            code: The code to deploy
+            target_file: Target file path for deployment
+            strategy: Deployment strategy name
+            validation_required: Whether to validate code before deployment
+            validation_result: Precomputed validation result, if already validated
+            
+        Returns:
+            Tuple of the deployment record and whether it should be stored
+        """
+        deployment_record = DeploymentRecord(
+            deployment_id=f"deploy_{int(datetime.now().timestamp())}_{uuid.uuid4().hex[:8]}",
+            timestamp=datetime.now().isoformat(),
+            target_file=target_file,
+            strategy=_STRATEGY.get(strategy, strategy),
+            validation_required=validation_required,
+            code_hash=hash(code)
+        )
 
         try:
             # Step 1: Validation (if required)
             if validation_required and self.validation_framework:
-                logger.info("Validating code before deployment")
-                validation_result = self.validation_framework.validate_code(
-                    code, language="python", validation_level="comprehensive"
-                )
-                deployment_record['validation_result'] = validation_result
-                deployment_record['validation_passed'] = validation_result['passed']
+                if validation_result is None:
+                    logger.info("Validating code before deployment")
+                    validation_result = self.validation_framework.validate_code(
+                        code, language="python", validation_level="comprehensive"
+                    )
+                deployment_record.validation_result = validation_result
+                deployment_record.validation_passed = validation_result['passed']
                 
                 if not validation_result['passed']:
-                    deployment_record['status'] = 'failed_validation'
-                    deployment_record['error'] = 'Code failed validation checks'
-                    return deployment_record
+                    deployment_record.status = _STATUS['failed_validation']
+                    deployment_record.error = 'Code failed validation checks'
+                    return deployment_record, False
             else:
-                deployment_record['validation_passed'] = True
+                deployment_record.validation_passed = True
             
             # Step 2: Create backup
-            backup_result = self._create_backup(target_file, deployment_record['deployment_id'])
-            deployment_record['backup_created'] = backup_result['success']
-            deployment_record['backup_path'] = backup_result.get('backup_path')
+            backup_result = self._create_backup(target_file, deployment_record.deployment_id)
+            deployment_record.backup_created = backup_result['success']
+            deployment_record.backup_path = backup_result.get('backup_path')
             
             if not backup_result['success']:
-                deployment_record['status'] = 'failed_backup'
-                deployment_record['error'] = backup_result.get('error', 'Backup creation failed')
-                return deployment_record
+                deployment_record.status = _STATUS['failed_backup']
+                deployment_record.error = backup_result.get('error', 'Backup creation failed')
+                return deployment_record, False
             
             # Step 3: Execute deployment strategy
-            if strategy in self.deployment_strategies:
-                strategy_result = self.deployment_strategies[strategy](
-                    code, target_file, deployment_record
-                )
-                deployment_record.update(strategy_result)
-            else:
-                deployment_record['status'] = 'failed'
-                deployment_record['error'] = f'Unknown deployment strategy: {strategy}'
-                return deployment_record
+            match strategy:
+                case 'safe':
+                    strategy_result = self._safe_deployment(code, target_file, deployment_record)
+                case 'gradual':
+                    strategy_result = self._gradual_deployment(code, target_file, deployment_record)
+                case 'canary':
+                    strategy_result = self._canary_deployment(code, target_file, deployment_record)
+                case 'blue_green':
+                    strategy_result = self._blue_green_deployment(code, target_file, deployment_record)
+                case _:
+                    deployment_record.status = _STATUS['failed']
+                    deployment_record.error = f'Unknown deployment strategy: {strategy}'
+                    return deployment_record, False
+            deployment_record.update(strategy_result)
             
             # Step 4: Post-deployment verification
-            if deployment_record.get('deployment_successful', False):
+            if deployment_record.deployment_successful:
                 verification_result = self._verify_deployment(target_file, code)
-                deployment_record['verification_result'] = verification_result
+                deployment_record.verification_result = verification_result
                 
                 if not verification_result['success']:
                     # Rollback if verification fails
                     logger.warning("Deployment verification failed, initiating rollback")
-                    rollback_result = self.rollback_deployment(deployment_record['deployment_id'])
-                    deployment_record['rollback_result'] = rollback_result
-                    deployment_record['status'] = 'failed_verification'
+                    rollback_result = self.rollback_deployment(deployment_record.deployment_id)
+                    deployment_record.rollback_result = rollback_result
+                    deployment_record.status = _STATUS['failed_verification']
                 else:
-                    deployment_record['status'] = 'completed'
-                    deployment_record['rollback_available'] = True
+                    deployment_record.status = _STATUS['completed']
+                    deployment_record.rollback_available = True
             
         except Exception as e:
             logger.error(f"Deployment process failed: {str(e)}")
-            deployment_record['status'] = 'error'
-            deployment_record['error'] = str(e)
+            deployment_record.status = _STATUS['error']
+            deployment_record.error = str(e)
             
             # Attempt rollback if backup was created
-            if deployment_record.get('backup_created', False):
+            if deployment_record.backup_created:
                 try:
-                    rollback_result = self.rollback_deployment(deployment_record['deployment_id'])
-                    deployment_record['emergency_rollback'] = rollback_result
+                    rollback_result = self.rollback_deployment(deployment_record.deployment_id)
+                    deployment_record.emergency_rollback = rollback_result
                 except Exception as rollback_error:
                     logger.error(f"Emergency rollback failed: {str(rollback_error)}")
         
-        # Store deployment record
-        self._store_deployment_record(deployment_record)
-        
-        return deployment_record
+        return deployment_record, True
 
     def _safe_deployment(self, code: str, target_file: str, 
-                        deployment_record: Dict[str, Any]) -> Dict[str, Any]:
+                        deployment_record: DeploymentRecord) -> Dict[str, Any]:
         """
         Implements safe deployment strategy with immediate replacement.
         
         Args:
             code: Code to deploy
             target_file: Target file path
-            deployment_record: Deployment record dictionary
+            deployment_record: Deployment record
             
         Returns:
             Dictionary with deployment results
@@ -188,14 +305,14 @@ class DeploymentManager:
         return result
 
     def _gradual_deployment(self, code: str, target_file: str, 
-                           deployment_record: Dict[str, Any]) -> Dict[str, Any]:
+                           deployment_record: DeploymentRecord) -> Dict[str, Any]:
         """
         Implements gradual deployment strategy with phased rollout.
         
         Args:
             code: Code to deploy
             target_file: Target file path
-            deployment_record: Deployment record dictionary
+            deployment_record: Deployment record
             
         Returns:
             Dictionary with deployment results
@@ -240,14 +357,14 @@ class DeploymentManager:
         return result
 
     def _canary_deployment(self, code: str, target_file: str, 
-                          deployment_record: Dict[str, Any]) -> Dict[str, Any]:
+                          deployment_record: DeploymentRecord) -> Dict[str, Any]:
         """
         Implements canary deployment strategy with monitoring.
         
         Args:
             code: Code to deploy
             target_file: Target file path
-            deployment_record: Deployment record dictionary
+            deployment_record: Deployment record
             
         Returns:
             Dictionary with deployment results
@@ -259,8 +376,8 @@ class DeploymentManager:
         }
 
         try:
-            # Create canary version
-            canary_file = f"{target_file}.canary"
+            # Create canary version in the staging area
+            canary_file = self._staging_path(target_file, 'canary', deployment_record.deployment_id)
             with open(canary_file, 'w') as f:
                 f.write(code)
             
@@ -270,14 +387,15 @@ class DeploymentManager:
             
             if monitoring_result['success'] and monitoring_result['performance_acceptable']:
                 # Promote canary to production
-                shutil.copy2(canary_file, target_file)
-                os.remove(canary_file)  # Clean up canary
+                os.replace(canary_file, target_file)
                 result['deployment_successful'] = True
                 logger.info(f"Canary deployment promoted to production: {target_file}")
             else:
                 # Remove failed canary
-                if os.path.exists(canary_file):
+                try:
                     os.remove(canary_file)
+                except FileNotFoundError:
+                    pass
                 result['error'] = 'Canary performance was not acceptable'
             
         except Exception as e:
@@ -287,14 +405,14 @@ class DeploymentManager:
         return result
 
     def _blue_green_deployment(self, code: str, target_file: str, 
-                              deployment_record: Dict[str, Any]) -> Dict[str, Any]:
+                              deployment_record: DeploymentRecord) -> Dict[str, Any]:
         """
         Implements blue-green deployment strategy with environment switching.
         
         Args:
             code: Code to deploy
             target_file: Target file path
-            deployment_record: Deployment record dictionary
+            deployment_record: Deployment record
             
         Returns:
             Dictionary with deployment results
@@ -306,8 +424,8 @@ class DeploymentManager:
         }
 
         try:
-            # Create green environment (new version)
-            green_file = f"{target_file}.green"
+            # Create green environment (new version) in the staging area
+            green_file = self._staging_path(target_file, 'green', deployment_record.deployment_id)
             with open(green_file, 'w') as f:
                 f.write(code)
             
@@ -317,14 +435,16 @@ class DeploymentManager:
             
             if green_test_result['success']:
                 # Switch from blue to green (atomic operation)
-                blue_file = f"{target_file}.blue"
+                blue_file = self._staging_path(target_file, 'blue', deployment_record.deployment_id)
                 
                 # Move current production to blue
-                if os.path.exists(target_file):
+                try:
                     shutil.copy2(target_file, blue_file)
+                except FileNotFoundError:
+                    pass
                 
                 # Switch green to production
-                shutil.copy2(green_file, target_file)
+                os.replace(green_file, target_file)
                 
                 # Verify switch
                 switch_verification = self._verify_deployment(target_file, code)
@@ -333,17 +453,24 @@ class DeploymentManager:
                     result['environments']['switch_successful'] = True
                     logger.info(f"Blue-green deployment completed: {target_file}")
                     
-                    # Clean up green file (production is now the target)
-                    os.remove(green_file)
+                    # Clean up blue copy (the deployment backup covers rollback)
+                    try:
+                        os.remove(blue_file)
+                    except FileNotFoundError:
+                        pass
                 else:
                     # Rollback to blue
-                    if os.path.exists(blue_file):
-                        shutil.copy2(blue_file, target_file)
+                    try:
+                        os.replace(blue_file, target_file)
+                    except FileNotFoundError:
+                        pass
                     result['error'] = 'Switch verification failed, rolled back to blue'
             else:
                 result['error'] = 'Green environment testing failed'
-                if os.path.exists(green_file):
+                try:
                     os.remove(green_file)
+                except FileNotFoundError:
+                    pass
             
         except Exception as e:
             logger.error(f"Blue-green deployment failed: {str(e)}")
@@ -351,6 +478,21 @@ class DeploymentManager:
         
         return result
 
+    def _staging_path(self, target_file: str, environment: str, deployment_id: str) -> str:
+        """
+        Builds the staging-area path for an environment copy of the target file.
+        
+        Args:
+            target_file: Target file path
+            environment: Environment name ('canary', 'green', 'blue')
+            deployment_id: Unique deployment identifier
+            
+        Returns:
+            Path inside the staging directory
+        """
+        filename = f"{os.path.basename(target_file)}.{environment}.{deployment_id}"
+        return os.path.join(self.staging_directory, filename)
+
     def _create_backup(self, target_file: str, deployment_id: str) -> Dict[str, Any]:
         """
         Creates a backup of the target file before deployment.
@@ -368,20 +510,20 @@ class DeploymentManager:
         }
 
         try:
-            if os.path.exists(target_file):
-                backup_filename = f"{os.path.basename(target_file)}.{deployment_id}.backup"
-                backup_path = os.path.join(self.backup_directory, backup_filename)
-                
-                shutil.copy2(target_file, backup_path)
-                backup_result['success'] = True
-                backup_result['backup_path'] = backup_path
-                
-                logger.info(f"Backup created: {backup_path}")
-            else:
-                # File doesn't exist, no backup needed (new file deployment)
-                backup_result['success'] = True
-                backup_result['backup_path'] = None
-                logger.info(f"No backup needed for new file: {target_file}")
+            backup_filename = f"{os.path.basename(target_file)}.{deployment_id}.backup"
+            backup_path = os.path.join(self.backup_directory, backup_filename)
+            
+            shutil.copy2(target_file, backup_path)
+            backup_result['success'] = True
+            backup_result['backup_path'] = backup_path
+            
+            logger.info(f"Backup created: {backup_path}")
+        
+        except FileNotFoundError:
+            # File doesn't exist, no backup needed (new file deployment)
+            backup_result['success'] = True
+            backup_result['backup_path'] = None
+            logger.info(f"No backup needed for new file: {target_file}")
         
         except Exception as e:
             logger.error(f"Backup creation failed: {str(e)}")
@@ -438,7 +580,7 @@ class DeploymentManager:
         """
         result = {
             'success': False,
-            'phase': 'staging_deployment'
+            'phase': _PHASE['staging_deployment']
         }
 
         try:
@@ -466,7 +608,7 @@ class DeploymentManager:
         """
         result = {
             'success': False,
-            'phase': 'limited_testing'
+            'phase': _PHASE['limited_testing']
         }
 
         try:
@@ -494,7 +636,7 @@ class DeploymentManager:
         """
         result = {
             'success': False,
-            'phase': 'full_deployment'
+            'phase': _PHASE['full_deployment']
         }
 
         try:
@@ -533,26 +675,27 @@ class DeploymentManager:
             start_time = time.time()
             
             # Basic checks
-            if os.path.exists(canary_file):
-                with open(canary_file, 'r') as f:
-                    code = f.read()
-                
-                # Try to compile/validate the canary
-                compile(code, canary_file, 'exec')
-                
-                # Simulate monitoring period
-                time.sleep(min(duration_seconds, 5))  # Cap at 5 seconds for testing
-                
-                end_time = time.time()
-                
-                monitoring_result['success'] = True
-                monitoring_result['performance_acceptable'] = True  # Simplified check
-                monitoring_result['metrics'] = {
-                    'monitoring_duration': end_time - start_time,
-                    'syntax_valid': True,
-                    'no_errors_detected': True
-                }
+            with open(canary_file, 'r') as f:
+                code = f.read()
+            
+            # Try to compile/validate the canary
+            compile(code, canary_file, 'exec')
+            
+            # Simulate monitoring period
+            time.sleep(min(duration_seconds, 5))  # Cap at 5 seconds for testing
             
+            end_time = time.time()
+            
+            monitoring_result['success'] = True
+            monitoring_result['performance_acceptable'] = True  # Simplified check
+            monitoring_result['metrics'] = {
+                'monitoring_duration': end_time - start_time,
+                'syntax_valid': True,
+                'no_errors_detected': True
+            }
+            
+        except FileNotFoundError:
+            pass
         except Exception as e:
             monitoring_result['error'] = str(e)
         
@@ -600,21 +743,19 @@ class DeploymentManager:
         }
 
         try:
-            if os.path.exists(target_file):
-                verification_result['file_exists'] = True
-                
-                with open(target_file, 'r') as f:
-                    actual_code = f.read()
-                
-                # Check if content matches
-                if actual_code.strip() == expected_code.strip():
-                    verification_result['content_matches'] = True
-                    verification_result['success'] = True
-                else:
-                    verification_result['error'] = 'Deployed content does not match expected code'
+            with open(target_file, 'r') as f:
+                actual_code = f.read()
+            verification_result['file_exists'] = True
+            
+            # Check if content matches
+            if actual_code.strip() == expected_code.strip():
+                verification_result['content_matches'] = True
+                verification_result['success'] = True
             else:
-                verification_result['error'] = 'Target file does not exist after deployment'
+                verification_result['error'] = 'Deployed content does not match expected code'
         
+        except FileNotFoundError:
+            verification_result['error'] = 'Target file does not exist after deployment'
         except Exception as e:
             verification_result['error'] = str(e)
         
@@ -642,7 +783,7 @@ class DeploymentManager:
             # Find the deployment record
             deployment_record = None
             for record in self.deployment_history:
-                if record.get('deployment_id') == deployment_id:
+                if record.deployment_id == deployment_id:
                     deployment_record = record
                     break
             
@@ -650,15 +791,19 @@ class DeploymentManager:
                 rollback_result['error'] = f'Deployment record not found: {deployment_id}'
                 return rollback_result
             
-            backup_path = deployment_record.get('backup_path')
-            target_file = deployment_record.get('target_file')
+            backup_path = deployment_record.backup_path
+            target_file = deployment_record.target_file
             
-            if not backup_path or not os.path.exists(backup_path):
+            if not backup_path:
                 rollback_result['error'] = 'Backup file not found or not available'
                 return rollback_result
             
             # Restore from backup
-            shutil.copy2(backup_path, target_file)
+            try:
+                shutil.copy2(backup_path, target_file)
+            except FileNotFoundError:
+                rollback_result['error'] = 'Backup file not found or not available'
+                return rollback_result
             
             # Verify rollback
             verification_result = self._verify_rollback(target_file, backup_path)
@@ -692,47 +837,70 @@ class DeploymentManager:
         }
 
         try:
-            if os.path.exists(target_file) and os.path.exists(backup_path):
-                with open(target_file, 'r') as f:
-                    target_content = f.read()
-                
-                with open(backup_path, 'r') as f:
-                    backup_content = f.read()
-                
-                if target_content == backup_content:
-                    verification_result['success'] = True
-                else:
-                    verification_result['error'] = 'Content mismatch after rollback'
+            with open(target_file, 'r') as f:
+                target_content = f.read()
+            
+            with open(backup_path, 'r') as f:
+                backup_content = f.read()
+            
+            if target_content == backup_content:
+                verification_result['success'] = True
             else:
-                verification_result['error'] = 'Files missing for rollback verification'
+                verification_result['error'] = 'Content mismatch after rollback'
         
+        except FileNotFoundError:
+            verification_result['error'] = 'Files missing for rollback verification'
         except Exception as e:
             verification_result['error'] = str(e)
         
         return verification_result
 
-    def _store_deployment_record(self, deployment_record: Dict[str, Any]):
+    def _store_deployment_record(self, deployment_record: DeploymentRecord):
         """
         Stores deployment record in history and knowledge repository.
         
         Args:
             deployment_record: The deployment record to store
         """
-        # Add to deployment history
+        # Add to deployment history (bounded to the last 50 records)
         self.deployment_history.append(deployment_record)
         
-        # Keep only last 50 deployment records
-        if len(self.deployment_history) > 50:
-            self.deployment_history = self.deployment_history[-50:]
-        
         # Store in knowledge repository if available
         if self.knowledge_repository:
             self.knowledge_repository.add_self_development_history({
                 'type': 'code_deployment',
-                'deployment_data': deployment_record,
-                'timestamp': deployment_record['timestamp']
+                'deployment_data': deployment_record.to_dict(),
+                'timestamp': deployment_record.timestamp
             })
 
+    def _store_deployment_records(self, deployment_records: List[DeploymentRecord]):
+        """
+        Stores a batch of deployment records with one knowledge repository write.
+        
+        Args:
+            deployment_records: The deployment records to store
+        """
+        if not deployment_records:
+            return
+        
+        self.deployment_history.extend(deployment_records)
+        
+        if self.knowledge_repository:
+            entries = [
+                {
+                    'type': 'code_deployment',
+                    'deployment_data': record.to_dict(),
+                    'timestamp': record.timestamp
+                }
+                for record in deployment_records
+            ]
+            add_batch = getattr(self.knowledge_repository, 'add_self_development_history_batch', None)
+            if add_batch:
+                add_batch(entries)
+            else:
+                for entry in entries:
+                    self.knowledge_repository.add_self_development_history(entry)
+
     def get_deployment_history(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
         Gets the deployment history.
@@ -743,7 +911,9 @@ class DeploymentManager:
         Returns:
             List of deployment records
         """
-        return self.deployment_history[-limit:] if limit else self.deployment_history.copy()
+        start = max(0, len(self.deployment_history) - limit) if limit else 0
+        records = islice(self.deployment_history, start, None)
+        return [record.to_dict() for record in records]
 
     def get_deployment_statistics(self) -> Dict[str, Any]:
         """
@@ -753,19 +923,19 @@ class DeploymentManager:
             Dictionary containing deployment statistics
         """
         total_deployments = len(self.deployment_history)
-        successful_deployments = sum(1 for d in self.deployment_history if d.get('status') == 'completed')
+        successful_deployments = sum(1 for d in self.deployment_history if d.status == _STATUS['completed'])
         
         # Strategy distribution
         strategy_counts = {}
         for deployment in self.deployment_history:
-            strategy = deployment.get('strategy', 'unknown')
+            strategy = deployment.strategy
             strategy_counts[strategy] = strategy_counts.get(strategy, 0) + 1
         
         # Recent activity
         from datetime import timedelta
         recent_deployments = [
             d for d in self.deployment_history
-            if datetime.now() - datetime.fromisoformat(d['timestamp']) < timedelta(days=7)
+            if datetime.now() - datetime.fromisoformat(d.timestamp) < timedelta(days=7)
         ]
         
         return {
@@ -774,7 +944,7 @@ class DeploymentManager:
             'success_rate': successful_deployments / max(total_deployments, 1),
             'recent_deployments_7_days': len(recent_deployments),
             'strategy_distribution': strategy_counts,
-            'available_strategies': list(self.deployment_strategies.keys())
+            'available_strategies': list(self._STRATEGY_NAMES)
         }
 
     def cleanup_old_backups(self, days_old: int = 30):
@@ -803,12 +973,12 @@ class DeploymentManager:
         except Exception as e:
             logger.error(f"Backup cleanup failed: {str(e)}")
 
-    def get_available_strategies(self) -> List[str]:
+    def get_available_strategies(self) -> Tuple[str, ...]:
         """
-        Gets the list of available deployment strategies.
+        Gets the available deployment strategies.
         
         Returns:
-            List of strategy names
+            Tuple of strategy names
         """
-        return list(self.deployment_strategies.keys())
+        return self._STRATEGY_NAMES
 
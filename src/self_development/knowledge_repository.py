@@ -5,186 +5,886 @@ This module serves as JARVIS's long-term memory for self-development,
 storing learned patterns, code snippets, research findings, and performance data.
 """
 
+import atexit
 import json
 import logging
+import os
+import re
+import sqlite3
+import sys
+import threading
+from array import array
+from bisect import bisect_left
+from contextlib import contextmanager
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
+CATEGORIES = (
+    "code_snippets",
+    "design_patterns",
+    "research_findings",
+    "performance_data",
+    "error_logs_fixes",
+    "skill_schemas",
+    "learning_models",
+    "self_development_history"
+)
+
+# Categories that grow with uptime and are capped at max_records
+BOUNDED_CATEGORIES = ("performance_data", "self_development_history")
+
+# Categories searched by get_relevant_patterns, with the type label of their results
+PATTERN_CATEGORIES = (("code_snippets", "code_snippet"), ("design_patterns", "design_pattern"))
+
+EMBEDDING_MODEL_NAME = "sentence-transformers/all-MiniLM-L6-v2"
+SEMANTIC_MIN_SCORE = 0.3
+EMBEDDING_BLOCK_ROWS = 4096  # int8 embedding rows dequantized per matrix product
+
+# Embedding model (lazy initialization; False once known to be unavailable)
+_embedding_model = None
+
+def get_embedding_model():
+    """Get or create the sentence embedding model used for semantic retrieval"""
+    global _embedding_model
+    if _embedding_model is None:
+        try:
+            from sentence_transformers import SentenceTransformer
+            _embedding_model = SentenceTransformer(EMBEDDING_MODEL_NAME)
+            logger.info(f"Embedding model {EMBEDDING_MODEL_NAME} loaded")
+        except ImportError:
+            logger.info("sentence-transformers not installed; using keyword matching for relevant patterns")
+            _embedding_model = False
+        except Exception as e:
+            logger.error(f"Failed to load embedding model: {e}")
+            _embedding_model = False
+    return _embedding_model or None
+
+def _search_key(text: str) -> str:
+    """
+    Returns text in the case-folded form in which records are searched.
+    """
+    return text.lower()
+
+# How long the background writer waits to coalesce a burst of log writes
+FLUSH_INTERVAL_SECONDS = 0.1
+
+# Log records after which the background writer folds the logs into the snapshots
+COMPACT_LOG_RECORDS = 10_000
+
+# Longest close() waits for the background writer to stop
+WRITER_STOP_TIMEOUT_SECONDS = 5.0
+
+# Width of the per-record trigram signature used to prefilter substring queries
+SIGNATURE_BITS = 1024
+
+def _trigram_signature(text: str) -> int:
+    """
+    Returns a Bloom-style bitmask with one bit set per distinct trigram of text.
+    A text can only contain a query if its signature covers the query's signature.
+    """
+    signature = 0
+    for trigram in {text[i:i + 3] for i in range(len(text) - 2)}:
+        signature |= 1 << (hash(trigram) % SIGNATURE_BITS)
+    return signature
+
+def _dumps(obj: Any, indent: bool = False) -> bytes:
+    """
+    Serializes an object to JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        option = orjson.OPT_NON_STR_KEYS | (orjson.OPT_INDENT_2 if indent else 0)
+        return orjson.dumps(obj, option=option)
+    return json.dumps(obj, indent=2 if indent else None).encode("utf-8")
+
+def _intern_keys(record: Dict[str, Any]) -> Dict[str, Any]:
+    """
+    Rebuilds a parsed record with interned keys, so records parsed one at a
+    time share a single string object per key instead of one per record.
+    """
+    return {sys.intern(key) if isinstance(key, str) else key: value for key, value in record.items()}
+
+def _atomic_write(path: str, data: bytes):
+    """
+    Writes data to a temporary file and renames it over path, so readers
+    never observe a partially written file.
+    """
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(data)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+
+def _loads(data: bytes) -> Any:
+    """
+    Parses JSON bytes, using orjson when it is installed.
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+class _CategoryColumns:
+    """
+    Derived per-record data of one category, stored as parallel columns
+    alongside the category's record list.
+    """
+    __slots__ = ("blobs", "signatures", "timestamps", "ordered", "embeddings", "embedding_scales")
+
+    def __init__(self):
+        self.blobs: List[str] = []          # lowercase serialized records
+        self.signatures: List[int] = []     # trigram signatures of the blobs
+        self.timestamps = array("d")        # POSIX timestamps
+        self.ordered = True                 # whether timestamps are non-decreasing
+        self.embeddings = None              # int8-quantized normalized embedding matrix
+        self.embedding_scales = None        # per-row dequantization scales
+
+class _LazyCategories(dict):
+    """
+    Mapping of category name to record list that loads each category on
+    first access.
+    """
+
+    def __init__(self, loader):
+        super().__init__()
+        self._loader = loader
+
+    def __missing__(self, category: str) -> List[Dict[str, Any]]:
+        records = self[category] = self._loader(category)
+        return records
+
 class KnowledgeRepository:
     """
     The KLR stores and manages all relevant information required for code generation,
     analysis, and research, enabling continuous learning and improvement.
     """
 
-    def __init__(self, db_path: str = "knowledge_base.json"):
+    def __init__(self, db_path: str = "knowledge_base.json", max_records: int = 100_000):
         self.db_path = db_path
+        self.max_records = max_records
+        self._log_prefix = os.path.splitext(db_path)[0]
+        self._log_files = {}
+        self._log_records = 0  # Records appended to the logs since the last compaction
+        self._transaction_depth = 0
+        self._columns = {category: _CategoryColumns() for category in CATEGORIES}
+        self._dirty_categories = set()
+        self._legacy_snapshot = False
         self.knowledge_base = self._load_knowledge_base()
+        self._io_lock = threading.Lock()
+        self._dirty = threading.Event()
+        self._stop = threading.Event()
+        self._writer = threading.Thread(
+            target=self._writer_loop, name="knowledge-repository-writer", daemon=True
+        )
+        self._writer.start()
+        atexit.register(self.close)
         logger.info(f"Knowledge & Learning Repository initialized from {db_path}")
 
+    def _log_path(self, category: str) -> str:
+        """
+        Returns the path of the append-only JSON-Lines log for a category.
+        """
+        return f"{self._log_prefix}.{category}.jsonl"
+
+    def _archive_path(self, category: str) -> str:
+        """
+        Returns the path of the cold archive receiving records evicted from a
+        bounded category.
+        """
+        return f"{self._log_prefix}.{category}.archive.jsonl"
+
+    def _snapshot_path(self, category: str) -> str:
+        """
+        Returns the path of the JSON snapshot of a category.
+        """
+        return f"{self._log_prefix}.{category}.json"
+
     def _load_knowledge_base(self) -> Dict[str, Any]:
         """
-        Loads the knowledge base from a JSON file.
+        Prepares the knowledge base for lazy loading: each category is read
+        from its own snapshot file on first access. A single-file snapshot
+        written by earlier versions is loaded whole and split on compaction.
+        """
+        knowledge_base = _LazyCategories(self._load_category)
+        try:
+            with open(self.db_path, "rb") as f:
+                snapshot = _loads(f.read())
+        except FileNotFoundError:
+            return knowledge_base
+
+        self._legacy_snapshot = True
+        for category, records in snapshot.items():
+            knowledge_base[category] = self._replay_log(category, records)
+            self._dirty_categories.add(category)
+        return knowledge_base
+
+    def _load_category(self, category: str) -> List[Dict[str, Any]]:
+        """
+        Loads one category from its snapshot file and replays its log.
+        """
+        try:
+            with open(self._snapshot_path(category), "rb") as f:
+                records = _loads(f.read())
+        except FileNotFoundError:
+            if category not in CATEGORIES:
+                raise KeyError(category)
+            records = []
+        return self._replay_log(category, records)
+
+    def _replay_log(self, category: str, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Appends the records written to a category log since the last compaction.
+        """
+        log_path = self._log_path(category)
+        try:
+            f = open(log_path, "rb")
+        except FileNotFoundError:
+            return records
+        self._dirty_categories.add(category)
+        with f:
+            for line in f:
+                if not line.strip():
+                    continue
+                try:
+                    records.append(_intern_keys(_loads(line)))
+                except ValueError:
+                    # A torn trailing line from an interrupted write
+                    logger.warning(f"Skipping unreadable record in {log_path}")
+                    break
+        return records
+
+    def _save_knowledge_base(self) -> List[str]:
+        """
+        Saves every category changed since the last save to its snapshot file
+        and returns the names of the saved categories.
+        """
+        saved = sorted(self._dirty_categories)
+        for category in saved:
+            _atomic_write(self._snapshot_path(category), _dumps(self.knowledge_base[category]))
+        self._dirty_categories.clear()
+
+        if self._legacy_snapshot:
+            # Every category of the old single-file snapshot now has its own file
+            try:
+                os.remove(self.db_path)
+            except FileNotFoundError:
+                pass
+            self._legacy_snapshot = False
+        return saved
+
+    def export(self, path: str):
+        """
+        Writes the whole knowledge base as indented, human-readable JSON.
+        """
+        categories = dict.fromkeys([*CATEGORIES, *self.knowledge_base])
+        _atomic_write(path, _dumps({category: self.knowledge_base[category] for category in categories}, indent=True))
+
+    def _add_record(self, category: str, record: Dict[str, Any]):
+        """
+        Timestamps a record, adds it to its category and appends it to the
+        category log instead of rewriting the whole knowledge base.
+        """
+        record["timestamp"] = datetime.now().isoformat()
+        line = _dumps(record) + b"\n"
+        # Under the lock so a background compaction never sees the record without its log line
+        with self._io_lock:
+            self.knowledge_base[category].append(record)
+            self._dirty_categories.add(category)
+            self._log_records += 1
+            log_file = self._log_files.get(category)
+            if log_file is None:
+                log_file = self._log_files[category] = open(self._log_path(category), "ab")
+            log_file.write(line)
+        if not self._transaction_depth:
+            self._dirty.set()
+
+        # Evict in chunks of a tenth of the limit so eviction cost is amortized
+        if category in BOUNDED_CATEGORIES:
+            if len(self.knowledge_base[category]) > self.max_records + max(1, self.max_records // 10):
+                self._evict_oldest(category)
+
+    def _evict_oldest(self, category: str):
+        """
+        Moves the oldest records of a bounded category beyond max_records to its
+        cold archive, then compacts so the snapshot no longer holds them.
+        """
+        records = self.knowledge_base[category]
+        overflow = len(records) - self.max_records
+        with open(self._archive_path(category), "ab") as f:
+            f.write(b"".join(_dumps(record) + b"\n" for record in records[:overflow]))
+        del records[:overflow]
+
+        columns = self._columns[category]
+        del columns.blobs[:overflow]
+        del columns.signatures[:overflow]
+        del columns.timestamps[:overflow]
+        if columns.embeddings is not None:
+            columns.embeddings = columns.embeddings[overflow:]
+            columns.embedding_scales = columns.embedding_scales[overflow:]
+
+        logger.info(f"Archived {overflow} old {category} records")
+        self.compact()
+
+    def _writer_loop(self):
+        """
+        Background writer: waits for log writes, lets a burst accumulate for
+        FLUSH_INTERVAL_SECONDS, then flushes all logs at once. Once the logs
+        hold COMPACT_LOG_RECORDS records they are compacted, so they stay
+        bounded and startup does not replay an ever-growing log.
+        """
+        while not self._stop.is_set():
+            self._dirty.wait()
+            self._dirty.clear()
+            # Sleeps until the burst is over, waking at once when close() stops the writer
+            if self._stop.wait(FLUSH_INTERVAL_SECONDS):
+                return
+            if not self._transaction_depth:
+                try:
+                    self.flush()
+                    if self._log_records >= COMPACT_LOG_RECORDS:
+                        self.compact()
+                except Exception as e:
+                    logger.error(f"Failed to flush knowledge base logs: {e}")
+
+    def flush(self):
+        """
+        Flushes buffered log writes to the operating system.
+        """
+        with self._io_lock:
+            for log_file in self._log_files.values():
+                log_file.flush()
+
+    def _category_columns(self, category: str) -> _CategoryColumns:
+        """
+        Returns the columns of a category, filling them in for records added
+        since they were last used.
+        """
+        records = self.knowledge_base[category]
+        columns = self._columns[category]
+        blobs = columns.blobs
+        signatures = columns.signatures
+        timestamps = columns.timestamps
+        for index in range(len(blobs), len(records)):
+            record = records[index]
+            blob = _search_key(_dumps(record).decode("utf-8"))
+            blobs.append(blob)
+            signatures.append(_trigram_signature(blob))
+            try:
+                timestamp = datetime.fromisoformat(record["timestamp"]).timestamp()
+            except (KeyError, TypeError, ValueError):
+                timestamp = timestamps[-1] if timestamps else 0.0
+            if timestamps and timestamp < timestamps[-1]:
+                columns.ordered = False
+            timestamps.append(timestamp)
+        return columns
+
+    def _search_index(self, category: str) -> List[str]:
+        """
+        Returns the lowercase serialized form of every record in a category.
+        """
+        return self._category_columns(category).blobs
+
+    def _embedding_index(self, category: str, model) -> _CategoryColumns:
+        """
+        Returns the columns of a category with its embedding matrix up to date,
+        encoding only records added since the matrix was last used. Embeddings
+        are stored as int8 with one scale per row, a quarter of the float32 size.
+        """
+        import numpy as np
+
+        records = self.knowledge_base[category]
+        columns = self._columns[category]
+        known = 0 if columns.embeddings is None else len(columns.embeddings)
+        if known < len(records):
+            texts = [self._record_text(record) for record in records[known:]]
+            new_embeddings = np.asarray(
+                model.encode(texts, normalize_embeddings=True), dtype=np.float32
+            )
+            max_abs = np.abs(new_embeddings).max(axis=1)
+            max_abs[max_abs == 0] = 1.0
+            scales = (max_abs / 127).astype(np.float32)
+            quantized = np.rint(new_embeddings / scales[:, None]).astype(np.int8)
+            if columns.embeddings is None:
+                columns.embeddings, columns.embedding_scales = quantized, scales
+            else:
+                columns.embeddings = np.vstack([columns.embeddings, quantized])
+                columns.embedding_scales = np.concatenate([columns.embedding_scales, scales])
+        return columns
+
+    @staticmethod
+    def _record_text(record: Dict[str, Any]) -> str:
+        """
+        Returns the text used to embed a record: its string fields, or its
+        serialized form when it has none.
+        """
+        parts = [value for key, value in record.items() if key != "timestamp" and isinstance(value, str)]
+        return " ".join(parts) if parts else _dumps(record).decode("utf-8")
+
+    def _query_records(self, category: str, query: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Returns the records of a category, filtered by a case-insensitive
+        substring query against their serialized form.
+        """
+        records = self.knowledge_base[category]
+        if not query:
+            return records
+        query = _search_key(query)
+        columns = self._category_columns(category)
+        mask = _trigram_signature(query)
+        if not mask:
+            # Queries shorter than a trigram cannot be prefiltered
+            return [record for record, blob in zip(records, columns.blobs) if query in blob]
+        return [
+            record
+            for record, signature, blob in zip(records, columns.signatures, columns.blobs)
+            if signature & mask == mask and query in blob
+        ]
+
+    def get_many(self, category: str, queries: List[str]) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Answers several substring queries against one category in a single
+        pass over its records.
+        """
+        results = {query: [] for query in queries}
+        records = self.knowledge_base[category]
+        # Empty queries match everything, as in the single-query getters
+        pending = []
+        for query in results:
+            if query:
+                lowered = _search_key(query)
+                pending.append((lowered, _trigram_signature(lowered), results[query]))
+            else:
+                results[query] = list(records)
+        if not pending:
+            return results
+
+        columns = self._category_columns(category)
+        for record, signature, blob in zip(records, columns.signatures, columns.blobs):
+            for lowered, mask, matches in pending:
+                if signature & mask == mask and lowered in blob:
+                    matches.append(record)
+        return results
+
+    def get_records_between(self, category: str, start: Optional[datetime] = None,
+                            end: Optional[datetime] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieves the records of a category whose timestamp falls in [start, end).
+        """
+        records = self.knowledge_base[category]
+        columns = self._category_columns(category)
+        timestamps = columns.timestamps
+        low = float("-inf") if start is None else start.timestamp()
+        high = float("inf") if end is None else end.timestamp()
+        if not columns.ordered:
+            return [record for record, ts in zip(records, timestamps) if low <= ts < high]
+        return records[bisect_left(timestamps, low):bisect_left(timestamps, high)]
+
+    def begin_transaction(self):
         """
-        if os.path.exists(self.db_path):
-            with open(self.db_path, "r") as f:
-                return json.load(f)
-        return {
-            "code_snippets": [],
-            "design_patterns": [],
-            "research_findings": [],
-            "performance_data": [],
-            "error_logs_fixes": [],
-            "skill_schemas": [],
-            "learning_models": [],
-            "self_development_history": []
-        }
+        Starts a write transaction; log flushes are deferred until the
+        matching commit() so bulk inserts are not flushed one by one.
+        """
+        self._transaction_depth += 1
+
+    def commit(self):
+        """
+        Ends a write transaction. When the outermost transaction ends, the
+        category logs are flushed and synced to disk.
+        """
+        if self._transaction_depth:
+            self._transaction_depth -= 1
+        if self._transaction_depth:
+            return
+        with self._io_lock:
+            for log_file in self._log_files.values():
+                log_file.flush()
+                os.fsync(log_file.fileno())
 
-    def _save_knowledge_base(self):
+    @contextmanager
+    def transaction(self):
         """
-        Saves the knowledge base to a JSON file.
+        Context manager wrapping begin_transaction()/commit().
         """
-        with open(self.db_path, "w") as f:
-            json.dump(self.knowledge_base, f, indent=2)
+        self.begin_transaction()
+        try:
+            yield self
+        finally:
+            self.commit()
+
+    def compact(self):
+        """
+        Folds the append-only logs of changed categories into their snapshots
+        and removes them.
+        """
+        with self._io_lock:
+            self._log_records = 0
+            for category in self._save_knowledge_base():
+                log_file = self._log_files.pop(category, None)
+                if log_file is not None:
+                    log_file.close()
+                try:
+                    os.remove(self._log_path(category))
+                except FileNotFoundError:
+                    pass
+        logger.info(f"Compacted knowledge base logs for {self.db_path}")
+
+    def close(self):
+        """
+        Stops the background writer and compacts the logs into the snapshot.
+        Registered to run at interpreter exit.
+        """
+        if self._stop.is_set():
+            return
+        self._transaction_depth = 0
+        self._stop.set()
+        self._dirty.set()
+        self._writer.join(WRITER_STOP_TIMEOUT_SECONDS)
+        atexit.unregister(self.close)
+        self.compact()
 
     def add_code_snippet(self, snippet: Dict[str, Any]):
         """
         Adds a reusable code snippet to the repository.
         """
-        snippet["timestamp"] = datetime.now().isoformat()
-        self.knowledge_base["code_snippets"].append(snippet)
-        self._save_knowledge_base()
+        self._add_record("code_snippets", snippet)
         logger.debug(f"Added code snippet: {snippet.get("name", "Unnamed")}")
 
     def get_code_snippets(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Retrieves code snippets, optionally filtered by a query.
         """
-        if query:
-            return [s for s in self.knowledge_base["code_snippets"] if query.lower() in json.dumps(s).lower()]
-        return self.knowledge_base["code_snippets"]
+        return self._query_records("code_snippets", query)
 
     def add_design_pattern(self, pattern: Dict[str, Any]):
         """
         Adds a design pattern to the repository.
         """
-        pattern["timestamp"] = datetime.now().isoformat()
-        self.knowledge_base["design_patterns"].append(pattern)
-        self._save_knowledge_base()
+        self._add_record("design_patterns", pattern)
         logger.debug(f"Added design pattern: {pattern.get("name", "Unnamed")}")
 
     def get_design_patterns(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Retrieves design patterns, optionally filtered by a query.
         """
-        if query:
-            return [p for p in self.knowledge_base["design_patterns"] if query.lower() in json.dumps(p).lower()]
-        return self.knowledge_base["design_patterns"]
+        return self._query_records("design_patterns", query)
 
     def add_research_finding(self, finding: Dict[str, Any]):
         """
         Adds a research finding to the repository.
         """
-        finding["timestamp"] = datetime.now().isoformat()
-        self.knowledge_base["research_findings"].append(finding)
-        self._save_knowledge_base()
+        self._add_record("research_findings", finding)
         logger.debug(f"Added research finding: {finding.get("title", "Untitled")}")
 
     def get_research_findings(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Retrieves research findings, optionally filtered by a query.
         """
-        if query:
-            return [f for f in self.knowledge_base["research_findings"] if query.lower() in json.dumps(f).lower()]
-        return self.knowledge_base["research_findings"]
+        return self._query_records("research_findings", query)
 
     def add_performance_data(self, data: Dict[str, Any]):
         """
         Adds performance data to the repository.
         """
-        data["timestamp"] = datetime.now().isoformat()
-        self.knowledge_base["performance_data"].append(data)
-        self._save_knowledge_base()
+        self._add_record("performance_data", data)
         logger.debug(f"Added performance data for: {data.get("component", "Unnamed")}")
 
+    def add_performance_data_batch(self, records: List[Dict[str, Any]]):
+        """
+        Adds several performance records in one transaction, so they are
+        written out together instead of one by one.
+        """
+        with self.transaction():
+            for record in records:
+                self._add_record("performance_data", record)
+        logger.debug(f"Added {len(records)} performance data records")
+
     def get_performance_data(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Retrieves performance data, optionally filtered by a query.
         """
-        if query:
-            return [d for d in self.knowledge_base["performance_data"] if query.lower() in json.dumps(d).lower()]
-        return self.knowledge_base["performance_data"]
+        return self._query_records("performance_data", query)
 
     def add_error_log_fix(self, log_fix: Dict[str, Any]):
         """
         Adds an error log and its corresponding fix to the repository.
         """
-        log_fix["timestamp"] = datetime.now().isoformat()
-        self.knowledge_base["error_logs_fixes"].append(log_fix)
-        self._save_knowledge_base()
+        self._add_record("error_logs_fixes", log_fix)
         logger.debug(f"Added error log/fix for: {log_fix.get("error_type", "Unnamed")}")
 
     def get_error_log_fixes(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Retrieves error logs and fixes, optionally filtered by a query.
         """
-        if query:
-            return [lf for lf in self.knowledge_base["error_logs_fixes"] if query.lower() in json.dumps(lf).lower()]
-        return self.knowledge_base["error_logs_fixes"]
+        return self._query_records("error_logs_fixes", query)
 
     def add_skill_schema(self, schema: Dict[str, Any]):
         """
         Adds a skill schema to the repository.
         """
-        schema["timestamp"] = datetime.now().isoformat()
-        self.knowledge_base["skill_schemas"].append(schema)
-        self._save_knowledge_base()
+        self._add_record("skill_schemas", schema)
         logger.debug(f"Added skill schema: {schema.get("name", "Unnamed")}")
 
     def get_skill_schemas(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Retrieves skill schemas, optionally filtered by a query.
         """
-        if query:
-            return [s for s in self.knowledge_base["skill_schemas"] if query.lower() in json.dumps(s).lower()]
-        return self.knowledge_base["skill_schemas"]
+        return self._query_records("skill_schemas", query)
 
     def add_self_development_history(self, record: Dict[str, Any]):
         """
         Adds a record of self-development activity (e.g., code generation, modification).
         """
-        record["timestamp"] = datetime.now().isoformat()
-        self.knowledge_base["self_development_history"].append(record)
-        self._save_knowledge_base()
+        self._add_record("self_development_history", record)
         logger.debug(f"Added self-development history record: {record.get("type", "Unnamed")}")
 
+    def add_self_development_history_batch(self, records: List[Dict[str, Any]]):
+        """
+        Adds several self-development records in one transaction, so they are
+        written out together instead of one by one.
+        """
+        with self.transaction():
+            for record in records:
+                self._add_record("self_development_history", record)
+        logger.debug(f"Added {len(records)} self-development history records")
+
     def get_self_development_history(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
         """
         Retrieves self-development history records, optionally filtered by a query.
         """
-        if query:
-            return [r for r in self.knowledge_base["self_development_history"] if query.lower() in json.dumps(r).lower()]
-        return self.knowledge_base["self_development_history"]
+        return self._query_records("self_development_history", query)
 
     def get_relevant_patterns(self, objective: str, limit: int = 5) -> List[Dict[str, Any]]:
         """
         Retrieves patterns (code snippets, design patterns) relevant to a given objective.
-        This is a simplified implementation; a real system would use vector embeddings for semantic search.
-        """
+        Uses embedding similarity when sentence-transformers is installed and
+        falls back to keyword matching otherwise.
+        """
+        if limit <= 0:
+            return []
+        model = get_embedding_model()
+        if model is not None:
+            try:
+                return self._semantic_relevant_patterns(model, objective, limit)
+            except Exception as e:
+                logger.error(f"Semantic pattern retrieval failed, using keyword matching: {e}")
+
         relevant = []
-        # Simple keyword matching for now
-        keywords = objective.lower().split()
+        # Keyword matching: one compiled alternation scans each record once
+        keywords = _search_key(objective).split()
+        if not keywords:
+            return relevant
+        matcher = re.compile("|".join(re.escape(k) for k in sorted(set(keywords), key=len, reverse=True)))
 
-        for snippet in self.knowledge_base["code_snippets"]:
-            if any(k in json.dumps(snippet).lower() for k in keywords):
-                relevant.append({"type": "code_snippet", "data": snippet})
-        for pattern in self.knowledge_base["design_patterns"]:
-            if any(k in json.dumps(pattern).lower() for k in keywords):
-                relevant.append({"type": "design_pattern", "data": pattern})
+        for category, record_type in PATTERN_CATEGORIES:
+            for record, blob in zip(self.knowledge_base[category], self._search_index(category)):
+                if matcher.search(blob):
+                    relevant.append({"type": record_type, "data": record})
+                    if len(relevant) >= limit:
+                        return relevant
 
-        return relevant[:limit]
+        return relevant
 
-import os
+    def _semantic_relevant_patterns(self, model, objective: str, limit: int) -> List[Dict[str, Any]]:
+        """
+        Ranks code snippets and design patterns by cosine similarity between
+        their embeddings and the objective's embedding.
+        """
+        import numpy as np
+
+        query = np.asarray(model.encode([objective], normalize_embeddings=True)[0], dtype=np.float32)
+        candidates = []
+        for category, record_type in PATTERN_CATEGORIES:
+            columns = self._embedding_index(category, model)
+            embeddings = columns.embeddings
+            if embeddings is None or not len(embeddings):
+                continue
+            # Dequantize in blocks so the float32 copy stays cache-sized
+            scores = np.empty(len(embeddings), dtype=np.float32)
+            for start in range(0, len(embeddings), EMBEDDING_BLOCK_ROWS):
+                block = embeddings[start:start + EMBEDDING_BLOCK_ROWS]
+                scores[start:start + len(block)] = block.astype(np.float32) @ query
+            scores *= columns.embedding_scales
+            top = min(limit, len(scores))
+            for index in np.argpartition(-scores, top - 1)[:top]:
+                score = float(scores[index])
+                if score >= SEMANTIC_MIN_SCORE:
+                    candidates.append((score, record_type, self.knowledge_base[category][index]))
 
+        candidates.sort(key=lambda candidate: candidate[0], reverse=True)
+        return [
+            {"type": record_type, "data": record, "score": score}
+            for score, record_type, record in candidates[:limit]
+        ]
 
+class SQLiteKnowledgeRepository(KnowledgeRepository):
+    """
+    Knowledge repository stored in SQLite: one table per category with an
+    FTS5 trigram index, so inserts are single-row writes and substring
+    queries are answered from the index instead of scanning every record.
+    """
+
+    def __init__(self, db_path: str = "knowledge_base.db", max_records: int = 100_000):
+        self.db_path = db_path
+        self.max_records = max_records
+        self._log_prefix = os.path.splitext(db_path)[0]
+        self._transaction_depth = 0
+        self._columns = {category: _CategoryColumns() for category in CATEGORIES}
+        self._lock = threading.RLock()
+        self._connection = sqlite3.connect(db_path, check_same_thread=False)
+        self._create_tables()
+        # Rows of each bounded category, counted once here and kept up to date on insert and eviction
+        with self._lock:
+            self._row_counts = {
+                category: self._connection.execute(f"SELECT COUNT(*) FROM {category}").fetchone()[0]
+                for category in BOUNDED_CATEGORIES
+            }
+        self.knowledge_base = _LazyCategories(self._load_category)
+        logger.info(f"Knowledge & Learning Repository initialized from SQLite database {db_path}")
+
+    def _create_tables(self):
+        """
+        Creates each category table, its FTS5 index and the triggers keeping
+        the index in sync.
+        """
+        with self._lock:
+            for category in CATEGORIES:
+                self._connection.executescript(f"""
+                    CREATE TABLE IF NOT EXISTS {category} (
+                        id INTEGER PRIMARY KEY, timestamp TEXT, data TEXT NOT NULL
+                    );
+                    CREATE VIRTUAL TABLE IF NOT EXISTS {category}_fts USING fts5(
+                        data, content='{category}', content_rowid='id', tokenize='trigram'
+                    );
+                    CREATE TRIGGER IF NOT EXISTS {category}_ai AFTER INSERT ON {category} BEGIN
+                        INSERT INTO {category}_fts(rowid, data) VALUES (new.id, new.data);
+                    END;
+                    CREATE TRIGGER IF NOT EXISTS {category}_ad AFTER DELETE ON {category} BEGIN
+                        INSERT INTO {category}_fts({category}_fts, rowid, data) VALUES ('delete', old.id, old.data);
+                    END;
+                """)
+            self._connection.commit()
+
+    def _load_category(self, category: str) -> List[Dict[str, Any]]:
+        """
+        Loads all records of a category from its table.
+        """
+        if category not in CATEGORIES:
+            raise KeyError(category)
+        with self._lock:
+            rows = self._connection.execute(f"SELECT data FROM {category} ORDER BY id").fetchall()
+        return [_intern_keys(_loads(data)) for data, in rows]
+
+    def _add_record(self, category: str, record: Dict[str, Any]):
+        """
+        Timestamps a record and inserts it as a single row.
+        """
+        record["timestamp"] = datetime.now().isoformat()
+        with self._lock:
+            self._connection.execute(
+                f"INSERT INTO {category} (timestamp, data) VALUES (?, ?)",
+                (record["timestamp"], _dumps(record).decode("utf-8"))
+            )
+            if not self._transaction_depth:
+                self._connection.commit()
+            count = self._row_counts.get(category)
+            if count is not None:
+                count = self._row_counts[category] = count + 1
+        if dict.__contains__(self.knowledge_base, category):
+            self.knowledge_base[category].append(record)
+
+        if count is not None and count > self.max_records + max(1, self.max_records // 10):
+            self._evict_oldest(category)
+
+    def _evict_oldest(self, category: str):
+        """
+        Moves the oldest rows of a bounded category beyond max_records to its
+        cold archive.
+        """
+        with self._lock:
+            overflow = self._row_counts[category] - self.max_records
+            if overflow <= 0:  # Already evicted by a concurrent insert
+                return
+            rows = self._connection.execute(
+                f"SELECT id, data FROM {category} ORDER BY id LIMIT ?", (overflow,)
+            ).fetchall()
+            with open(self._archive_path(category), "ab") as f:
+                f.write(b"".join(data.encode("utf-8") + b"\n" for _, data in rows))
+            self._connection.execute(f"DELETE FROM {category} WHERE id <= ?", (rows[-1][0],))
+            self._connection.commit()
+            self._row_counts[category] -= overflow
+
+        if dict.__contains__(self.knowledge_base, category):
+            del self.knowledge_base[category][:overflow]
+            columns = self._columns[category]
+            del columns.blobs[:overflow]
+            del columns.signatures[:overflow]
+            del columns.timestamps[:overflow]
+            if columns.embeddings is not None:
+                columns.embeddings = columns.embeddings[overflow:]
+                columns.embedding_scales = columns.embedding_scales[overflow:]
+        logger.info(f"Archived {overflow} old {category} records")
+
+    def _query_records(self, category: str, query: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Returns the records of a category, filtered by a case-insensitive
+        substring query answered by the FTS5 trigram index.
+        """
+        if not query:
+            return self.knowledge_base[category]
+        with self._lock:
+            if len(query) >= 3:
+                rows = self._connection.execute(
+                    f"SELECT data FROM {category} WHERE id IN "
+                    f"(SELECT rowid FROM {category}_fts WHERE {category}_fts MATCH ?) ORDER BY id",
+                    ('"' + query.replace('"', '""') + '"',)
+                ).fetchall()
+            else:
+                # Trigram indexes cannot answer queries shorter than three characters
+                pattern = "%" + query.lower().replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+                rows = self._connection.execute(
+                    f"SELECT data FROM {category} WHERE lower(data) LIKE ? ESCAPE '\\' ORDER BY id",
+                    (pattern,)
+                ).fetchall()
+        return [_loads(data) for data, in rows]
+
+    def commit(self):
+        """
+        Ends a write transaction, committing the database when the outermost
+        transaction ends.
+        """
+        if self._transaction_depth:
+            self._transaction_depth -= 1
+        if not self._transaction_depth:
+            with self._lock:
+                self._connection.commit()
+
+    def flush(self):
+        """
+        Commits pending writes.
+        """
+        with self._lock:
+            self._connection.commit()
+
+    def compact(self):
+        """
+        Merges the FTS5 index segments of every category.
+        """
+        with self._lock:
+            for category in CATEGORIES:
+                self._connection.execute(f"INSERT INTO {category}_fts({category}_fts) VALUES ('optimize')")
+            self._connection.commit()
+
+    def close(self):
+        """
+        Commits pending writes and closes the database.
+        """
+        self._transaction_depth = 0
+        with self._lock:
+            self._connection.commit()
+            self._connection.close()
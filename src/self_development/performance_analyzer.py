@@ -8,15 +8,217 @@ and intelligent analysis.
 
 import logging
 import json
+import operator
+import os
+import queue
 import time
 import psutil
+import sys
 import threading
+from bisect import bisect_right
 from typing import Dict, List, Any, Optional
-from datetime import datetime, timedelta
-from collections import defaultdict
+from datetime import datetime
+from collections import defaultdict, deque
+from dataclasses import dataclass
 
 logger = logging.getLogger(__name__)
 
+SINK_BATCH_SIZE = 128  # Most performance records written to the repository at once
+HISTORY_LIMIT = 1000  # Metric records kept in memory
+# Ring buffer slots: a power of two above HISTORY_LIMIT, so readers of the
+# last HISTORY_LIMIT records stay clear of the slots being overwritten
+_RING_CAPACITY = 1024
+_RING_MASK = _RING_CAPACITY - 1
+# Longest reuse of a trend analysis or summary while no new sample has arrived
+ANALYSIS_CACHE_SECONDS = 1.0
+
+# Health score weights per component; HEALTH_WEIGHT_VALUES follows the same order
+HEALTH_WEIGHTS = {'cpu': 0.3, 'memory': 0.3, 'disk': 0.2, 'trends': 0.2}
+HEALTH_WEIGHT_VALUES = tuple(HEALTH_WEIGHTS.values())
+
+# /proc files read directly on Linux instead of through one psutil call each
+PROC_COUNTER_FILES = ('/proc/stat', '/proc/meminfo', '/proc/diskstats', '/proc/net/dev')
+DISK_SECTOR_SIZE = 512
+
+def _pread_all(fd: int) -> bytes:
+    """Reads a whole /proc file from the start through an already open descriptor."""
+    chunks = []
+    offset = 0
+    while True:
+        chunk = os.pread(fd, 65536, offset)
+        if not chunk:
+            return b"".join(chunks)
+        chunks.append(chunk)
+        offset += len(chunk)
+
+# Trend series kept as parallel columns: (trend name, SystemSample attribute)
+TREND_SERIES = (
+    ('cpu_usage', 'cpu_percent'),
+    ('memory_usage', 'memory_percent'),
+    ('process_cpu', 'process_cpu_percent'),
+    ('process_memory', 'process_memory_percent'),
+)
+
+@dataclass(slots=True)
+class SystemSample:
+    """
+    Flat view of the metrics the analyzer inspects for every recorded sample.
+    """
+    timestamp_ns: int
+    has_system: bool = False
+    has_process: bool = False
+    cpu_percent: float = 0
+    memory_percent: float = 0
+    disk_percent: float = 0
+    process_cpu_percent: float = 0
+    process_memory_percent: float = 0
+    timestamp: Optional[str] = None  # ISO form of timestamp_ns, as found in the metrics
+
+    @classmethod
+    def from_metrics(cls, metrics: Dict[str, Any], timestamp_ns: Optional[int] = None) -> 'SystemSample':
+        """
+        Builds a sample from a metrics dictionary, as returned by collect_system_metrics.
+        
+        Args:
+            metrics: The metrics dictionary
+            timestamp_ns: The metrics timestamp in epoch nanoseconds, when already known
+            
+        Returns:
+            The flattened sample
+        """
+        timestamp = metrics.get('timestamp')
+        if timestamp_ns is None:
+            timestamp_ns = int(datetime.fromisoformat(timestamp).timestamp() * 1e9) if timestamp else time.time_ns()
+        sample = cls(timestamp_ns, timestamp=timestamp)
+        system = metrics.get('system')
+        if system is not None:
+            sample.has_system = True
+            sample.cpu_percent = system.get('cpu_percent', 0)
+            sample.memory_percent = system.get('memory_percent', 0)
+            sample.disk_percent = system.get('disk_percent', 0)
+        process = metrics.get('process')
+        if process is not None:
+            sample.has_process = True
+            sample.process_cpu_percent = process.get('cpu_percent', 0)
+            sample.process_memory_percent = process.get('memory_percent', 0)
+        return sample
+
+# Threshold alerts: (SystemSample attribute, threshold key, alert type, severity, label)
+ALERT_RULES = (
+    ('cpu_percent', 'cpu_usage', 'high_cpu_usage', 'warning', 'CPU'),
+    ('memory_percent', 'memory_usage', 'high_memory_usage', 'warning', 'memory'),
+    ('disk_percent', 'disk_usage', 'high_disk_usage', 'critical', 'disk'),
+)
+
+# Reads the trend series values of a sample as a tuple, in TREND_SERIES order
+_trend_values = operator.attrgetter(*(attribute for _, attribute in TREND_SERIES))
+
+# Improvement opportunities suggested by identify_improvement_opportunities.
+# Shared by every result, so they are never modified.
+CPU_OPTIMIZATION_OPPORTUNITY = {
+    'area': 'CPU optimization',
+    'description': 'Implement more efficient algorithms and reduce computational complexity',
+    'specific_suggestions': (
+        'Cache frequently computed results',
+        'Use more efficient data structures',
+        'Implement lazy evaluation where possible',
+        'Optimize loops and recursive functions'
+    ),
+    'estimated_impact': 'high'
+}
+
+MEMORY_OPTIMIZATION_OPPORTUNITY = {
+    'area': 'Memory optimization',
+    'description': 'Reduce memory footprint and improve memory management',
+    'specific_suggestions': (
+        'Implement object pooling for frequently created objects',
+        'Use generators instead of lists where appropriate',
+        'Implement proper cleanup in finally blocks',
+        'Consider using memory-mapped files for large datasets'
+    ),
+    'estimated_impact': 'high'
+}
+
+MONITORING_OPPORTUNITY = {
+    'area': 'Monitoring and alerting',
+    'description': 'Enhance system monitoring capabilities',
+    'specific_suggestions': (
+        'Implement real-time performance dashboards',
+        'Add more granular performance metrics',
+        'Implement predictive alerting based on trends',
+        'Add performance regression testing'
+    ),
+    'estimated_impact': 'medium'
+}
+
+SCALABILITY_OPPORTUNITY = {
+    'area': 'Scalability',
+    'description': 'Improve system architecture for better scalability',
+    'specific_suggestions': (
+        'Implement microservices architecture',
+        'Add horizontal scaling capabilities',
+        'Implement load balancing',
+        'Consider containerization for better resource isolation'
+    ),
+    'estimated_impact': 'high'
+}
+
+class _MetricsRing:
+    """
+    Preallocated ring buffer of recorded metrics with parallel timestamp and
+    trend columns. The writer fills slot ``head & _RING_MASK`` and then
+    advances ``head``, so a reader that takes ``head`` first only sees
+    complete slots and needs no lock.
+    """
+    __slots__ = ("records", "timestamps_ns", "series", "head")
+
+    def __init__(self):
+        self.records: List[Optional[Dict[str, Any]]] = [None] * _RING_CAPACITY
+        self.timestamps_ns: List[int] = [0] * _RING_CAPACITY  # Epoch nanoseconds
+        self.series = {name: [0.0] * _RING_CAPACITY for name, _ in TREND_SERIES}
+        self.head = 0  # Number of records ever appended
+
+    def append(self, record: Dict[str, Any], timestamp_ns: int, values: tuple):
+        slot = self.head & _RING_MASK
+        self.records[slot] = record
+        self.timestamps_ns[slot] = timestamp_ns
+        for column, value in zip(self.series.values(), values):
+            column[slot] = value
+        self.head += 1
+
+    def size(self, head: int) -> int:
+        """Returns the number of readable records as of ``head``."""
+        return min(head, HISTORY_LIMIT)
+
+    def count_after(self, cutoff_ns: int, head: int) -> int:
+        """
+        Returns how many readable records as of ``head`` are newer than
+        ``cutoff_ns``, by binary search over the time-ordered timestamps.
+        """
+        count = self.size(head)
+        if not count:
+            return 0
+        timestamps = self.timestamps_ns
+        start = (head - count) & _RING_MASK
+        end = head & _RING_MASK
+        if start < end:
+            return end - bisect_right(timestamps, cutoff_ns, start, end)
+        # The records wrap around the end of the buffer: [start, capacity) then [0, end)
+        if end and timestamps[0] <= cutoff_ns:
+            return end - bisect_right(timestamps, cutoff_ns, 0, end)
+        return _RING_CAPACITY - bisect_right(timestamps, cutoff_ns, start, _RING_CAPACITY) + end
+
+    @staticmethod
+    def tail(column: list, count: int, head: int) -> list:
+        """Returns the last ``count`` entries of a column as of ``head``, oldest first."""
+        if count <= 0:
+            return []
+        start = (head - count) & _RING_MASK
+        end = head & _RING_MASK
+        if start < end:
+            return column[start:end]
+        return column[start:] + column[:end]
+
 class PerformanceAnalyzer:
     """
     The Performance Analyzer continuously monitors JARVIS's operational metrics,
@@ -25,10 +227,23 @@ class PerformanceAnalyzer:
 
     def __init__(self, knowledge_repository=None):
         self.knowledge_repository = knowledge_repository
-        self.metrics_history = []
+        # Last HISTORY_LIMIT metric records with their timestamp and trend columns
+        self._ring = _MetricsRing()
+        self._record_lock = threading.Lock()  # Serializes writers; readers never lock
+        # Cached results keyed on the ring and its head: hours_back -> (ring, head, time, trends)
+        self._trend_cache = {}
+        self._summary_cache = None  # (ring, head, monitoring_active, time, summary)
+        # Trend values of the last 10 measurements and their running sums
+        self._baseline_window = deque(maxlen=10)
+        self._baseline_sums = [0.0] * len(TREND_SERIES)
+        self._latest_sample: Optional[SystemSample] = None
         self.performance_baselines = {}
         self.monitoring_active = False
         self.monitoring_thread = None
+        self._stop_event = threading.Event()  # Wakes the monitoring loop for shutdown
+        # Performance records waiting for the knowledge repository writer thread
+        self._sink_queue = queue.SimpleQueue()
+        self._sink_thread = None
         self.alert_thresholds = {
             'cpu_usage': 80.0,  # Percentage
             'memory_usage': 85.0,  # Percentage
@@ -36,7 +251,25 @@ class PerformanceAnalyzer:
             'error_rate': 5.0,  # Percentage
             'disk_usage': 90.0  # Percentage
         }
+        self._rebuild_alert_rules()
         self.improvement_suggestions = []
+        # Reused across samples so process.cpu_percent() measures the interval since the last call
+        self.process = psutil.Process()
+        # Static for the lifetime of the process
+        self._cpu_count = psutil.cpu_count()
+        # On Linux, system counters are parsed from /proc through descriptors kept open
+        self._proc_fds = self._open_proc_counter_files()
+        self._storage_devices = self._list_storage_devices() if self._proc_fds else frozenset()
+        self._last_cpu_times = None
+        # ISO timestamp of the last collected metrics and its epoch nanoseconds,
+        # so recording those metrics does not parse the string back
+        self._collected_timestamp = (None, 0)
+        # Prime the non-blocking CPU counters so the first sample is meaningful
+        if self._proc_fds:
+            self._read_proc_counters()
+        else:
+            psutil.cpu_percent(interval=None)
+        self.process.cpu_percent(interval=None)
         logger.info("Performance Analyzer initialized")
 
     def start_monitoring(self, interval_seconds: int = 30):
@@ -48,6 +281,7 @@ class PerformanceAnalyzer:
         """
         if not self.monitoring_active:
             self.monitoring_active = True
+            self._stop_event.clear()
             self.monitoring_thread = threading.Thread(
                 target=self._monitoring_loop,
                 args=(interval_seconds,),
@@ -62,21 +296,81 @@ class PerformanceAnalyzer:
         """Stops the performance monitoring thread."""
         if self.monitoring_active:
             self.monitoring_active = False
+            self._stop_event.set()
             if self.monitoring_thread:
                 self.monitoring_thread.join(timeout=5)
+            self.flush_performance_data()
             logger.info("Performance monitoring stopped")
 
+    def _store_performance_data(self, data: Dict[str, Any]):
+        """
+        Queues a performance record for the knowledge repository without
+        waiting for the write.
+        
+        Args:
+            data: The performance record to store
+        """
+        if self._sink_thread is None:
+            self._sink_thread = threading.Thread(target=self._sink_loop, daemon=True)
+            self._sink_thread.start()
+        self._sink_queue.put_nowait(data)
+
+    def _sink_loop(self):
+        """Writes queued performance records to the knowledge repository in batches."""
+        while True:
+            batch = [self._sink_queue.get()]
+            try:
+                while len(batch) < SINK_BATCH_SIZE:
+                    batch.append(self._sink_queue.get_nowait())
+            except queue.Empty:
+                pass
+            
+            records = [item for item in batch if not isinstance(item, threading.Event)]
+            try:
+                if records:
+                    self._write_performance_batch(records)
+            except Exception as e:
+                logger.error(f"Error storing performance data: {str(e)}")
+            for item in batch:
+                if isinstance(item, threading.Event):
+                    item.set()
+
+    def _write_performance_batch(self, records: List[Dict[str, Any]]):
+        """Writes performance records, in one transaction when the repository supports it."""
+        transaction = getattr(self.knowledge_repository, 'transaction', None)
+        if transaction is None:
+            for record in records:
+                self.knowledge_repository.add_performance_data(record)
+            return
+        with transaction():
+            for record in records:
+                self.knowledge_repository.add_performance_data(record)
+
+    def flush_performance_data(self, timeout: float = 5.0):
+        """
+        Waits until queued performance records have been written to the knowledge repository.
+        
+        Args:
+            timeout: Maximum number of seconds to wait
+        """
+        if self._sink_thread is None:
+            return
+        written = threading.Event()
+        self._sink_queue.put_nowait(written)
+        if not written.wait(timeout):
+            logger.warning("Timed out waiting for performance data to be stored")
+
     def _monitoring_loop(self, interval_seconds: int):
         """Main monitoring loop that runs in a background thread."""
-        while self.monitoring_active:
+        while not self._stop_event.is_set():
             try:
                 metrics = self.collect_system_metrics()
-                self.record_metrics(metrics)
-                self._check_for_alerts(metrics)
-                time.sleep(interval_seconds)
+                sample = self.record_metrics(metrics)
+                self._check_for_alerts(sample)
             except Exception as e:
                 logger.error(f"Error in monitoring loop: {str(e)}")
-                time.sleep(interval_seconds)
+            if self._stop_event.wait(interval_seconds):
+                break
 
     def collect_system_metrics(self) -> Dict[str, Any]:
         """
@@ -85,55 +379,42 @@ class PerformanceAnalyzer:
         Returns:
             Dictionary containing current system metrics
         """
+        timestamp_ns = time.time_ns()
+        timestamp = datetime.fromtimestamp(timestamp_ns / 1e9).isoformat()
+        self._collected_timestamp = (timestamp, timestamp_ns)
         try:
-            # CPU metrics
-            cpu_percent = psutil.cpu_percent(interval=1)
-            cpu_count = psutil.cpu_count()
+            # System-wide CPU, memory, disk and network counters
+            if self._proc_fds:
+                system = self._read_proc_counters()
+            else:
+                system = self._read_psutil_counters()
             cpu_freq = psutil.cpu_freq()
             
-            # Memory metrics
-            memory = psutil.virtual_memory()
-            swap = psutil.swap_memory()
-            
-            # Disk metrics
-            disk = psutil.disk_usage('/')
-            disk_io = psutil.disk_io_counters()
-            
-            # Network metrics
-            network_io = psutil.net_io_counters()
-            
-            # Process-specific metrics (for JARVIS process)
-            process = psutil.Process()
-            process_memory = process.memory_info()
-            process_cpu = process.cpu_percent()
+            # Process-specific metrics (for JARVIS process), read in one batch
+            process = self.process
+            with process.oneshot():
+                process_memory = process.memory_info()
+                process_cpu = process.cpu_percent(interval=None)
+                process_threads = process.num_threads()
+                process_fds = process.num_fds() if hasattr(process, 'num_fds') else None
+            # Same as process.memory_percent(), without reading system memory again
+            process_memory_percent = process_memory.rss / system['memory_total'] * 100.0
             
             metrics = {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'system': {
-                    'cpu_percent': cpu_percent,
-                    'cpu_count': cpu_count,
+                    'cpu_percent': system['cpu_percent'],
+                    'cpu_count': self._cpu_count,
                     'cpu_frequency': cpu_freq.current if cpu_freq else None,
-                    'memory_total': memory.total,
-                    'memory_available': memory.available,
-                    'memory_percent': memory.percent,
-                    'swap_total': swap.total,
-                    'swap_used': swap.used,
-                    'swap_percent': swap.percent,
-                    'disk_total': disk.total,
-                    'disk_used': disk.used,
-                    'disk_percent': (disk.used / disk.total) * 100,
-                    'disk_read_bytes': disk_io.read_bytes if disk_io else 0,
-                    'disk_write_bytes': disk_io.write_bytes if disk_io else 0,
-                    'network_bytes_sent': network_io.bytes_sent if network_io else 0,
-                    'network_bytes_recv': network_io.bytes_recv if network_io else 0
+                    **system
                 },
                 'process': {
                     'cpu_percent': process_cpu,
                     'memory_rss': process_memory.rss,
                     'memory_vms': process_memory.vms,
-                    'memory_percent': process.memory_percent(),
-                    'num_threads': process.num_threads(),
-                    'num_fds': process.num_fds() if hasattr(process, 'num_fds') else None
+                    'memory_percent': process_memory_percent,
+                    'num_threads': process_threads,
+                    'num_fds': process_fds
                 }
             }
             
@@ -142,100 +423,234 @@ class PerformanceAnalyzer:
         except Exception as e:
             logger.error(f"Error collecting system metrics: {str(e)}")
             return {
-                'timestamp': datetime.now().isoformat(),
+                'timestamp': timestamp,
                 'error': str(e)
             }
 
-    def record_metrics(self, metrics: Dict[str, Any]):
+    @staticmethod
+    def _open_proc_counter_files() -> Optional[Dict[str, int]]:
+        """
+        Opens the /proc counter files once for repeated reads.
+        
+        Returns:
+            Mapping of path to file descriptor, or None when not on Linux
+        """
+        if not sys.platform.startswith('linux'):
+            return None
+        fds = {}
+        try:
+            for path in PROC_COUNTER_FILES:
+                fds[path] = os.open(path, os.O_RDONLY | os.O_CLOEXEC)
+        except OSError as e:
+            logger.warning(f"Falling back to psutil for system metrics: {str(e)}")
+            for fd in fds.values():
+                os.close(fd)
+            return None
+        return fds
+
+    @staticmethod
+    def _list_storage_devices() -> frozenset:
+        """Returns the names of whole-disk block devices, whose I/O counters exclude partitions."""
+        try:
+            return frozenset(name.replace('!', '/') for name in os.listdir('/sys/block'))
+        except OSError:
+            return frozenset()
+
+    def _read_proc_counters(self) -> Dict[str, Any]:
+        """
+        Reads system-wide counters straight from /proc, matching the psutil fields they replace.
+        
+        Returns:
+            Dictionary of system metrics, without the CPU count and frequency
+        """
+        fds = self._proc_fds
+        
+        # Aggregate CPU times: the first line of /proc/stat
+        cpu_line = os.pread(fds['/proc/stat'], 4096, 0).split(b'\n', 1)[0]
+        times = [int(field) for field in cpu_line.split()[1:]]
+        # user and nice already include guest and guest_nice
+        total = sum(times) - sum(times[8:10])
+        idle = sum(times[3:5])  # idle + iowait
+        cpu_percent = 0.0
+        if self._last_cpu_times is not None:
+            total_delta = total - self._last_cpu_times[0]
+            busy_delta = total_delta - (idle - self._last_cpu_times[1])
+            if total_delta > 0:
+                cpu_percent = round(min(max(busy_delta / total_delta * 100, 0.0), 100.0), 1)
+        self._last_cpu_times = (total, idle)
+        
+        # Memory and swap, in kB
+        meminfo = {}
+        for line in _pread_all(fds['/proc/meminfo']).splitlines():
+            if line.startswith((b'MemTotal:', b'MemAvailable:', b'SwapTotal:', b'SwapFree:')):
+                key, value = line.split()[:2]
+                meminfo[key] = int(value) * 1024
+        memory_total = meminfo[b'MemTotal:']
+        memory_available = meminfo.get(b'MemAvailable:', 0)
+        swap_total = meminfo.get(b'SwapTotal:', 0)
+        swap_used = swap_total - meminfo.get(b'SwapFree:', 0)
+        
+        # Root filesystem usage in a single statvfs call
+        disk = os.statvfs('/')
+        disk_total = disk.f_blocks * disk.f_frsize
+        disk_used = (disk.f_blocks - disk.f_bfree) * disk.f_frsize
+        
+        # Disk I/O summed over whole disks
+        read_sectors = write_sectors = 0
+        for line in _pread_all(fds['/proc/diskstats']).splitlines():
+            fields = line.split()
+            if len(fields) >= 10 and fields[2].decode() in self._storage_devices:
+                read_sectors += int(fields[5])
+                write_sectors += int(fields[9])
+        
+        # Network I/O summed over all interfaces, after the two header lines
+        bytes_recv = bytes_sent = 0
+        for line in _pread_all(fds['/proc/net/dev']).splitlines()[2:]:
+            fields = line.split(b':', 1)[1].split()
+            bytes_recv += int(fields[0])
+            bytes_sent += int(fields[8])
+        
+        return {
+            'cpu_percent': cpu_percent,
+            'memory_total': memory_total,
+            'memory_available': memory_available,
+            'memory_percent': round((memory_total - memory_available) / memory_total * 100, 1),
+            'swap_total': swap_total,
+            'swap_used': swap_used,
+            'swap_percent': round(swap_used / swap_total * 100, 1) if swap_total else 0.0,
+            'disk_total': disk_total,
+            'disk_used': disk_used,
+            'disk_percent': (disk_used / disk_total) * 100,
+            'disk_read_bytes': read_sectors * DISK_SECTOR_SIZE,
+            'disk_write_bytes': write_sectors * DISK_SECTOR_SIZE,
+            'network_bytes_sent': bytes_sent,
+            'network_bytes_recv': bytes_recv
+        }
+
+    def _read_psutil_counters(self) -> Dict[str, Any]:
+        """
+        Reads system-wide counters through psutil, on platforms without /proc.
+        
+        Returns:
+            Dictionary of system metrics, without the CPU count and frequency
+        """
+        # CPU usage since the previous sample, without blocking
+        cpu_percent = psutil.cpu_percent(interval=None)
+        
+        # Memory metrics
+        memory = psutil.virtual_memory()
+        swap = psutil.swap_memory()
+        
+        # Disk metrics
+        disk = psutil.disk_usage('/')
+        disk_io = psutil.disk_io_counters()
+        
+        # Network metrics
+        network_io = psutil.net_io_counters()
+        
+        return {
+            'cpu_percent': cpu_percent,
+            'memory_total': memory.total,
+            'memory_available': memory.available,
+            'memory_percent': memory.percent,
+            'swap_total': swap.total,
+            'swap_used': swap.used,
+            'swap_percent': swap.percent,
+            'disk_total': disk.total,
+            'disk_used': disk.used,
+            'disk_percent': (disk.used / disk.total) * 100,
+            'disk_read_bytes': disk_io.read_bytes if disk_io else 0,
+            'disk_write_bytes': disk_io.write_bytes if disk_io else 0,
+            'network_bytes_sent': network_io.bytes_sent if network_io else 0,
+            'network_bytes_recv': network_io.bytes_recv if network_io else 0
+        }
+
+    def record_metrics(self, metrics: Dict[str, Any]) -> SystemSample:
         """
         Records metrics in the history and updates baselines.
         
         Args:
             metrics: The metrics dictionary to record
+            
+        Returns:
+            The flattened sample that was recorded
         """
-        self.metrics_history.append(metrics)
-        
-        # Keep only last 1000 metric records to prevent memory bloat
-        if len(self.metrics_history) > 1000:
-            self.metrics_history = self.metrics_history[-1000:]
-        
-        # Update performance baselines
-        self._update_baselines(metrics)
+        collected_timestamp, collected_ns = self._collected_timestamp
+        if metrics.get('timestamp') == collected_timestamp:
+            sample = SystemSample.from_metrics(metrics, collected_ns)
+        else:
+            sample = SystemSample.from_metrics(metrics)
+        values = _trend_values(sample)
+        with self._record_lock:
+            self._ring.append(metrics, sample.timestamp_ns, values)
+            self._latest_sample = sample
+            
+            # Update performance baselines
+            self._update_baselines(sample, values)
         
         # Store in knowledge repository if available
         if self.knowledge_repository:
-            self.knowledge_repository.add_performance_data({
+            self._store_performance_data({
                 'type': 'system_metrics',
                 'metrics': metrics,
                 'timestamp': metrics.get('timestamp')
             })
+        
+        return sample
 
-    def _update_baselines(self, metrics: Dict[str, Any]):
+    def _update_baselines(self, sample: SystemSample, values: tuple):
         """Updates performance baselines based on historical data."""
-        if 'system' in metrics and 'process' in metrics:
-            # Calculate rolling averages for key metrics
-            recent_metrics = self.metrics_history[-10:]  # Last 10 measurements
-            
-            if len(recent_metrics) >= 5:  # Need at least 5 data points
+        # Slide the window of the last 10 measurements, keeping its sums current
+        window = self._baseline_window
+        sums = self._baseline_sums
+        if len(window) == window.maxlen:
+            for i, value in enumerate(window[0]):
+                sums[i] -= value
+        window.append(values)
+        for i, value in enumerate(values):
+            sums[i] += value
+        
+        if sample.has_system and sample.has_process:
+            # Rolling averages for key metrics
+            if len(window) >= 5:  # Need at least 5 data points
+                count = len(window)
                 self.performance_baselines = {
-                    'avg_cpu_percent': sum(m.get('system', {}).get('cpu_percent', 0) for m in recent_metrics) / len(recent_metrics),
-                    'avg_memory_percent': sum(m.get('system', {}).get('memory_percent', 0) for m in recent_metrics) / len(recent_metrics),
-                    'avg_process_cpu': sum(m.get('process', {}).get('cpu_percent', 0) for m in recent_metrics) / len(recent_metrics),
-                    'avg_process_memory': sum(m.get('process', {}).get('memory_percent', 0) for m in recent_metrics) / len(recent_metrics),
-                    'last_updated': datetime.now().isoformat()
+                    'avg_cpu_percent': sums[0] / count,
+                    'avg_memory_percent': sums[1] / count,
+                    'avg_process_cpu': sums[2] / count,
+                    'avg_process_memory': sums[3] / count,
+                    'last_updated': sample.timestamp or datetime.now().isoformat()
                 }
 
-    def _check_for_alerts(self, metrics: Dict[str, Any]):
+    def _check_for_alerts(self, sample: SystemSample):
         """
         Checks current metrics against alert thresholds and generates alerts.
         
         Args:
-            metrics: Current metrics to check
+            sample: Current metrics to check
         """
         alerts = []
         
-        if 'system' in metrics:
-            system = metrics['system']
-            
-            # CPU usage alert
-            if system.get('cpu_percent', 0) > self.alert_thresholds['cpu_usage']:
-                alerts.append({
-                    'type': 'high_cpu_usage',
-                    'severity': 'warning',
-                    'message': f"High CPU usage: {system['cpu_percent']:.1f}%",
-                    'value': system['cpu_percent'],
-                    'threshold': self.alert_thresholds['cpu_usage']
-                })
-            
-            # Memory usage alert
-            if system.get('memory_percent', 0) > self.alert_thresholds['memory_usage']:
-                alerts.append({
-                    'type': 'high_memory_usage',
-                    'severity': 'warning',
-                    'message': f"High memory usage: {system['memory_percent']:.1f}%",
-                    'value': system['memory_percent'],
-                    'threshold': self.alert_thresholds['memory_usage']
-                })
-            
-            # Disk usage alert
-            disk_percent = system.get('disk_percent', 0)
-            if disk_percent > self.alert_thresholds['disk_usage']:
-                alerts.append({
-                    'type': 'high_disk_usage',
-                    'severity': 'critical',
-                    'message': f"High disk usage: {disk_percent:.1f}%",
-                    'value': disk_percent,
-                    'threshold': self.alert_thresholds['disk_usage']
-                })
+        if sample.has_system:
+            for attribute, alert_type, severity, label, threshold in self._alert_rules:
+                value = getattr(sample, attribute)
+                if value > threshold:
+                    alerts.append({
+                        'type': alert_type,
+                        'severity': severity,
+                        'message': f"High {label} usage: {value:.1f}%",
+                        'value': value,
+                        'threshold': threshold
+                    })
         
         # Log alerts and store them
         for alert in alerts:
             logger.warning(f"Performance Alert: {alert['message']}")
             if self.knowledge_repository:
-                self.knowledge_repository.add_performance_data({
+                self._store_performance_data({
                     'type': 'performance_alert',
                     'alert': alert,
-                    'timestamp': datetime.now().isoformat()
+                    'timestamp': sample.timestamp or datetime.now().isoformat()
                 })
 
     def analyze_performance_trends(self, hours_back: int = 24) -> Dict[str, Any]:
@@ -248,75 +663,98 @@ class PerformanceAnalyzer:
         Returns:
             Dictionary containing trend analysis results
         """
-        cutoff_time = datetime.now() - timedelta(hours=hours_back)
+        ring = self._ring
+        head = ring.head
+        now = time.monotonic()
+        # Reuse the analysis until a new sample arrives or it ages out
+        cached = self._trend_cache.get(hours_back)
+        if cached is not None and cached[0] is ring and cached[1] == head and now - cached[2] < ANALYSIS_CACHE_SECONDS:
+            return cached[3]
+        trends = self._analyze_performance_trends(hours_back, ring, head)
+        self._trend_cache[hours_back] = (ring, head, now, trends)
+        return trends
+
+    def _analyze_performance_trends(self, hours_back: int, ring: _MetricsRing, head: int) -> Dict[str, Any]:
+        """
+        Analyzes performance trends over the records of a ring as of ``head``.
+        
+        Args:
+            hours_back: How many hours of history to analyze
+            ring: The ring buffer to read
+            head: The ring head to read up to
+            
+        Returns:
+            Dictionary containing trend analysis results
+        """
+        cutoff_ns = time.time_ns() - hours_back * 3600 * 10**9
         
-        # Filter metrics within the time window
-        relevant_metrics = [
-            m for m in self.metrics_history
-            if datetime.fromisoformat(m['timestamp']) > cutoff_time
-        ]
+        # Metrics are recorded in time order, so the window is a suffix of the history
+        window_size = ring.count_after(cutoff_ns, head)
         
-        if len(relevant_metrics) < 2:
+        if window_size < 2:
             return {
                 'error': 'Insufficient data for trend analysis',
-                'data_points': len(relevant_metrics),
+                'data_points': window_size,
                 'required_minimum': 2
             }
         
         # Calculate trends
         trends = {
             'analysis_period_hours': hours_back,
-            'data_points_analyzed': len(relevant_metrics),
+            'data_points_analyzed': window_size,
             'trends': {},
             'recommendations': [],
             'timestamp': datetime.now().isoformat()
         }
         
-        # CPU trend analysis
-        cpu_values = [m.get('system', {}).get('cpu_percent', 0) for m in relevant_metrics]
-        trends['trends']['cpu_usage'] = {
-            'average': sum(cpu_values) / len(cpu_values),
-            'min': min(cpu_values),
-            'max': max(cpu_values),
-            'trend_direction': self._calculate_trend_direction(cpu_values),
-            'volatility': self._calculate_volatility(cpu_values)
-        }
+        series = {name: ring.tail(column, window_size, head) for name, column in ring.series.items()}
         
-        # Memory trend analysis
-        memory_values = [m.get('system', {}).get('memory_percent', 0) for m in relevant_metrics]
-        trends['trends']['memory_usage'] = {
-            'average': sum(memory_values) / len(memory_values),
-            'min': min(memory_values),
-            'max': max(memory_values),
-            'trend_direction': self._calculate_trend_direction(memory_values),
-            'volatility': self._calculate_volatility(memory_values)
-        }
+        # System-wide trends, with range and volatility
+        trends['trends']['cpu_usage'] = self._summarize_series(series['cpu_usage'], detailed=True)
+        trends['trends']['memory_usage'] = self._summarize_series(series['memory_usage'], detailed=True)
         
         # Process-specific trends
-        process_cpu_values = [m.get('process', {}).get('cpu_percent', 0) for m in relevant_metrics]
-        process_memory_values = [m.get('process', {}).get('memory_percent', 0) for m in relevant_metrics]
-        
-        trends['trends']['process_cpu'] = {
-            'average': sum(process_cpu_values) / len(process_cpu_values),
-            'trend_direction': self._calculate_trend_direction(process_cpu_values)
-        }
-        
-        trends['trends']['process_memory'] = {
-            'average': sum(process_memory_values) / len(process_memory_values),
-            'trend_direction': self._calculate_trend_direction(process_memory_values)
-        }
+        trends['trends']['process_cpu'] = self._summarize_series(series['process_cpu'])
+        trends['trends']['process_memory'] = self._summarize_series(series['process_memory'])
         
         # Generate recommendations based on trends
         trends['recommendations'] = self._generate_performance_recommendations(trends['trends'])
         
         return trends
 
-    def _calculate_trend_direction(self, values: List[float]) -> str:
+    def _summarize_series(self, values: List[float], detailed: bool = False) -> Dict[str, Any]:
+        """
+        Summarizes one trend series, computing its sum once for every statistic.
+        
+        Args:
+            values: List of numeric values
+            detailed: Whether to include min, max and volatility
+            
+        Returns:
+            Dictionary with the average and trend direction of the series
+        """
+        y_sum = sum(values)
+        average = y_sum / len(values)
+        if not detailed:
+            return {
+                'average': average,
+                'trend_direction': self._calculate_trend_direction(values, y_sum)
+            }
+        return {
+            'average': average,
+            'min': min(values),
+            'max': max(values),
+            'trend_direction': self._calculate_trend_direction(values, y_sum),
+            'volatility': self._calculate_volatility(values, average)
+        }
+
+    def _calculate_trend_direction(self, values: List[float], y_sum: Optional[float] = None) -> str:
         """
         Calculates the overall trend direction of a series of values.
         
         Args:
             values: List of numeric values
+            y_sum: Sum of the values, when already computed
             
         Returns:
             String indicating trend direction: 'increasing', 'decreasing', or 'stable'
@@ -324,12 +762,13 @@ class PerformanceAnalyzer:
         if len(values) < 2:
             return 'insufficient_data'
         
-        # Simple linear trend calculation
+        # Simple linear trend calculation; the x sums over 0..n-1 have closed forms
         n = len(values)
-        x_sum = sum(range(n))
-        y_sum = sum(values)
-        xy_sum = sum(i * values[i] for i in range(n))
-        x_squared_sum = sum(i * i for i in range(n))
+        x_sum = n * (n - 1) // 2
+        if y_sum is None:
+            y_sum = sum(values)
+        xy_sum = sum(map(operator.mul, range(n), values))
+        x_squared_sum = (n - 1) * n * (2 * n - 1) // 6
         
         # Calculate slope
         slope = (n * xy_sum - x_sum * y_sum) / (n * x_squared_sum - x_sum * x_sum)
@@ -341,12 +780,13 @@ class PerformanceAnalyzer:
         else:
             return 'stable'
 
-    def _calculate_volatility(self, values: List[float]) -> float:
+    def _calculate_volatility(self, values: List[float], mean: Optional[float] = None) -> float:
         """
         Calculates the volatility (standard deviation) of a series of values.
         
         Args:
             values: List of numeric values
+            mean: Mean of the values, when already computed
             
         Returns:
             Float representing the volatility
@@ -354,9 +794,12 @@ class PerformanceAnalyzer:
         if len(values) < 2:
             return 0.0
         
-        mean = sum(values) / len(values)
-        variance = sum((x - mean) ** 2 for x in values) / len(values)
-        return variance ** 0.5
+        # Population variance as E[x^2] - E[x]^2, both sums computed in C
+        n = len(values)
+        if mean is None:
+            mean = sum(values) / n
+        variance = sum(map(operator.mul, values, values)) / n - mean * mean
+        return max(variance, 0.0) ** 0.5
 
     def _generate_performance_recommendations(self, trends: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
@@ -462,65 +905,27 @@ class PerformanceAnalyzer:
         }
         
         # Analyze recent performance data
-        if len(self.metrics_history) > 10:
+        if self._ring.size(self._ring.head) > 10:
             recent_trends = self.analyze_performance_trends(hours_back=6)
             
+            recommendation_types = {rec['type'] for rec in recent_trends.get('recommendations', [])}
+            
             # Code-level improvements
-            if any(rec['type'] == 'cpu_optimization' for rec in recent_trends.get('recommendations', [])):
-                opportunities['code_improvements'].append({
-                    'area': 'CPU optimization',
-                    'description': 'Implement more efficient algorithms and reduce computational complexity',
-                    'specific_suggestions': [
-                        'Cache frequently computed results',
-                        'Use more efficient data structures',
-                        'Implement lazy evaluation where possible',
-                        'Optimize loops and recursive functions'
-                    ],
-                    'estimated_impact': 'high'
-                })
+            if 'cpu_optimization' in recommendation_types:
+                opportunities['code_improvements'].append(CPU_OPTIMIZATION_OPPORTUNITY)
             
-            if any(rec['type'] == 'memory_optimization' for rec in recent_trends.get('recommendations', [])):
-                opportunities['code_improvements'].append({
-                    'area': 'Memory optimization',
-                    'description': 'Reduce memory footprint and improve memory management',
-                    'specific_suggestions': [
-                        'Implement object pooling for frequently created objects',
-                        'Use generators instead of lists where appropriate',
-                        'Implement proper cleanup in finally blocks',
-                        'Consider using memory-mapped files for large datasets'
-                    ],
-                    'estimated_impact': 'high'
-                })
+            if 'memory_optimization' in recommendation_types:
+                opportunities['code_improvements'].append(MEMORY_OPTIMIZATION_OPPORTUNITY)
             
             # System-level improvements
-            opportunities['system_improvements'].append({
-                'area': 'Monitoring and alerting',
-                'description': 'Enhance system monitoring capabilities',
-                'specific_suggestions': [
-                    'Implement real-time performance dashboards',
-                    'Add more granular performance metrics',
-                    'Implement predictive alerting based on trends',
-                    'Add performance regression testing'
-                ],
-                'estimated_impact': 'medium'
-            })
+            opportunities['system_improvements'].append(MONITORING_OPPORTUNITY)
             
             # Architecture improvements
-            opportunities['architecture_improvements'].append({
-                'area': 'Scalability',
-                'description': 'Improve system architecture for better scalability',
-                'specific_suggestions': [
-                    'Implement microservices architecture',
-                    'Add horizontal scaling capabilities',
-                    'Implement load balancing',
-                    'Consider containerization for better resource isolation'
-                ],
-                'estimated_impact': 'high'
-            })
+            opportunities['architecture_improvements'].append(SCALABILITY_OPPORTUNITY)
         
         # Store opportunities in knowledge repository
         if self.knowledge_repository:
-            self.knowledge_repository.add_performance_data({
+            self._store_performance_data({
                 'type': 'improvement_opportunities',
                 'opportunities': opportunities,
                 'timestamp': opportunities['timestamp']
@@ -535,74 +940,75 @@ class PerformanceAnalyzer:
         Returns:
             Dictionary containing current performance status and recommendations
         """
-        if not self.metrics_history:
+        ring = self._ring
+        head = ring.head
+        data_points = ring.size(head)
+        if not data_points:
             return {
                 'status': 'no_data',
                 'message': 'No performance data available. Start monitoring to collect metrics.'
             }
         
-        latest_metrics = self.metrics_history[-1]
+        # Reuse the summary until a new sample arrives or it ages out
+        now = time.monotonic()
+        cached = self._summary_cache
+        if (cached is not None and cached[0] is ring and cached[1] == head
+                and cached[2] == self.monitoring_active and now - cached[3] < ANALYSIS_CACHE_SECONDS):
+            return cached[4]
+        
+        latest_sample = self._latest_sample
         trends = self.analyze_performance_trends(hours_back=24)
         opportunities = self.identify_improvement_opportunities()
         
         summary = {
             'timestamp': datetime.now().isoformat(),
             'monitoring_status': 'active' if self.monitoring_active else 'inactive',
-            'data_points_collected': len(self.metrics_history),
+            'data_points_collected': data_points,
             'current_metrics': {
-                'cpu_percent': latest_metrics.get('system', {}).get('cpu_percent', 0),
-                'memory_percent': latest_metrics.get('system', {}).get('memory_percent', 0),
-                'disk_percent': latest_metrics.get('system', {}).get('disk_percent', 0),
-                'process_cpu_percent': latest_metrics.get('process', {}).get('cpu_percent', 0),
-                'process_memory_percent': latest_metrics.get('process', {}).get('memory_percent', 0)
+                'cpu_percent': latest_sample.cpu_percent,
+                'memory_percent': latest_sample.memory_percent,
+                'disk_percent': latest_sample.disk_percent,
+                'process_cpu_percent': latest_sample.process_cpu_percent,
+                'process_memory_percent': latest_sample.process_memory_percent
             },
             'performance_baselines': self.performance_baselines,
             'trend_analysis': trends,
             'improvement_opportunities': opportunities,
-            'health_score': self._calculate_health_score(latest_metrics, trends)
+            'health_score': self._calculate_health_score(latest_sample, trends)
         }
         
+        self._summary_cache = (ring, head, self.monitoring_active, now, summary)
         return summary
 
-    def _calculate_health_score(self, latest_metrics: Dict[str, Any], trends: Dict[str, Any]) -> Dict[str, Any]:
+    def _calculate_health_score(self, latest_sample: SystemSample, trends: Dict[str, Any]) -> Dict[str, Any]:
         """
         Calculates an overall system health score based on current metrics and trends.
         
         Args:
-            latest_metrics: Most recent performance metrics
+            latest_sample: Most recent performance metrics
             trends: Trend analysis results
             
         Returns:
             Dictionary containing health score and breakdown
         """
-        score_components = {}
-        
-        # CPU health (0-100, higher is better)
-        cpu_percent = latest_metrics.get('system', {}).get('cpu_percent', 0)
-        cpu_score = max(0, 100 - cpu_percent)
-        score_components['cpu'] = cpu_score
-        
-        # Memory health (0-100, higher is better)
-        memory_percent = latest_metrics.get('system', {}).get('memory_percent', 0)
-        memory_score = max(0, 100 - memory_percent)
-        score_components['memory'] = memory_score
-        
-        # Disk health (0-100, higher is better)
-        disk_percent = latest_metrics.get('system', {}).get('disk_percent', 0)
-        disk_score = max(0, 100 - disk_percent)
-        score_components['disk'] = disk_score
+        # CPU, memory and disk health (0-100, higher is better)
+        cpu_score = max(0, 100 - latest_sample.cpu_percent)
+        memory_score = max(0, 100 - latest_sample.memory_percent)
+        disk_score = max(0, 100 - latest_sample.disk_percent)
         
         # Trend health (penalize increasing trends for resource usage)
         trend_score = 100
-        if trends.get('trends', {}).get('cpu_usage', {}).get('trend_direction') == 'increasing':
+        trend_results = trends.get('trends', {})
+        if trend_results.get('cpu_usage', {}).get('trend_direction') == 'increasing':
             trend_score -= 20
-        if trends.get('trends', {}).get('memory_usage', {}).get('trend_direction') == 'increasing':
+        if trend_results.get('memory_usage', {}).get('trend_direction') == 'increasing':
             trend_score -= 20
-        score_components['trends'] = max(0, trend_score)
+        trend_score = max(0, trend_score)
         
         # Calculate overall score (weighted average)
-        weights = {'cpu': 0.3, 'memory': 0.3, 'disk': 0.2, 'trends': 0.2}
-        overall_score = sum(score_components[component] * weights[component] for component in weights)
+        cpu_weight, memory_weight, disk_weight, trends_weight = HEALTH_WEIGHT_VALUES
+        overall_score = (cpu_score * cpu_weight + memory_score * memory_weight
+                         + disk_score * disk_weight + trend_score * trends_weight)
         
         # Determine health status
         if overall_score >= 80:
@@ -619,10 +1025,20 @@ class PerformanceAnalyzer:
         return {
             'overall_score': round(overall_score, 1),
             'status': status,
-            'component_scores': score_components,
-            'weights': weights
+            'component_scores': {
+                'cpu': cpu_score,
+                'memory': memory_score,
+                'disk': disk_score,
+                'trends': trend_score
+            },
+            'weights': dict(HEALTH_WEIGHTS)
         }
 
+    @property
+    def metrics_history(self) -> List[Dict[str, Any]]:
+        """The recorded metrics, oldest first (a snapshot)."""
+        return self.get_metrics_history(limit=0)
+
     def get_metrics_history(self, limit: int = 100) -> List[Dict[str, Any]]:
         """
         Gets the performance metrics history.
@@ -633,11 +1049,18 @@ class PerformanceAnalyzer:
         Returns:
             List of performance metrics records
         """
-        return self.metrics_history[-limit:] if limit else self.metrics_history.copy()
+        ring = self._ring
+        head = ring.head
+        size = ring.size(head)
+        return ring.tail(ring.records, min(limit, size) if limit else size, head)
 
     def clear_metrics_history(self):
         """Clears the performance metrics history."""
-        self.metrics_history.clear()
+        with self._record_lock:
+            self._ring = _MetricsRing()
+            self._baseline_window.clear()
+            self._baseline_sums = [0.0] * len(TREND_SERIES)
+            self._latest_sample = None
         logger.info("Performance metrics history cleared")
 
     def set_alert_threshold(self, metric: str, threshold: float):
@@ -651,10 +1074,18 @@ class PerformanceAnalyzer:
         if metric in self.alert_thresholds:
             old_threshold = self.alert_thresholds[metric]
             self.alert_thresholds[metric] = threshold
+            self._rebuild_alert_rules()
             logger.info(f"Updated alert threshold for {metric}: {old_threshold} -> {threshold}")
         else:
             logger.warning(f"Unknown metric for alert threshold: {metric}")
 
+    def _rebuild_alert_rules(self):
+        """Resolves ALERT_RULES against the current thresholds for _check_for_alerts."""
+        self._alert_rules = tuple(
+            (attribute, alert_type, severity, label, self.alert_thresholds[threshold_key])
+            for attribute, threshold_key, alert_type, severity, label in ALERT_RULES
+        )
+
     def get_alert_thresholds(self) -> Dict[str, float]:
         """Gets the current alert thresholds."""
         return self.alert_thresholds.copy()
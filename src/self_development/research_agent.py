@@ -5,15 +5,141 @@ This module provides autonomous research capabilities, allowing JARVIS to
 proactively search for and process new information relevant to its self-development goals.
 """
 
+import asyncio
+import importlib.util
 import logging
-import json
+import os
+import random
 import re
-from typing import Dict, List, Any, Optional
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import Counter, deque
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+from itertools import islice
+from typing import AsyncIterator, Dict, List, Any, Optional, Tuple
 from datetime import datetime, timedelta
-from openai import OpenAI
+import httpx
+from openai import OpenAI, AsyncOpenAI, RateLimitError
+
+from .knowledge_repository import _dumps, _loads, get_embedding_model
+from .response_cache import SemanticResponseCache
 
 logger = logging.getLogger(__name__)
 
+# Research topics per priority area; copied per call since callers set their priority
+AREA_TOPICS = {
+    'ai_development': (
+        {'topic': 'latest AI model architectures for code generation', 'depth': 'medium', 'max_sources': 5},
+        {'topic': 'AI self-improvement techniques and frameworks', 'depth': 'deep', 'max_sources': 8}
+    ),
+    'code_optimization': (
+        {'topic': 'Python performance optimization techniques 2024', 'depth': 'medium', 'max_sources': 6},
+        {'topic': 'memory management best practices for long-running applications', 'depth': 'medium', 'max_sources': 5}
+    ),
+    'security_vulnerabilities': (
+        {'topic': 'recent Python security vulnerabilities and patches', 'depth': 'deep', 'max_sources': 10},
+        {'topic': 'AI system security best practices', 'depth': 'medium', 'max_sources': 6}
+    ),
+    'new_algorithms': (
+        {'topic': 'efficient algorithms for natural language processing', 'depth': 'medium', 'max_sources': 5},
+        {'topic': 'optimization algorithms for resource management', 'depth': 'shallow', 'max_sources': 4}
+    ),
+    'programming_best_practices': (
+        {'topic': 'clean code principles for AI systems', 'depth': 'shallow', 'max_sources': 4},
+        {'topic': 'testing strategies for machine learning applications', 'depth': 'medium', 'max_sources': 5}
+    ),
+    'emerging_technologies': (
+        {'topic': 'emerging trends in AI and automation 2024', 'depth': 'shallow', 'max_sources': 4},
+        {'topic': 'new programming languages and frameworks for AI', 'depth': 'shallow', 'max_sources': 3}
+    )
+}
+
+# Connection pool of the asynchronous OpenAI client; HTTP/2 multiplexing needs the h2 package
+HTTP_MAX_CONNECTIONS = 64
+HTTP_MAX_KEEPALIVE_CONNECTIONS = 32
+HTTP_TIMEOUT_SECONDS = 60.0
+HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+SOURCE_SNIPPET_CHARS = 400  # Snippet characters of each source quoted in analysis prompts
+
+RESEARCH_HISTORY_LIMIT = 50
+DEFAULT_RESEARCH_HISTORY_PATH = "research_history.jsonl"  # Relative to the working directory, like the knowledge base
+HISTORY_COMPACT_FACTOR = 4  # The history file is rewritten once it holds this many times the limit
+SOURCE_DUPLICATE_THRESHOLD = 0.9  # Cosine similarity above which sources are near-duplicates
+GPU_DEDUP_MIN_SOURCES = 8  # Below this, kernel launches outweigh computing similarities on the GPU
+RECENT_ACTIVITY_SECONDS = 7 * 24 * 3600
+
+# Chat model used for each kind of request: query generation needs no reasoning
+DEFAULT_MODELS = {
+    'queries': "gpt-4o-mini",
+    'analysis': "gpt-4o",
+    'summary': "gpt-4o"
+}
+
+# Completion tokens budgeted per topic in a batched source analysis
+BATCH_ANALYSIS_TOKENS_PER_TOPIC = 1000
+BATCH_ANALYSIS_MAX_TOKENS = 4096
+
+# Streamed source analyses whose confidence score arrives below this are cut short
+LOW_CONFIDENCE_CUTOFF = 0.2
+_CONFIDENCE_PATTERN = re.compile(r'"confidence_score"\s*:\s*(-?\d+(?:\.\d+)?)\s*[,}]')
+
+class _RateLimiter:
+    """
+    Token bucket over requests and tokens per minute, shared by the concurrent
+    OpenAI calls of an asynchronous research session.
+    """
+
+    def __init__(self, requests_per_minute: int, tokens_per_minute: int):
+        self.requests_per_minute = requests_per_minute
+        self.tokens_per_minute = tokens_per_minute
+        self._available_requests = float(requests_per_minute)
+        self._available_tokens = float(tokens_per_minute)
+        self._last_refill = time.monotonic()
+
+    def _refill(self):
+        now = time.monotonic()
+        elapsed_minutes = (now - self._last_refill) / 60
+        self._last_refill = now
+        self._available_requests = min(
+            self.requests_per_minute, self._available_requests + elapsed_minutes * self.requests_per_minute
+        )
+        self._available_tokens = min(
+            self.tokens_per_minute, self._available_tokens + elapsed_minutes * self.tokens_per_minute
+        )
+
+    async def acquire(self, tokens: int):
+        """
+        Waits until one request and the given number of tokens fit in the budget.
+        
+        Args:
+            tokens: Estimated tokens consumed by the request
+        """
+        tokens = min(tokens, self.tokens_per_minute)
+        while True:
+            self._refill()
+            if self._available_requests >= 1 and self._available_tokens >= tokens:
+                self._available_requests -= 1
+                self._available_tokens -= tokens
+                return
+            # Sleep until the scarcer budget has refilled enough
+            wait_minutes = max(
+                (1 - self._available_requests) / self.requests_per_minute,
+                (tokens - self._available_tokens) / self.tokens_per_minute
+            )
+            await asyncio.sleep(max(wait_minutes * 60, 0.01))
+
+    def refund(self, tokens: int):
+        """
+        Returns unused tokens to the budget, e.g. after a request was cut short.
+        
+        Args:
+            tokens: Tokens acquired but not consumed
+        """
+        self._available_tokens = min(self.tokens_per_minute, self._available_tokens + max(tokens, 0))
+
 class ResearchAgent:
     """
     The Research Agent autonomously searches for and processes new information
@@ -21,11 +147,29 @@ class ResearchAgent:
     security vulnerabilities, and emerging technologies.
     """
 
-    def __init__(self, knowledge_repository=None, omni_search_tool=None):
+    def __init__(self, knowledge_repository=None, omni_search_tool=None, max_concurrency: int = 5,
+                 max_requests_per_minute: int = 500, max_tokens_per_minute: int = 30000,
+                 max_attempts: int = 5, response_cache: Optional[SemanticResponseCache] = None,
+                 models: Optional[Dict[str, str]] = None,
+                 history_path: Optional[str] = DEFAULT_RESEARCH_HISTORY_PATH):
         self.knowledge_repository = knowledge_repository
         self.omni_search_tool = omni_search_tool
         self.client = OpenAI()  # Uses environment variables for API key
-        self.research_history = []
+        self.models = {**DEFAULT_MODELS, **(models or {})}
+        # Asynchronous clients, one per event loop using them, with the research calls in flight on each
+        self._aclients: Dict[asyncio.AbstractEventLoop, AsyncOpenAI] = {}
+        self._aclient_users = Counter()
+        self._aclients_lock = threading.Lock()
+        self.max_concurrency = max_concurrency  # Topics researched at once
+        self.max_attempts = max_attempts  # Attempts per OpenAI call when rate limited
+        self._rate_limiter = _RateLimiter(max_requests_per_minute, max_tokens_per_minute)
+        # Parsed responses of earlier, semantically similar prompts
+        self.response_cache = response_cache if response_cache is not None else SemanticResponseCache()
+        self.research_history = deque(maxlen=RESEARCH_HISTORY_LIMIT)
+        # Statistics of research_history, maintained as sessions enter and leave it
+        self._successful_sessions = 0
+        self._topic_counts = Counter()
+        self._session_times: List[float] = []  # sorted session start times (epoch seconds)
         self.research_priorities = {
             'ai_development': 0.9,
             'code_optimization': 0.8,
@@ -35,6 +179,10 @@ class ResearchAgent:
             'emerging_technologies': 0.5
         }
         self.last_research_time = {}
+        self._rebuild_area_pattern()
+        # Append-only record of research sessions, so history and throttling survive restarts
+        self.history_path = history_path
+        self._load_research_history()
         logger.info("Research Agent initialized")
 
     def conduct_targeted_research(self, topic: str, depth: str = "medium", 
@@ -52,17 +200,7 @@ class ResearchAgent:
         """
         logger.info(f"Conducting targeted research on: {topic} (depth: {depth})")
         
-        research_session = {
-            'topic': topic,
-            'depth': depth,
-            'max_sources': max_sources,
-            'timestamp': datetime.now().isoformat(),
-            'status': 'initiated',
-            'sources_found': [],
-            'key_findings': [],
-            'actionable_insights': [],
-            'confidence_score': 0.0
-        }
+        research_session = self._new_research_session(topic, depth, max_sources)
 
         try:
             # Step 1: Generate search queries
@@ -70,10 +208,7 @@ class ResearchAgent:
             research_session['search_queries'] = search_queries
             
             # Step 2: Execute searches and collect sources
-            all_sources = []
-            for query in search_queries[:3]:  # Limit to 3 queries to avoid overwhelming
-                sources = self._execute_search(query, max_results=max_sources//len(search_queries))
-                all_sources.extend(sources)
+            all_sources = self._collect_sources(search_queries, max_sources)
             
             research_session['sources_found'] = all_sources[:max_sources]
             research_session['total_sources'] = len(all_sources)
@@ -97,12 +232,224 @@ class ResearchAgent:
         
         return research_session
 
-    def conduct_autonomous_research(self, focus_areas: List[str] = None) -> Dict[str, Any]:
+    async def conduct_targeted_research_async(self, topic: str, depth: str = "medium",
+                                              max_sources: int = 10) -> Dict[str, Any]:
+        """
+        Asynchronous variant of conduct_targeted_research, for researching topics concurrently.
+        
+        Args:
+            topic: The research topic or question
+            depth: Research depth ("shallow", "medium", "deep")
+            max_sources: Maximum number of sources to analyze
+            
+        Returns:
+            Dictionary containing research results and analysis
+        """
+        async with self._async_client_scope():
+            research_session = await self._collect_research_async(topic, depth, max_sources)
+            
+            # Step 3: Analyze and synthesize findings
+            if research_session['status'] == 'initiated':
+                analysis_result = await self._analyze_sources_async(topic, research_session['sources_found'])
+                self._complete_research(research_session, analysis_result)
+        
+        return research_session
+
+    async def _collect_research_async(self, topic: str, depth: str, max_sources: int) -> Dict[str, Any]:
+        """
+        Runs the search steps of a targeted research session. A session that found
+        sources is left 'initiated' for the caller to analyze and complete.
+        
+        Args:
+            topic: The research topic or question
+            depth: Research depth ("shallow", "medium", "deep")
+            max_sources: Maximum number of sources to analyze
+            
+        Returns:
+            Dictionary containing the research session
+        """
+        logger.info(f"Conducting targeted research on: {topic} (depth: {depth})")
+        
+        research_session = self._new_research_session(topic, depth, max_sources)
+
+        try:
+            # Step 1: Generate search queries
+            search_queries = await self._generate_search_queries_async(topic, depth)
+            research_session['search_queries'] = search_queries
+            
+            # Step 2: Execute searches and collect sources, off the event loop
+            all_sources = await asyncio.to_thread(self._collect_sources, search_queries, max_sources)
+            
+            research_session['sources_found'] = all_sources[:max_sources]
+            research_session['total_sources'] = len(all_sources)
+            
+            if not all_sources:
+                research_session['status'] = 'no_sources_found'
+                research_session['error'] = 'No relevant sources found for the topic'
+                self._store_research_results(research_session)
+            
+        except Exception as e:
+            logger.error(f"Research failed for topic '{topic}': {str(e)}")
+            research_session['status'] = 'failed'
+            research_session['error'] = str(e)
+        
+        return research_session
+
+    def _complete_research(self, research_session: Dict[str, Any], analysis_result: Dict[str, Any]):
+        """Records the analysis of a research session and stores the results."""
+        try:
+            research_session.update(analysis_result)
+            research_session['status'] = 'completed'
+            self._store_research_results(research_session)
+        except Exception as e:
+            logger.error(f"Research failed for topic '{research_session['topic']}': {str(e)}")
+            research_session['status'] = 'failed'
+            research_session['error'] = str(e)
+
+    async def _analyze_collected_research_async(self, research_sessions: List[Dict[str, Any]]):
+        """
+        Analyzes the sources of several collected research sessions in a single
+        request, analyzing individually any topic the batch did not cover.
+        
+        Args:
+            research_sessions: Sessions returned by _collect_research_async
+        """
+        pending = [session for session in research_sessions if session['status'] == 'initiated']
+        if not pending:
+            return
+        
+        analyses = {}
+        if len(pending) > 1:
+            try:
+                analyses = await self._complete_async(
+                    self._batch_analysis_request(pending), self._parse_batch_analysis
+                )
+            except Exception as e:
+                logger.error(f"Batched source analysis failed, analyzing topics individually: {str(e)}")
+        
+        missing = [session for session in pending if session['topic'] not in analyses]
+        if missing:
+            fallback = await asyncio.gather(*(
+                self._analyze_sources_async(session['topic'], session['sources_found']) for session in missing
+            ))
+            analyses.update(zip((session['topic'] for session in missing), fallback))
+        
+        for session in pending:
+            self._complete_research(session, analyses[session['topic']])
+
+    def _new_research_session(self, topic: str, depth: str, max_sources: int) -> Dict[str, Any]:
+        """Creates the record of a targeted research session."""
+        return {
+            'topic': topic,
+            'depth': depth,
+            'max_sources': max_sources,
+            'timestamp': datetime.now().isoformat(),
+            'status': 'initiated',
+            'sources_found': [],
+            'key_findings': [],
+            'actionable_insights': [],
+            'confidence_score': 0.0
+        }
+
+    def _collect_sources(self, search_queries: List[str], max_sources: int) -> List[Dict[str, Any]]:
+        """
+        Executes the search queries and collects their sources, without near-duplicates.
+        
+        Args:
+            search_queries: Search query strings
+            max_sources: Maximum number of sources to analyze
+            
+        Returns:
+            List of source dictionaries
+        """
+        queries = search_queries[:3]  # Limit to 3 queries to avoid overwhelming
+        if not queries:
+            return []
+        max_results = max_sources//len(search_queries)
+        # Searches are independent I/O, so run them at once; map keeps the query order
+        with ThreadPoolExecutor(max_workers=len(queries)) as executor:
+            results = executor.map(lambda query: self._execute_search(query, max_results=max_results), queries)
+            all_sources = [source for sources in results for source in sources]
+        return self._deduplicate_sources(all_sources)
+
+    def _deduplicate_sources(self, sources: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Drops sources whose snippet embedding is within SOURCE_DUPLICATE_THRESHOLD
+        of an earlier source, so the analysis prompt carries each content once.
+        Sources are returned unchanged when sentence-transformers is not installed.
+        
+        Args:
+            sources: List of source dictionaries
+            
+        Returns:
+            List of source dictionaries, keeping the first of each near-duplicate group
+        """
+        model = get_embedding_model()
+        if model is None or len(sources) < 2:
+            return sources
+        try:
+            texts = [source.get('snippet') or source.get('title', '') for source in sources]
+            duplicates = self._duplicate_mask(model, texts)
+        except Exception as e:
+            logger.error(f"Source deduplication failed: {str(e)}")
+            return sources
+        
+        kept = [source for source, is_duplicate in zip(sources, duplicates) if not is_duplicate]
+        if len(kept) < len(sources):
+            logger.info(f"Dropped {len(sources) - len(kept)} near-duplicate sources")
+        return kept
+
+    def _duplicate_mask(self, model, texts: List[str]):
+        """
+        Flags each text whose embedding is within SOURCE_DUPLICATE_THRESHOLD of an
+        earlier text. On a CUDA model the similarities stay on the GPU and only
+        the mask is copied back.
+        
+        Args:
+            model: Sentence embedding model
+            texts: Texts to compare
+            
+        Returns:
+            Boolean array, True for texts duplicating an earlier one
+        """
+        device = getattr(model, 'device', None)
+        if len(texts) >= GPU_DEDUP_MIN_SOURCES and getattr(device, 'type', None) == 'cuda':
+            import torch
+            
+            embeddings = model.encode(texts, batch_size=64, convert_to_tensor=True, normalize_embeddings=True)
+            # Upper triangle: similarity of each text (column) to every earlier text (row)
+            similarities = torch.triu(embeddings @ embeddings.T, diagonal=1)
+            return (similarities >= SOURCE_DUPLICATE_THRESHOLD).any(dim=0).cpu().numpy()
+        
+        import numpy as np
+        
+        embeddings = np.asarray(model.encode(texts, batch_size=64, normalize_embeddings=True), dtype=np.float32)
+        similarities = np.triu(embeddings @ embeddings.T, k=1)
+        return (similarities >= SOURCE_DUPLICATE_THRESHOLD).any(axis=0)
+
+    def conduct_autonomous_research(self, focus_areas: List[str] = None,
+                                    batch_analysis: bool = True) -> Dict[str, Any]:
         """
         Conducts autonomous research based on current system needs and priorities.
+        Topics are researched concurrently; see conduct_autonomous_research_async.
+        
+        Args:
+            focus_areas: Optional list of specific areas to focus on
+            batch_analysis: Whether to analyze all topics' sources in one request
+            
+        Returns:
+            Dictionary containing autonomous research results
+        """
+        return self._run_async(self.conduct_autonomous_research_async(focus_areas, batch_analysis))
+
+    async def conduct_autonomous_research_async(self, focus_areas: List[str] = None,
+                                                batch_analysis: bool = True) -> Dict[str, Any]:
+        """
+        Conducts autonomous research, researching up to max_concurrency topics at once.
         
         Args:
             focus_areas: Optional list of specific areas to focus on
+            batch_analysis: Whether to analyze all topics' sources in one request
             
         Returns:
             Dictionary containing autonomous research results
@@ -118,40 +465,298 @@ class ResearchAgent:
             'high_priority_findings': 0
         }
 
-        try:
-            # Determine research topics based on priorities and system needs
-            research_topics = self._determine_research_topics(focus_areas)
-            autonomous_session['research_topics'] = research_topics
-            
-            # Conduct research on each topic
-            all_findings = []
-            for topic_info in research_topics:
-                topic_research = self.conduct_targeted_research(
-                    topic_info['topic'], 
-                    depth=topic_info.get('depth', 'medium'),
-                    max_sources=topic_info.get('max_sources', 5)
-                )
-                
-                if topic_research['status'] == 'completed':
-                    all_findings.extend(topic_research.get('key_findings', []))
-                    if topic_info.get('priority', 0) > 0.7:
-                        autonomous_session['high_priority_findings'] += len(topic_research.get('key_findings', []))
+        async with self._async_client_scope():
+            try:
+                # Determine research topics based on priorities and system needs
+                research_topics = self._determine_research_topics(focus_areas)
+                autonomous_session['research_topics'] = research_topics
             
-            autonomous_session['total_findings'] = len(all_findings)
-            autonomous_session['status'] = 'completed'
+                # Conduct research on all topics concurrently
+                if batch_analysis:
+                    semaphore = asyncio.Semaphore(self.max_concurrency)
+                    topic_results = await asyncio.gather(*(
+                        self._research_topic_async(topic_info, semaphore, self._collect_research_async)
+                        for topic_info in research_topics
+                    ))
+                    # One analysis request for every topic instead of one per topic
+                    await self._analyze_collected_research_async([session for _, session in topic_results])
+                else:
+                    topic_results = [result async for result in self._iter_topic_research(research_topics)]
             
-            # Generate summary insights
-            if all_findings:
-                summary_insights = self._generate_summary_insights(all_findings)
-                autonomous_session['summary_insights'] = summary_insights
+                all_findings = []
+                for topic_info, topic_research in topic_results:
+                    if topic_research['status'] == 'completed':
+                        all_findings.extend(topic_research.get('key_findings', []))
+                        if topic_info.get('priority', 0) > 0.7:
+                            autonomous_session['high_priority_findings'] += len(topic_research.get('key_findings', []))
             
-        except Exception as e:
-            logger.error(f"Autonomous research session failed: {str(e)}")
-            autonomous_session['status'] = 'failed'
-            autonomous_session['error'] = str(e)
+                autonomous_session['total_findings'] = len(all_findings)
+                autonomous_session['status'] = 'completed'
+            
+                # Generate summary insights
+                if all_findings:
+                    summary_insights = await self._generate_summary_insights_async(all_findings)
+                    autonomous_session['summary_insights'] = summary_insights
+            
+            except Exception as e:
+                logger.error(f"Autonomous research session failed: {str(e)}")
+                autonomous_session['status'] = 'failed'
+                autonomous_session['error'] = str(e)
         
         return autonomous_session
 
+    async def iter_autonomous_research(self, focus_areas: List[str] = None) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Researches the autonomous research topics concurrently, yielding each topic's
+        research session, already stored, as soon as it completes.
+        
+        Args:
+            focus_areas: Optional list of specific areas to focus on
+            
+        Yields:
+            Research sessions in order of completion
+        """
+        research_topics = self._determine_research_topics(focus_areas)
+        async with self._async_client_scope():
+            async for _, research_session in self._iter_topic_research(research_topics):
+                yield research_session
+
+    async def _iter_topic_research(self, research_topics: List[Dict[str, Any]]
+                                   ) -> AsyncIterator[Tuple[Dict[str, Any], Dict[str, Any]]]:
+        """
+        Conducts targeted research on the topics, up to max_concurrency at once, and
+        yields (topic info, research session) pairs in order of completion.
+        Topics still in flight are cancelled if iteration stops early.
+        """
+        semaphore = asyncio.Semaphore(self.max_concurrency)
+        tasks = [
+            asyncio.create_task(self._research_topic_async(topic_info, semaphore, self.conduct_targeted_research_async))
+            for topic_info in research_topics
+        ]
+        try:
+            for next_completed in asyncio.as_completed(tasks):
+                yield await next_completed
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _research_topic_async(self, topic_info: Dict[str, Any], semaphore: asyncio.Semaphore,
+                                    research_step) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Runs a research step on a topic once the semaphore admits it.
+        
+        Args:
+            topic_info: Topic dictionary from _determine_research_topics
+            semaphore: Semaphore bounding the topics researched at once
+            research_step: conduct_targeted_research_async or _collect_research_async
+            
+        Returns:
+            Tuple of the topic info and its research session
+        """
+        async with semaphore:
+            research_session = await research_step(
+                topic_info['topic'],
+                depth=topic_info.get('depth', 'medium'),
+                max_sources=topic_info.get('max_sources', 5)
+            )
+        return topic_info, research_session
+
+    def _run_async(self, coroutine):
+        """
+        Runs a coroutine to completion from synchronous code, on an event loop
+        of its own.
+        
+        Args:
+            coroutine: The coroutine to run
+            
+        Returns:
+            The coroutine's result
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        # Called from inside an event loop: run on a separate thread with its own loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    @asynccontextmanager
+    async def _async_client_scope(self):
+        """
+        Marks a research call using the asynchronous client of the running
+        event loop. The client is closed when the last call using it on that
+        loop ends, so concurrent calls on one loop share its connection pool
+        and calls on other loops, such as other self-development cycles, are
+        unaffected.
+        """
+        loop = asyncio.get_running_loop()
+        with self._aclients_lock:
+            self._aclient_users[loop] += 1
+        try:
+            yield
+        finally:
+            with self._aclients_lock:
+                self._aclient_users[loop] -= 1
+                aclient = None
+                if not self._aclient_users[loop]:
+                    del self._aclient_users[loop]
+                    aclient = self._aclients.pop(loop, None)
+            if aclient is not None:
+                await aclient.close()
+
+    def _get_async_client(self) -> AsyncOpenAI:
+        """
+        Returns the asynchronous OpenAI client of the running event loop,
+        creating it with a keep-alive connection pool shared by all concurrent
+        requests on that loop.
+        """
+        loop = asyncio.get_running_loop()
+        with self._aclients_lock:
+            aclient = self._aclients.get(loop)
+            if aclient is None:
+                http_client = httpx.AsyncClient(
+                    http2=HTTP2_AVAILABLE,
+                    timeout=HTTP_TIMEOUT_SECONDS,
+                    limits=httpx.Limits(
+                        max_connections=HTTP_MAX_CONNECTIONS,
+                        max_keepalive_connections=HTTP_MAX_KEEPALIVE_CONNECTIONS
+                    )
+                )
+                # Uses environment variables for API key
+                aclient = self._aclients[loop] = AsyncOpenAI(http_client=http_client)
+        return aclient
+
+    async def aclose(self):
+        """
+        Closes the asynchronous OpenAI client of the running event loop and its
+        connection pool. Only needed after calling the asynchronous helpers
+        directly; the public research methods close the client themselves.
+        """
+        with self._aclients_lock:
+            aclient = self._aclients.pop(asyncio.get_running_loop(), None)
+        if aclient is not None:
+            await aclient.close()
+
+    def _complete(self, request: Dict[str, Any], parse, read_stream=None, semantic_text: Optional[str] = None):
+        """
+        Sends a chat completion request and parses the response, answering from
+        the response cache when the same prompt, or one with similar
+        semantic_text, was already answered.
+        
+        Args:
+            request: Keyword arguments for chat.completions.create
+            parse: Function parsing the response content
+            read_stream: Function reading the content of a streamed response
+            semantic_text: Variable part of the prompt to match semantically, if any
+            
+        Returns:
+            The parsed response
+        """
+        cached, embedding = self.response_cache.lookup(request, semantic_text)
+        if cached is not None:
+            return cached
+        response = self.client.chat.completions.create(**request)
+        content = read_stream(response) if read_stream else response.choices[0].message.content
+        result = parse(content)
+        self.response_cache.store(request, result, embedding, semantic_text)
+        return result
+
+    async def _complete_async(self, request: Dict[str, Any], parse, read_stream=None,
+                              semantic_text: Optional[str] = None):
+        """Asynchronous variant of _complete; read_stream is a coroutine function taking the request too."""
+        # Embedding the prompt is CPU-bound, so look up off the event loop
+        cached, embedding = await asyncio.to_thread(self.response_cache.lookup, request, semantic_text)
+        if cached is not None:
+            return cached
+        response = await self._create_chat_completion_async(request)
+        content = await read_stream(response, request) if read_stream else response.choices[0].message.content
+        result = parse(content)
+        self.response_cache.store(request, result, embedding, semantic_text)
+        return result
+
+    def _read_analysis_stream(self, stream) -> str:
+        """
+        Reads a streamed source analysis, closing the stream as soon as its
+        confidence score arrives below LOW_CONFIDENCE_CUTOFF.
+        
+        Args:
+            stream: Streamed chat completion
+            
+        Returns:
+            The analysis JSON, or a low-confidence stub when cut short
+        """
+        parts = []
+        confidence = None
+        for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            parts.append(delta)
+            if confidence is None:
+                confidence = self._streamed_confidence(parts)
+                if confidence is not None and confidence < LOW_CONFIDENCE_CUTOFF:
+                    stream.close()
+                    return self._low_confidence_analysis(confidence)
+        return "".join(parts)
+
+    async def _read_analysis_stream_async(self, stream, request: Dict[str, Any]) -> str:
+        """Asynchronous variant of _read_analysis_stream, refunding the tokens a cut-short analysis did not use."""
+        parts = []
+        confidence = None
+        async for chunk in stream:
+            delta = chunk.choices[0].delta.content if chunk.choices else None
+            if not delta:
+                continue
+            parts.append(delta)
+            if confidence is None:
+                confidence = self._streamed_confidence(parts)
+                if confidence is not None and confidence < LOW_CONFIDENCE_CUTOFF:
+                    await stream.close()
+                    self._rate_limiter.refund(request['max_tokens'] - sum(map(len, parts)) // 4)
+                    return self._low_confidence_analysis(confidence)
+        return "".join(parts)
+
+    def _streamed_confidence(self, parts: List[str]) -> Optional[float]:
+        """Returns the confidence score once the streamed analysis contains it."""
+        match = _CONFIDENCE_PATTERN.search("".join(parts))
+        return float(match.group(1)) if match else None
+
+    def _low_confidence_analysis(self, confidence: float) -> str:
+        """Analysis JSON reported for an analysis cut short for low confidence."""
+        return _dumps({
+            'key_findings': [],
+            'actionable_insights': [],
+            'confidence_score': confidence,
+            'summary': f"Analysis stopped early: confidence {confidence} is below {LOW_CONFIDENCE_CUTOFF}.",
+            'low_confidence': True
+        }).decode()
+
+    async def _create_chat_completion_async(self, request: Dict[str, Any]):
+        """
+        Sends a chat completion request within the rate limits, backing off
+        exponentially when OpenAI reports a rate limit.
+        
+        Args:
+            request: Keyword arguments for chat.completions.create
+            
+        Returns:
+            The chat completion response
+        """
+        # Roughly four characters per prompt token, plus the completion budget
+        estimated_tokens = sum(len(message['content']) for message in request['messages']) // 4
+        estimated_tokens += request.get('max_tokens', 0)
+        client = self._get_async_client()
+        for attempt in range(self.max_attempts):
+            await self._rate_limiter.acquire(estimated_tokens)
+            try:
+                return await client.chat.completions.create(**request)
+            except RateLimitError:
+                if attempt == self.max_attempts - 1:
+                    raise
+                delay = min(2 ** attempt, 60) * (1 + random.random())
+                logger.warning(f"OpenAI rate limit reached; retrying in {delay:.1f}s")
+                await asyncio.sleep(delay)
+
     def _generate_search_queries(self, topic: str, depth: str) -> List[str]:
         """
         Generates appropriate search queries for a given topic and depth.
@@ -163,6 +768,26 @@ class ResearchAgent:
         Returns:
             List of search query strings
         """
+        try:
+            return self._complete(self._search_queries_request(topic, depth), self._parse_search_queries,
+                                  semantic_text=topic)
+            
+        except Exception as e:
+            logger.error(f"Error generating search queries: {str(e)}")
+            return self._fallback_search_queries(topic)
+
+    async def _generate_search_queries_async(self, topic: str, depth: str) -> List[str]:
+        """Asynchronous variant of _generate_search_queries."""
+        try:
+            return await self._complete_async(self._search_queries_request(topic, depth), self._parse_search_queries,
+                                              semantic_text=topic)
+            
+        except Exception as e:
+            logger.error(f"Error generating search queries: {str(e)}")
+            return self._fallback_search_queries(topic)
+
+    def _search_queries_request(self, topic: str, depth: str) -> Dict[str, Any]:
+        """Builds the chat completion request that generates search queries."""
         # Use LLM to generate contextually appropriate search queries
         prompt = f"""
 Generate {3 if depth == 'shallow' else 5 if depth == 'medium' else 8} search queries for researching the topic: "{topic}"
@@ -177,31 +802,29 @@ Research depth: {depth}
 
 Return only the search queries, one per line, without numbering or additional text.
 """
-        
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a research assistant specializing in generating effective search queries for technical topics."},
-                    {"role": "user", "content": prompt}
-                ],
-                temperature=0.3,
-                max_tokens=500
-            )
-            
-            queries = [q.strip() for q in response.choices[0].message.content.strip().split('\n') if q.strip()]
-            return queries
-            
-        except Exception as e:
-            logger.error(f"Error generating search queries: {str(e)}")
-            # Fallback to basic query generation
-            return [
-                f"{topic} best practices",
-                f"{topic} recent developments",
-                f"{topic} optimization techniques",
-                f"{topic} security considerations",
-                f"{topic} performance improvements"
-            ]
+        return {
+            'model': self.models['queries'],
+            'messages': [
+                {"role": "system", "content": "You are a research assistant specializing in generating effective search queries for technical topics."},
+                {"role": "user", "content": prompt}
+            ],
+            'temperature': 0.3,
+            'max_tokens': 200
+        }
+
+    def _parse_search_queries(self, content: str) -> List[str]:
+        """Splits the generated search queries, one per line."""
+        return [q.strip() for q in content.strip().split('\n') if q.strip()]
+
+    def _fallback_search_queries(self, topic: str) -> List[str]:
+        """Basic search queries used when query generation fails."""
+        return [
+            f"{topic} best practices",
+            f"{topic} recent developments",
+            f"{topic} optimization techniques",
+            f"{topic} security considerations",
+            f"{topic} performance improvements"
+        ]
 
     def _execute_search(self, query: str, max_results: int = 5) -> List[Dict[str, Any]]:
         """
@@ -256,11 +879,31 @@ Return only the search queries, one per line, without numbering or additional te
         Returns:
             Dictionary containing analysis results
         """
+        try:
+            return self._complete(self._analysis_request(topic, sources), self._parse_analysis,
+                                  self._read_analysis_stream)
+            
+        except Exception as e:
+            logger.error(f"Source analysis failed: {str(e)}")
+            return self._failed_analysis(topic, sources, e)
+
+    async def _analyze_sources_async(self, topic: str, sources: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Asynchronous variant of _analyze_sources."""
+        try:
+            return await self._complete_async(self._analysis_request(topic, sources), self._parse_analysis,
+                                              self._read_analysis_stream_async)
+            
+        except Exception as e:
+            logger.error(f"Source analysis failed: {str(e)}")
+            return self._failed_analysis(topic, sources, e)
+
+    def _analysis_request(self, topic: str, sources: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Builds the chat completion request that analyzes research sources."""
         analysis_prompt = f"""
 Analyze the following research sources for the topic: "{topic}"
 
 Sources:
-{json.dumps(sources, indent=2)}
+{self._format_sources(sources)}
 
 Provide a comprehensive analysis including:
 1. Key findings (3-5 most important insights)
@@ -269,60 +912,114 @@ Provide a comprehensive analysis including:
 4. Potential risks or considerations
 5. Recommended next steps
 
-Format your response as a JSON object with the following structure:
+Format your response as a JSON object with the following structure, starting with confidence_score:
 {{
+    "confidence_score": 0.0-1.0,
     "key_findings": ["finding1", "finding2", ...],
     "actionable_insights": ["insight1", "insight2", ...],
-    "confidence_score": 0.0-1.0,
     "risks_considerations": ["risk1", "risk2", ...],
     "recommended_next_steps": ["step1", "step2", ...],
     "summary": "Brief summary of the research"
 }}
 """
+        return {
+            'model': self.models['analysis'],
+            'messages': [
+                {"role": "system", "content": "You are an expert research analyst specializing in technical and scientific literature analysis. Return strictly valid JSON."},
+                {"role": "user", "content": analysis_prompt}
+            ],
+            'temperature': 0.2,
+            'max_tokens': 1500,
+            'response_format': {"type": "json_object"},
+            # Streamed so a low-confidence analysis can be cut short
+            'stream': True
+        }
+
+    def _format_sources(self, sources: List[Dict[str, Any]]) -> str:
+        """
+        Lists sources for an analysis prompt with only their title and truncated
+        snippet. Labels are indexes into the sources list, so they stay citable.
+        """
+        return "\n\n".join(
+            f"[{index}] {source.get('title', '')}\n{source.get('snippet', '')[:SOURCE_SNIPPET_CHARS]}"
+            for index, source in enumerate(sources)
+        )
+
+    def _parse_analysis(self, content: str) -> Dict[str, Any]:
+        """Parses the JSON source analysis, filling in missing keys."""
+        return self._with_analysis_defaults(_loads(content))
+
+    def _with_analysis_defaults(self, analysis_result: Dict[str, Any]) -> Dict[str, Any]:
+        """Validates an analysis result and sets defaults for missing keys."""
+        required_keys = ['key_findings', 'actionable_insights', 'confidence_score', 'summary']
+        for key in required_keys:
+            if key not in analysis_result:
+                analysis_result[key] = [] if key != 'confidence_score' and key != 'summary' else (0.5 if key == 'confidence_score' else "Analysis summary not available")
         
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are an expert research analyst specializing in technical and scientific literature analysis."},
-                    {"role": "user", "content": analysis_prompt}
-                ],
-                temperature=0.2,
-                max_tokens=1500
-            )
-            
-            # Parse JSON response
-            analysis_text = response.choices[0].message.content.strip()
-            
-            # Extract JSON from response (handle potential markdown formatting)
-            if '```json' in analysis_text:
-                json_start = analysis_text.find('```json') + 7
-                json_end = analysis_text.find('```', json_start)
-                analysis_text = analysis_text[json_start:json_end].strip()
-            elif '```' in analysis_text:
-                json_start = analysis_text.find('```') + 3
-                json_end = analysis_text.find('```', json_start)
-                analysis_text = analysis_text[json_start:json_end].strip()
-            
-            analysis_result = json.loads(analysis_text)
-            
-            # Validate and set defaults
-            required_keys = ['key_findings', 'actionable_insights', 'confidence_score', 'summary']
-            for key in required_keys:
-                if key not in analysis_result:
-                    analysis_result[key] = [] if key != 'confidence_score' and key != 'summary' else (0.5 if key == 'confidence_score' else "Analysis summary not available")
-            
-            return analysis_result
-            
-        except Exception as e:
-            logger.error(f"Source analysis failed: {str(e)}")
-            return {
-                'key_findings': [f"Analysis failed for topic: {topic}"],
-                'actionable_insights': ["Manual review of sources recommended"],
-                'confidence_score': 0.0,
-                'summary': f"Automated analysis failed. {len(sources)} sources collected for manual review.",
-                'error': str(e)
-            }
+        return analysis_result
+
+    def _batch_analysis_request(self, research_sessions: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Builds the chat completion request that analyzes the sources of several topics."""
+        topic_sections = "\n\n".join(
+            f'Topic: "{session["topic"]}"\nSources:\n{self._format_sources(session["sources_found"])}'
+            for session in research_sessions
+        )
+        analysis_prompt = f"""
+Analyze the research sources collected for each of the following topics.
+
+{topic_sections}
+
+For each topic provide a comprehensive analysis including:
+1. Key findings (3-5 most important insights)
+2. Actionable insights (specific recommendations for implementation)
+3. Confidence score (0.0-1.0 based on source quality and consistency)
+4. Potential risks or considerations
+5. Recommended next steps
+
+Format your response as a JSON object with one result per topic:
+{{
+    "results": [
+        {{
+            "topic": "the topic exactly as given",
+            "key_findings": ["finding1", "finding2", ...],
+            "actionable_insights": ["insight1", "insight2", ...],
+            "confidence_score": 0.0-1.0,
+            "risks_considerations": ["risk1", "risk2", ...],
+            "recommended_next_steps": ["step1", "step2", ...],
+            "summary": "Brief summary of the research"
+        }}
+    ]
+}}
+"""
+        return {
+            'model': self.models['analysis'],
+            'messages': [
+                {"role": "system", "content": "You are an expert research analyst specializing in technical and scientific literature analysis. Return strictly valid JSON."},
+                {"role": "user", "content": analysis_prompt}
+            ],
+            'temperature': 0.2,
+            'max_tokens': min(BATCH_ANALYSIS_TOKENS_PER_TOPIC * len(research_sessions), BATCH_ANALYSIS_MAX_TOKENS),
+            'response_format': {"type": "json_object"}
+        }
+
+    def _parse_batch_analysis(self, content: str) -> Dict[str, Dict[str, Any]]:
+        """Parses a batched source analysis into the analysis result of each topic."""
+        analyses = {}
+        for result in _loads(content).get('results', []):
+            if isinstance(result, dict) and 'topic' in result:
+                topic = result.pop('topic')
+                analyses[topic] = self._with_analysis_defaults(result)
+        return analyses
+
+    def _failed_analysis(self, topic: str, sources: List[Dict[str, Any]], error: Exception) -> Dict[str, Any]:
+        """Analysis result reported when automated analysis fails."""
+        return {
+            'key_findings': [f"Analysis failed for topic: {topic}"],
+            'actionable_insights': ["Manual review of sources recommended"],
+            'confidence_score': 0.0,
+            'summary': f"Automated analysis failed. {len(sources)} sources collected for manual review.",
+            'error': str(error)
+        }
 
     def _determine_research_topics(self, focus_areas: List[str] = None) -> List[Dict[str, Any]]:
         """
@@ -369,34 +1066,10 @@ Format your response as a JSON object with the following structure:
         Returns:
             List of topic dictionaries
         """
-        area_topics = {
-            'ai_development': [
-                {'topic': 'latest AI model architectures for code generation', 'depth': 'medium', 'max_sources': 5},
-                {'topic': 'AI self-improvement techniques and frameworks', 'depth': 'deep', 'max_sources': 8}
-            ],
-            'code_optimization': [
-                {'topic': 'Python performance optimization techniques 2024', 'depth': 'medium', 'max_sources': 6},
-                {'topic': 'memory management best practices for long-running applications', 'depth': 'medium', 'max_sources': 5}
-            ],
-            'security_vulnerabilities': [
-                {'topic': 'recent Python security vulnerabilities and patches', 'depth': 'deep', 'max_sources': 10},
-                {'topic': 'AI system security best practices', 'depth': 'medium', 'max_sources': 6}
-            ],
-            'new_algorithms': [
-                {'topic': 'efficient algorithms for natural language processing', 'depth': 'medium', 'max_sources': 5},
-                {'topic': 'optimization algorithms for resource management', 'depth': 'shallow', 'max_sources': 4}
-            ],
-            'programming_best_practices': [
-                {'topic': 'clean code principles for AI systems', 'depth': 'shallow', 'max_sources': 4},
-                {'topic': 'testing strategies for machine learning applications', 'depth': 'medium', 'max_sources': 5}
-            ],
-            'emerging_technologies': [
-                {'topic': 'emerging trends in AI and automation 2024', 'depth': 'shallow', 'max_sources': 4},
-                {'topic': 'new programming languages and frameworks for AI', 'depth': 'shallow', 'max_sources': 3}
-            ]
-        }
-        
-        return area_topics.get(area, [{'topic': f'general research on {area}', 'depth': 'medium', 'max_sources': 5}])
+        topics = AREA_TOPICS.get(area)
+        if topics is None:
+            return [{'topic': f'general research on {area}', 'depth': 'medium', 'max_sources': 5}]
+        return [dict(topic_info) for topic_info in topics]
 
     def _generate_summary_insights(self, all_findings: List[str]) -> Dict[str, Any]:
         """
@@ -408,11 +1081,29 @@ Format your response as a JSON object with the following structure:
         Returns:
             Dictionary containing summary insights
         """
+        try:
+            return self._complete(self._summary_request(all_findings), _loads)
+            
+        except Exception as e:
+            logger.error(f"Summary generation failed: {str(e)}")
+            return self._failed_summary(all_findings)
+
+    async def _generate_summary_insights_async(self, all_findings: List[str]) -> Dict[str, Any]:
+        """Asynchronous variant of _generate_summary_insights."""
+        try:
+            return await self._complete_async(self._summary_request(all_findings), _loads)
+            
+        except Exception as e:
+            logger.error(f"Summary generation failed: {str(e)}")
+            return self._failed_summary(all_findings)
+
+    def _summary_request(self, all_findings: List[str]) -> Dict[str, Any]:
+        """Builds the chat completion request that summarizes research findings."""
         summary_prompt = f"""
 Analyze the following research findings and generate summary insights:
 
 Findings:
-{json.dumps(all_findings, indent=2)}
+{_dumps(all_findings, indent=True).decode()}
 
 Provide:
 1. Top 3 most important insights across all findings
@@ -429,37 +1120,26 @@ Format as JSON:
     "overall_assessment": "Brief overall assessment"
 }}
 """
-        
-        try:
-            response = self.client.chat.completions.create(
-                model="gpt-4",
-                messages=[
-                    {"role": "system", "content": "You are a strategic analyst specializing in technology research synthesis."},
-                    {"role": "user", "content": summary_prompt}
-                ],
-                temperature=0.2,
-                max_tokens=1000
-            )
-            
-            summary_text = response.choices[0].message.content.strip()
-            
-            # Extract JSON from response
-            if '```json' in summary_text:
-                json_start = summary_text.find('```json') + 7
-                json_end = summary_text.find('```', json_start)
-                summary_text = summary_text[json_start:json_end].strip()
-            
-            return json.loads(summary_text)
-            
-        except Exception as e:
-            logger.error(f"Summary generation failed: {str(e)}")
-            return {
-                'top_insights': ["Summary generation failed"],
-                'common_themes': [],
-                'immediate_actions': ["Manual review of findings recommended"],
-                'strategic_recommendations': [],
-                'overall_assessment': f"Automated summary failed. {len(all_findings)} findings available for manual review."
-            }
+        return {
+            'model': self.models['summary'],
+            'messages': [
+                {"role": "system", "content": "You are a strategic analyst specializing in technology research synthesis. Return strictly valid JSON."},
+                {"role": "user", "content": summary_prompt}
+            ],
+            'temperature': 0.2,
+            'max_tokens': 1000,
+            'response_format': {"type": "json_object"}
+        }
+
+    def _failed_summary(self, all_findings: List[str]) -> Dict[str, Any]:
+        """Summary reported when automated summary generation fails."""
+        return {
+            'top_insights': ["Summary generation failed"],
+            'common_themes': [],
+            'immediate_actions': ["Manual review of findings recommended"],
+            'strategic_recommendations': [],
+            'overall_assessment': f"Automated summary failed. {len(all_findings)} findings available for manual review."
+        }
 
     def _store_research_results(self, research_session: Dict[str, Any]):
         """
@@ -468,12 +1148,8 @@ Format as JSON:
         Args:
             research_session: The research session results to store
         """
-        # Add to research history
-        self.research_history.append(research_session)
-        
-        # Keep only last 50 research sessions
-        if len(self.research_history) > 50:
-            self.research_history = self.research_history[-50:]
+        self._track_session(research_session)
+        self._append_history_record(research_session)
         
         # Store in knowledge repository if available
         if self.knowledge_repository:
@@ -492,13 +1168,98 @@ Format as JSON:
                     'confidence_score': research_session.get('confidence_score', 0.5),
                     'timestamp': research_session['timestamp']
                 })
+
+    def _track_session(self, research_session: Dict[str, Any]):
+        """
+        Adds a session to the research history, its statistics and the last
+        research time of its area.
+        
+        Args:
+            research_session: The research session to track
+        """
+        # Add to research history, which keeps only the last 50 research sessions
+        if len(self.research_history) == self.research_history.maxlen:
+            self._count_session(self.research_history[0], -1)
+        self.research_history.append(research_session)
+        self._count_session(research_session, 1)
         
         # Update last research time for the topic area
-        topic = research_session.get('topic', '')
-        for area in self.research_priorities.keys():
-            if area.replace('_', ' ') in topic.lower():
-                self.last_research_time[area] = research_session['timestamp']
-                break
+        match = self._area_pattern.search(research_session.get('topic', '').lower())
+        if match and match.lastindex:
+            self.last_research_time[self._area_names[match.lastindex - 1]] = research_session['timestamp']
+
+    def _append_history_record(self, research_session: Dict[str, Any]):
+        """Appends a session to the history file as one JSON line."""
+        if not self.history_path:
+            return
+        try:
+            os.makedirs(os.path.dirname(self.history_path) or ".", exist_ok=True)
+            with open(self.history_path, 'ab') as f:
+                f.write(_dumps(research_session) + b"\n")
+        except (OSError, TypeError) as e:
+            logger.error(f"Failed to persist research session: {str(e)}")
+
+    def _load_research_history(self):
+        """
+        Restores the last sessions from the history file, parsing only the lines
+        that fit in the history, and compacts the file once it has grown.
+        """
+        if not self.history_path or not os.path.exists(self.history_path):
+            return
+        try:
+            line_count = 0
+            recent_lines = deque(maxlen=RESEARCH_HISTORY_LIMIT)
+            with open(self.history_path, 'rb') as f:
+                for line in f:
+                    line_count += 1
+                    recent_lines.append(line)
+        except OSError as e:
+            logger.error(f"Failed to load research history: {str(e)}")
+            return
+        
+        for line in recent_lines:
+            try:
+                self._track_session(_loads(line))
+            except (ValueError, KeyError) as e:
+                logger.warning(f"Skipping unreadable research history record: {str(e)}")
+        logger.info(f"Restored {len(self.research_history)} research sessions from {self.history_path}")
+        
+        if line_count > HISTORY_COMPACT_FACTOR * RESEARCH_HISTORY_LIMIT:
+            temp_path = f"{self.history_path}.tmp"
+            try:
+                with open(temp_path, 'wb') as f:
+                    for research_session in self.research_history:
+                        f.write(_dumps(research_session) + b"\n")
+                os.replace(temp_path, self.history_path)
+            except OSError as e:
+                logger.error(f"Failed to compact research history: {str(e)}")
+
+    def _rebuild_area_pattern(self):
+        """Compiles one alternation matching any research area's name within a topic."""
+        self._area_names = list(self.research_priorities)
+        self._area_pattern = re.compile(
+            "|".join(f"({re.escape(area.replace('_', ' '))})" for area in self._area_names)
+        )
+
+    def _count_session(self, research_session: Dict[str, Any], sign: int):
+        """
+        Adds a session to the history statistics, or removes it with sign -1.
+        
+        Args:
+            research_session: Session entering or leaving research_history
+            sign: 1 when the session enters, -1 when it leaves
+        """
+        if research_session.get('status') == 'completed':
+            self._successful_sessions += sign
+        topic = research_session.get('topic', 'unknown')
+        self._topic_counts[topic] += sign
+        if not self._topic_counts[topic]:
+            del self._topic_counts[topic]
+        started = datetime.fromisoformat(research_session['timestamp']).timestamp()
+        if sign > 0:
+            insort(self._session_times, started)
+        else:
+            del self._session_times[bisect_left(self._session_times, started)]
 
     def get_research_history(self, limit: int = 20) -> List[Dict[str, Any]]:
         """
@@ -510,7 +1271,9 @@ Format as JSON:
         Returns:
             List of research session records
         """
-        return self.research_history[-limit:] if limit else self.research_history.copy()
+        if not limit:
+            return list(self.research_history)
+        return list(islice(self.research_history, max(0, len(self.research_history) - limit), None))
 
     def get_research_statistics(self) -> Dict[str, Any]:
         """
@@ -520,26 +1283,18 @@ Format as JSON:
             Dictionary containing research statistics
         """
         total_sessions = len(self.research_history)
-        successful_sessions = sum(1 for session in self.research_history if session.get('status') == 'completed')
-        
-        # Topic distribution
-        topic_counts = {}
-        for session in self.research_history:
-            topic = session.get('topic', 'unknown')
-            topic_counts[topic] = topic_counts.get(topic, 0) + 1
-        
-        # Recent activity
-        recent_sessions = [
-            session for session in self.research_history
-            if datetime.now() - datetime.fromisoformat(session['timestamp']) < timedelta(days=7)
-        ]
+        successful_sessions = self._successful_sessions
+        
+        # Recent activity: sessions started after the cutoff, found by bisection
+        cutoff = time.time() - RECENT_ACTIVITY_SECONDS
+        recent_sessions = len(self._session_times) - bisect_left(self._session_times, cutoff)
         
         return {
             'total_research_sessions': total_sessions,
             'successful_sessions': successful_sessions,
             'success_rate': successful_sessions / max(total_sessions, 1),
-            'recent_sessions_7_days': len(recent_sessions),
-            'topic_distribution': topic_counts,
+            'recent_sessions_7_days': recent_sessions,
+            'topic_distribution': dict(self._topic_counts),
             'research_priorities': self.research_priorities,
             'last_research_times': self.last_research_time
         }
@@ -553,7 +1308,10 @@ Format as JSON:
             priority: New priority value (0.0-1.0)
         """
         if 0.0 <= priority <= 1.0:
+            is_new_area = area not in self.research_priorities
             self.research_priorities[area] = priority
+            if is_new_area:
+                self._rebuild_area_pattern()
             logger.info(f"Updated research priority for {area}: {priority}")
         else:
             logger.warning(f"Invalid priority value: {priority}. Must be between 0.0 and 1.0")
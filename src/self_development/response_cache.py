@@ -0,0 +1,257 @@
+"""
+Semantic Response Cache for JARVIS AI Hub Self-Development Module
+
+Caches parsed LLM responses so a request that repeats an earlier one is
+answered without an API call. An exact-match layer answers identical
+prompts. When the caller names the variable part of a templated prompt
+(such as a research topic), a semantic layer also answers paraphrases of
+that part, matched by embedding within the rest of the template.
+Frequently hit entries are promoted to a persistent tier on disk.
+"""
+
+import hashlib
+import logging
+import os
+import threading
+from collections import OrderedDict
+from typing import Dict, List, Any, Optional, Tuple
+
+from .knowledge_repository import EMBEDDING_BLOCK_ROWS, EMBEDDING_MODEL_NAME, _dumps, _loads, get_embedding_model
+
+logger = logging.getLogger(__name__)
+
+SEMANTIC_CACHE_THRESHOLD = 0.87  # Minimum cosine similarity for a cache hit
+SEMANTIC_CACHE_CAPACITY = 1000   # Entries kept in memory per request kind
+SEMANTIC_CACHE_PROMOTE_HITS = 3  # Hits after which an entry is persisted
+EXACT_CACHE_CAPACITY = 4096      # Identical-prompt entries kept in memory
+DEFAULT_SEMANTIC_CACHE_PATH = "semantic_cache.jsonl"  # Relative to the working directory, like the knowledge base
+
+class _NamespaceStore:
+    """
+    Cached responses of one kind of request (model and system prompt), in
+    fixed slots of a preallocated embedding matrix. With use_int8 the
+    normalized embeddings are stored as int8 rows with a float32 scale each.
+    """
+
+    __slots__ = ("embeddings", "scales", "scores", "size", "responses", "hits", "last_used", "persisted")
+
+    def __init__(self, capacity: int, dimensions: int, use_int8: bool = True):
+        import numpy as np
+
+        self.embeddings = np.zeros((capacity, dimensions), dtype=np.int8 if use_int8 else np.float32)
+        self.scales = np.ones(capacity, dtype=np.float32) if use_int8 else None  # per-row dequantization scales
+        self.scores = np.empty(capacity, dtype=np.float32)  # similarity buffer reused by lookups
+        self.size = 0
+        self.responses: List[bytes] = []    # JSON-encoded responses, by slot
+        self.hits: List[int] = []           # cache hits, by slot
+        self.last_used: List[int] = []      # cache clock of the last use, by slot
+        self.persisted: List[bool] = []     # whether the slot is in the persistent tier
+
+    def insert(self, embedding, response: bytes, clock: int, persisted: bool = False):
+        """Stores a response, evicting the least recently used slot when full."""
+        if self.size < len(self.embeddings):
+            slot = self.size
+            self.size += 1
+            self.responses.append(response)
+            self.hits.append(0)
+            self.last_used.append(clock)
+            self.persisted.append(persisted)
+        else:
+            slot = min(range(self.size), key=self.last_used.__getitem__)
+            self.responses[slot] = response
+            self.hits[slot] = 0
+            self.last_used[slot] = clock
+            self.persisted[slot] = persisted
+        if self.scales is None:
+            self.embeddings[slot] = embedding
+            return
+        import numpy as np
+
+        embedding = np.asarray(embedding, dtype=np.float32)
+        scale = float(np.abs(embedding).max()) / 127 or 1.0
+        self.embeddings[slot] = np.rint(embedding / scale)
+        self.scales[slot] = scale
+
+    def similarities(self, query):
+        """Cosine similarities between the normalized query and every stored embedding."""
+        import numpy as np
+
+        rows = self.embeddings[:self.size]
+        scores = self.scores[:self.size]
+        if self.scales is None:
+            return np.matmul(rows, query, out=scores)
+        # Dequantize in blocks so the float32 copy stays cache-sized
+        for start in range(0, self.size, EMBEDDING_BLOCK_ROWS):
+            block = rows[start:start + EMBEDDING_BLOCK_ROWS]
+            np.matmul(block.astype(np.float32), query, out=scores[start:start + len(block)])
+        scores *= self.scales[:self.size]
+        return scores
+
+    def embedding(self, slot: int) -> List[float]:
+        """The stored embedding of a slot, dequantized."""
+        row = self.embeddings[slot]
+        if self.scales is None:
+            return row.tolist()
+        return (row * self.scales[slot]).tolist()
+
+class SemanticResponseCache:
+    """
+    In-memory semantic cache of LLM responses with an append-only JSONL tier
+    for entries hit often enough to be worth keeping across restarts.
+    Semantic matching needs sentence-transformers and a semantic_text naming
+    the variable part of the prompt; otherwise only identical prompts hit.
+    """
+
+    def __init__(self, threshold: float = SEMANTIC_CACHE_THRESHOLD, capacity: int = SEMANTIC_CACHE_CAPACITY,
+                 path: Optional[str] = DEFAULT_SEMANTIC_CACHE_PATH,
+                 promote_hits: int = SEMANTIC_CACHE_PROMOTE_HITS, use_int8: bool = True):
+        self.threshold = threshold
+        self.capacity = capacity
+        self.path = path
+        self.promote_hits = promote_hits
+        self.use_int8 = use_int8  # Store embeddings as int8, a quarter of the memory scanned per lookup
+        self._stores: Dict[str, _NamespaceStore] = {}
+        self._exact: "OrderedDict[bytes, bytes]" = OrderedDict()  # prompt digest -> response, LRU order
+        self._clock = 0
+        self._lock = threading.Lock()
+        self._persistent_loaded = False
+
+    @staticmethod
+    def _request_key(request: Dict[str, Any]) -> Tuple[str, str]:
+        """Splits a chat completion request into its namespace and its prompt."""
+        messages = request['messages']
+        namespace = "\n".join([request['model']] + [message['content'] for message in messages[:-1]])
+        return namespace, messages[-1]['content']
+
+    @classmethod
+    def _semantic_key(cls, request: Dict[str, Any], semantic_text: str) -> Tuple[str, str]:
+        """
+        Splits a request into its semantic namespace, which holds the prompt
+        template with semantic_text cut out, and the text to embed. Keeping the
+        shared template out of the embedding stops boilerplate from making
+        different topics look alike.
+        """
+        namespace, prompt = cls._request_key(request)
+        template = prompt.replace(semantic_text, "\0", 1)
+        return f"{namespace}\n{template}", semantic_text
+
+    @staticmethod
+    def _exact_key(namespace: str, prompt: str) -> bytes:
+        """Digest identifying a prompt exactly within its namespace."""
+        return hashlib.blake2b(f"{namespace}\0{prompt}".encode("utf-8"), digest_size=16).digest()
+
+    def lookup(self, request: Dict[str, Any], semantic_text: Optional[str] = None) -> Tuple[Optional[Any], Any]:
+        """
+        Looks up the response of an identical cached prompt, or else of the
+        one whose semantic_text is most similar.
+
+        Args:
+            request: Keyword arguments for chat.completions.create
+            semantic_text: Variable part of the last message to match semantically;
+                None restricts the lookup to identical prompts
+
+        Returns:
+            Tuple of the cached response (None on a miss) and the prompt
+            embedding to pass to store (None when embeddings are unavailable)
+        """
+        namespace, prompt = self._request_key(request)
+        exact_key = self._exact_key(namespace, prompt)
+        with self._lock:
+            response = self._exact.get(exact_key)
+            if response is not None:
+                self._exact.move_to_end(exact_key)
+                return _loads(response), None
+
+        if semantic_text is None:
+            return None, None
+        model = get_embedding_model()
+        if model is None:
+            return None, None
+        import numpy as np
+
+        namespace, text = self._semantic_key(request, semantic_text)
+        embedding = np.asarray(model.encode([text], normalize_embeddings=True)[0], dtype=np.float32)
+        promoted = None
+        with self._lock:
+            self._load_persistent(len(embedding))
+            store = self._stores.get(namespace)
+            if store is None or not store.size:
+                return None, embedding
+            scores = store.similarities(embedding)
+            slot = int(scores.argmax())
+            if scores[slot] < self.threshold:
+                return None, embedding
+            self._clock += 1
+            store.last_used[slot] = self._clock
+            store.hits[slot] += 1
+            response = store.responses[slot]
+            if store.hits[slot] >= self.promote_hits and not store.persisted[slot]:
+                store.persisted[slot] = True
+                promoted = (store.embedding(slot), response)
+        if promoted is not None:
+            self._persist(namespace, *promoted)
+        return _loads(response), embedding
+
+    def store(self, request: Dict[str, Any], response: Any, embedding, semantic_text: Optional[str] = None):
+        """
+        Caches the parsed response of a request.
+
+        Args:
+            request: Keyword arguments for chat.completions.create
+            response: JSON-serializable parsed response
+            embedding: Embedding of semantic_text returned by lookup
+            semantic_text: The semantic_text passed to lookup
+        """
+        namespace, prompt = self._request_key(request)
+        encoded = _dumps(response)
+        with self._lock:
+            self._exact[self._exact_key(namespace, prompt)] = encoded
+            if len(self._exact) > EXACT_CACHE_CAPACITY:
+                self._exact.popitem(last=False)
+            if embedding is None or semantic_text is None:
+                return
+            namespace, _ = self._semantic_key(request, semantic_text)
+            store = self._stores.get(namespace)
+            if store is None:
+                store = self._stores[namespace] = _NamespaceStore(self.capacity, len(embedding), self.use_int8)
+            self._clock += 1
+            store.insert(embedding, encoded, self._clock)
+
+    def _persist(self, namespace: str, embedding: List[float], response: bytes):
+        """Appends a promoted entry to the persistent tier."""
+        if not self.path:
+            return
+        entry = {
+            'model': EMBEDDING_MODEL_NAME,
+            'namespace': namespace,
+            'embedding': embedding,
+            'response': response.decode("utf-8")
+        }
+        try:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, 'ab') as f:
+                f.write(_dumps(entry) + b"\n")
+        except OSError as e:
+            logger.error(f"Failed to persist semantic cache entry: {str(e)}")
+
+    def _load_persistent(self, dimensions: int):
+        """Loads the persistent tier into memory on first use. Called with the lock held."""
+        if self._persistent_loaded:
+            return
+        self._persistent_loaded = True
+        if not self.path or not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, 'rb') as f:
+                for line in f:
+                    entry = _loads(line)
+                    if entry.get('model') != EMBEDDING_MODEL_NAME or len(entry['embedding']) != dimensions:
+                        continue
+                    store = self._stores.get(entry['namespace'])
+                    if store is None:
+                        store = self._stores[entry['namespace']] = _NamespaceStore(self.capacity, dimensions, self.use_int8)
+                    self._clock += 1
+                    store.insert(entry['embedding'], entry['response'].encode("utf-8"), self._clock, persisted=True)
+            logger.info(f"Semantic cache loaded from {self.path}")
+        except (OSError, ValueError, KeyError) as e:
+            logger.error(f"Failed to load semantic cache: {str(e)}")
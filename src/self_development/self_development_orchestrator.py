@@ -5,22 +5,87 @@ This module acts as the central control unit for all self-development activities
 coordinating code generation, analysis, research, and deployment.
 """
 
+import asyncio
+import atexit
+import hashlib
 import logging
+import re
+import threading
 import time
-from typing import Dict, Any, Optional
-from .code_generator import CodeGenerationEngine
-from .code_analyzer import CodeAnalyzer
-from .knowledge_repository import KnowledgeRepository
-from .performance_analyzer import PerformanceAnalyzer
-from .research_agent import ResearchAgent
-from .validation_framework import ValidationFramework
-from .deployment_manager import DeploymentManager
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime
+from functools import cached_property
+from typing import Dict, List, Any, Optional
 # from .research_agent import ResearchAgent # Will be implemented in a later phase
 # from .secure_execution_environment import SecureExecutionEnvironment # Will be implemented in a later phase
 # from .version_control_deployment_manager import VersionControlDeploymentManager # Will be implemented in a later phase
 
 logger = logging.getLogger(__name__)
 
+PLAN_CACHE_SIZE = 256  # Goal fingerprints whose plan type is remembered
+PERFORMANCE_MONITOR_INTERVAL = 5  # Seconds between samples of the background performance monitor
+HISTORY_BATCH_SIZE = 32              # Buffered development records that trigger a write
+HISTORY_FLUSH_INTERVAL_SECONDS = 1.0 # Longest a buffered development record waits
+
+# Fields a planned task must carry, by task name, checked before its handler runs
+TASK_REQUIRED_FIELDS = {
+    "generate_skill": ("skill_name", "description", "parameters"),
+    "generate_code": ("objective", "code_type"),
+    "modify_code_for_performance": ("objective",),
+    "modify_code_for_bug_fix": ("objective",),
+    "conduct_research": ("topic",)
+}
+
+# Plan type keywords, one lookahead per type in priority order, so a single match
+# anchored at the start yields the first type whose keywords appear as whole words in the goal
+GOAL_PATTERN = re.compile(
+    r"(?=.*?\b(?P<new_skill>new skill|add capability)\b)"
+    r"|(?=.*?\b(?P<performance>improve performance|optimize)\b)"
+    r"|(?=.*?\b(?P<bug_fix>fix bug|resolve issue)\b)"
+    r"|(?=.*?\b(?P<research>research|find information)\b)"
+    r"|(?=.*?\b(?P<validation>validate code|test code)\b)"
+    r"|(?=.*?\b(?P<deployment>deploy)\b)"
+)
+
+@dataclass(slots=True)
+class TaskResult:
+    """
+    Result of a single development task, kept in the development record while
+    the cycle runs. Converted to a dictionary when the record is stored or returned.
+    """
+    name: Optional[str]
+    status: str = "failed"
+    success: bool = False
+    output: Dict[str, Any] = field(default_factory=dict)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the result to a dictionary, omitting the error when unset."""
+        result = {"name": self.name, "status": self.status, "success": self.success, "output": self.output}
+        if self.error is not None:
+            result["error"] = self.error
+        return result
+
+def _normalize_goal(goal: str) -> str:
+    """Lowercases a goal, strips quotes and collapses whitespace."""
+    return " ".join(goal.lower().replace('"', "").replace("'", "").split())
+
+class _subsystem(cached_property):
+    """
+    cached_property built under the orchestrator's subsystem lock, so threads
+    sharing an orchestrator never build a subsystem twice. cached_property
+    itself no longer locks as of Python 3.12. Once built, the instance
+    attribute shadows the descriptor and reads take no lock.
+    """
+
+    def __get__(self, instance, owner=None):
+        if instance is None:
+            return self
+        with instance._subsystem_lock:
+            return super().__get__(instance, owner)
+
 class SelfDevelopmentOrchestrator:
     """
     The SDO interprets high-level goals, breaks them into tasks, and coordinates
@@ -28,23 +93,107 @@ class SelfDevelopmentOrchestrator:
     """
 
     def __init__(self):
-        self.knowledge_repository = KnowledgeRepository()
-        self.code_generator = CodeGenerationEngine(knowledge_repository=self.knowledge_repository)
-        self.code_analyzer = CodeAnalyzer()
-        self.performance_analyzer = PerformanceAnalyzer(knowledge_repository=self.knowledge_repository)
-        self.research_agent = ResearchAgent(knowledge_repository=self.knowledge_repository)
-        self.validation_framework = ValidationFramework(knowledge_repository=self.knowledge_repository)
-        self.deployment_manager = DeploymentManager(
-            knowledge_repository=self.knowledge_repository,
-            validation_framework=self.validation_framework
-        )
+        # The subsystems are properties, imported and built on first use;
+        # reentrant because building one subsystem builds those it depends on
+        self._subsystem_lock = threading.RLock()
         # self.see = SecureExecutionEnvironment()
         # self.vcdm = VersionControlDeploymentManager()
+        # Plan type of recently seen goals, by goal fingerprint, in LRU order
+        self._plan_cache: "OrderedDict[str, str]" = OrderedDict()
+        self._plan_cache_lock = threading.Lock()
+        self._planners = {
+            "new_skill": self._plan_new_skill,
+            "performance": self._plan_performance,
+            "bug_fix": self._plan_bug_fix,
+            "research": self._plan_research,
+            "validation": self._plan_validation,
+            "deployment": self._plan_deployment,
+            "default": self._plan_default
+        }
+        self._task_handlers = {
+            "generate_skill": self._task_generate_skill,
+            "generate_code": self._task_generate_code,
+            "modify_code_for_performance": self._task_modify_code,
+            "modify_code_for_bug_fix": self._task_modify_code,
+            "analyze_performance": self._task_analyze_performance,
+            "identify_improvement_opportunities": self._task_identify_improvement_opportunities,
+            "analyze_bug": self._task_analyze_bug,
+            "conduct_research": self._task_conduct_research,
+            "validate_code": self._task_validate_code,
+            "validate_generated_code": self._task_validate_generated_code,
+            "deploy_code": self._task_deploy_code,
+            "deploy_validated_code": self._task_deploy_validated_code
+        }
+        # Development records waiting to be written to the knowledge repository in one batch
+        self._history_buffer: deque = deque()
+        self._history_pending = threading.Event()
+        self._history_full = threading.Event()
+        self._history_flush_lock = threading.Lock()  # Held while a batch is drained and written
+        self._history_flusher = threading.Thread(
+            target=self._history_flush_loop, name="sdo-history-flusher", daemon=True
+        )
+        self._history_flusher.start()
+        atexit.register(self._flush_history)
         logger.info("Self-Development Orchestrator initialized")
 
+    @_subsystem
+    def knowledge_repository(self):
+        """The knowledge repository shared by all subsystems."""
+        from .knowledge_repository import KnowledgeRepository
+        repository = KnowledgeRepository()
+        # Exit hooks run in reverse order: flush buffered records before the repository closes
+        atexit.register(self._flush_history)
+        return repository
+
+    @_subsystem
+    def code_generator(self):
+        """The code generation engine."""
+        from .code_generator import CodeGenerationEngine
+        return CodeGenerationEngine(knowledge_repository=self.knowledge_repository)
+
+    @_subsystem
+    def code_analyzer(self):
+        """The static code analyzer."""
+        from .code_analyzer import CodeAnalyzer
+        return CodeAnalyzer()
+
+    @_subsystem
+    def performance_analyzer(self):
+        """
+        The system performance analyzer. Its monitor runs from first use until
+        exit, keeping the analyzer's metrics ring filled for performance tasks.
+        """
+        from .performance_analyzer import PerformanceAnalyzer
+        analyzer = PerformanceAnalyzer(knowledge_repository=self.knowledge_repository)
+        analyzer.start_monitoring(interval_seconds=PERFORMANCE_MONITOR_INTERVAL)
+        atexit.register(analyzer.stop_monitoring)
+        return analyzer
+
+    @_subsystem
+    def research_agent(self):
+        """The research agent."""
+        from .research_agent import ResearchAgent
+        return ResearchAgent(knowledge_repository=self.knowledge_repository)
+
+    @_subsystem
+    def validation_framework(self):
+        """The code validation framework."""
+        from .validation_framework import ValidationFramework
+        return ValidationFramework(knowledge_repository=self.knowledge_repository)
+
+    @_subsystem
+    def deployment_manager(self):
+        """The deployment manager, validating through the validation framework."""
+        from .deployment_manager import DeploymentManager
+        return DeploymentManager(
+            knowledge_repository=self.knowledge_repository,
+            validation_framework=self.validation_framework
+        )
+
     def initiate_self_development(self, goal: str, priority: str = "medium") -> Dict[str, Any]:
         """
-        Initiates a self-development cycle based on a high-level goal.
+        Initiates a self-development cycle based on a high-level goal, running
+        initiate_self_development_async to completion from synchronous code.
 
         Args:
             goal: A natural language description of the development objective.
@@ -53,246 +202,423 @@ class SelfDevelopmentOrchestrator:
         Returns:
             A dictionary summarizing the initiated development process.
         """
-        logger.info(f"Initiating self-development with goal: \'{goal}\' (Priority: {priority})")
+        coroutine = self.initiate_self_development_async(goal, priority)
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return asyncio.run(coroutine)
+        # Called from inside an event loop: run on a separate thread with its own loop
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            return executor.submit(asyncio.run, coroutine).result()
+
+    async def initiate_self_development_async(self, goal: str, priority: str = "medium") -> Dict[str, Any]:
+        """
+        Initiates a self-development cycle based on a high-level goal. Planned
+        tasks whose dependencies have succeeded run concurrently, with blocking
+        subsystem calls on worker threads.
+
+        Args:
+            goal: A natural language description of the development objective.
+            priority: The priority of this development task (low, medium, high).
+
+        Returns:
+            A dictionary summarizing the initiated development process.
+        """
+        logger.info("Initiating self-development with goal: '%s' (Priority: %s)", goal, priority)
         development_record = {
             "goal": goal,
             "priority": priority,
             "status": "initiated",
             "tasks": [],
-            "timestamp": datetime.now().isoformat()
+            "timestamp": datetime.now().isoformat(),
+            # Working state for later tasks, dropped before the record is stored
+            "_now_ns": time.time_ns(),    # cycle start, for names derived from the time
+            "_by_name": {},               # task name -> indices of its results in tasks
+            "_last_generated_code": None  # code of the last successful generate_code task
         }
 
         try:
             # Step 1: Interpret Goal and Plan Tasks
             tasks = self._interpret_goal_and_plan_tasks(goal)
-            development_record["tasks"] = tasks
             development_record["status"] = "planning_complete"
-            logger.info(f"Planned {len(tasks)} tasks for goal: {goal}")
-
-            # Step 2: Execute Tasks (simplified for initial implementation)
-            for task in tasks:
-                task_result = self._execute_development_task(task, development_record)
-                development_record["tasks"].append(task_result)
-                if not task_result.get("success", False):
-                    development_record["status"] = "failed"
-                    development_record["error"] = f"Task '{task.get('name', 'Unknown')}' failed."
-                    break
+            logger.info("Planned %d tasks for goal: %s", len(tasks), goal)
+
+            # Step 2: Execute Tasks, each as soon as its dependencies have succeeded
+            error = await self._run_task_graph(tasks, development_record)
+            if error:
+                development_record["status"] = "failed"
+                development_record["error"] = error
             else:
                 development_record["status"] = "completed"
 
         except Exception as e:
-            logger.error(f"Self-development process failed for goal \'{goal}\': {str(e)}")
+            logger.error("Self-development process failed for goal '%s': %s", goal, e)
             development_record["status"] = "failed"
             development_record["error"] = str(e)
-
-        self.knowledge_repository.add_self_development_history(development_record)
-        logger.info(f"Self-development process for goal '{goal}' {development_record['status']}.")
+        finally:
+            development_record.pop("_by_name", None)
+            development_record.pop("_last_generated_code", None)
+            development_record.pop("_now_ns", None)
+            development_record["tasks"] = [task_result.to_dict() for task_result in development_record["tasks"]]
+
+        self._history_buffer.append(development_record)
+        self._history_pending.set()
+        if len(self._history_buffer) >= HISTORY_BATCH_SIZE:
+            self._history_full.set()
+        logger.info("Self-development process for goal '%s' %s.", goal, development_record['status'])
         return development_record
 
+    async def _run_task_graph(self, tasks: List[Dict[str, Any]], development_record: Dict[str, Any]) -> Optional[str]:
+        """
+        Runs planned tasks concurrently in dependency order. A task starts once
+        every planned task named in its dependencies has succeeded. After a
+        failure no new task starts, and the tasks already running finish.
+
+        Args:
+            tasks: The planned tasks
+            development_record: The record receiving the task results
+
+        Returns:
+            Why the cycle failed, or None when every task succeeded
+        """
+        planned = {task["name"] for task in tasks}
+        waiting = list(tasks)
+        running: Dict[asyncio.Future, Dict[str, Any]] = {}
+        succeeded = set()
+        error = None
+
+        while waiting or running:
+            if error is None:
+                ready = [
+                    task for task in waiting
+                    if all(name in succeeded for name in task.get("dependencies", ()) if name in planned)
+                ]
+                for task in ready:
+                    waiting.remove(task)
+                    running[asyncio.ensure_future(self._execute_development_task(task, development_record))] = task
+            if not running:
+                break
+            done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+            for future in done:
+                del running[future]
+                task_result = future.result()
+                self._record_task_result(task_result, development_record)
+                if task_result.success:
+                    succeeded.add(task_result.name)
+                elif error is None:
+                    error = f"Task '{task_result.name}' failed."
+
+        if error is None and waiting:
+            error = f"Tasks with unmet dependencies: {', '.join(task['name'] for task in waiting)}"
+        return error
+
+    @staticmethod
+    def _record_task_result(task_result: TaskResult, development_record: Dict[str, Any]):
+        """
+        Appends a task result to the development record and updates the record's
+        lookups for later tasks.
+        """
+        development_record["_by_name"].setdefault(task_result.name, []).append(len(development_record["tasks"]))
+        development_record["tasks"].append(task_result)
+        if task_result.name == "generate_code" and task_result.success:
+            development_record["_last_generated_code"] = task_result.output.get("code", "")
+
+    def _history_flush_loop(self):
+        """
+        Background flusher: waits for a buffered development record, lets more
+        accumulate until HISTORY_BATCH_SIZE or HISTORY_FLUSH_INTERVAL_SECONDS,
+        then writes them all at once.
+        """
+        while True:
+            self._history_pending.wait()
+            self._history_full.wait(HISTORY_FLUSH_INTERVAL_SECONDS)
+            self._history_pending.clear()
+            self._history_full.clear()
+            self._flush_history()
+
+    def _flush_history(self):
+        """
+        Writes the buffered development records to the knowledge repository.
+        Returns once every record buffered before the call has been written,
+        including records another flush had already taken.
+        """
+        with self._history_flush_lock:
+            records = []
+            while self._history_buffer:
+                records.append(self._history_buffer.popleft())
+            if not records:
+                return
+            try:
+                self.knowledge_repository.add_self_development_history_batch(records)
+            except Exception as e:
+                logger.error("Failed to store %d self-development records: %s", len(records), e)
+
+    def get_self_development_history(self, query: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Retrieves the self-development history, including cycles that finished
+        since the last background flush.
+        
+        Args:
+            query: Optional substring query filtering the records
+            
+        Returns:
+            List of development records
+        """
+        self._flush_history()
+        return self.knowledge_repository.get_self_development_history(query)
+
     def _interpret_goal_and_plan_tasks(self, goal: str) -> List[Dict[str, Any]]:
         """
         Interprets the high-level goal and breaks it down into a series of actionable tasks.
         This is a simplified version; a real SDO would use LLMs for complex planning.
+        The plan type of recurring goals comes from a fingerprint cache; the
+        goal-specific task parameters are extracted on every call.
+        """
+        normalized = _normalize_goal(goal)
+        fingerprint = hashlib.blake2b(normalized.encode("utf-8"), digest_size=8).hexdigest()
+        with self._plan_cache_lock:
+            plan_type = self._plan_cache.get(fingerprint)
+            if plan_type is not None:
+                self._plan_cache.move_to_end(fingerprint)
+        if plan_type is None:
+            plan_type = self._classify_goal(normalized)
+            with self._plan_cache_lock:
+                self._plan_cache[fingerprint] = plan_type
+                if len(self._plan_cache) > PLAN_CACHE_SIZE:
+                    self._plan_cache.popitem(last=False)
+
+        return self._planners[plan_type](goal, normalized)
+
+    def _classify_goal(self, normalized: str) -> str:
+        """
+        Determines the plan type of a normalized goal, the key of its planner.
         """
-        tasks = []
-        goal_lower = goal.lower()
-
-        if "new skill" in goal_lower or "add capability" in goal_lower:
-            skill_name = goal_lower.split("new skill ")[-1].split(" ")[0].replace("\"", "") # Basic extraction
-            description = goal
-            tasks.append({"name": "generate_skill", "skill_name": skill_name, "description": description, "parameters": {}})
-        elif "improve performance" in goal_lower or "optimize" in goal_lower:
-            target_code = goal_lower.split("optimize ")[-1] if "optimize " in goal_lower else "existing code"
-            tasks.append({"name": "analyze_performance", "target": target_code})
-            tasks.append({"name": "identify_improvement_opportunities"})
-            tasks.append({"name": "modify_code_for_performance", "objective": goal})
-        elif "fix bug" in goal_lower or "resolve issue" in goal_lower:
-            bug_description = goal
-            tasks.append({"name": "analyze_bug", "description": bug_description})
-            tasks.append({"name": "modify_code_for_bug_fix", "objective": goal})
-        elif "research" in goal_lower or "find information" in goal_lower:
-            research_topic = goal_lower.split("research ")[-1] if "research " in goal_lower else goal
-            tasks.append({"name": "conduct_research", "topic": research_topic, "depth": "medium"})
-        elif "validate code" in goal_lower or "test code" in goal_lower:
-            code_to_validate = goal_lower.split("validate ")[-1] if "validate " in goal_lower else "generated code"
-            tasks.append({"name": "validate_code", "code": code_to_validate, "validation_level": "comprehensive"})
-        elif "deploy code" in goal_lower or "deploy" in goal_lower:
-            deployment_target = goal_lower.split("deploy ")[-1] if "deploy " in goal_lower else "generated code"
-            tasks.append({"name": "deploy_code", "target": deployment_target, "strategy": "safe"})
-        else:
-            # Default to general code generation/modification with validation and deployment
-            tasks.append({"name": "generate_code", "objective": goal, "code_type": "auto"})
-            tasks.append({"name": "validate_generated_code", "validation_level": "standard"})
-            tasks.append({"name": "deploy_validated_code", "strategy": "safe"})
-
-        return tasks
-
-    def _execute_development_task(self, task: Dict[str, Any], development_record: Dict[str, Any]) -> Dict[str, Any]:
+        match = GOAL_PATTERN.match(normalized)
+        return match.lastgroup if match else "default"
+
+    def _plan_new_skill(self, goal: str, normalized: str) -> List[Dict[str, Any]]:
+        """Plans the generation of a new skill named in the goal."""
+        skill_name = normalized.split("new skill ")[-1].split(" ")[0] # Basic extraction
+        return [{"name": "generate_skill", "skill_name": skill_name, "description": goal, "parameters": {}}]
+
+    def _plan_performance(self, goal: str, normalized: str) -> List[Dict[str, Any]]:
+        """Plans a performance analysis followed by an optimizing modification."""
+        target_code = normalized.split("optimize ")[-1] if "optimize " in normalized else "existing code"
+        return [
+            {"name": "analyze_performance", "target": target_code},
+            {"name": "identify_improvement_opportunities"},
+            {"name": "modify_code_for_performance", "objective": goal,
+             "dependencies": ["analyze_performance", "identify_improvement_opportunities"]}
+        ]
+
+    def _plan_bug_fix(self, goal: str, normalized: str) -> List[Dict[str, Any]]:
+        """Plans a bug analysis followed by a fixing modification."""
+        return [
+            {"name": "analyze_bug", "description": goal},
+            {"name": "modify_code_for_bug_fix", "objective": goal, "dependencies": ["analyze_bug"]}
+        ]
+
+    def _plan_research(self, goal: str, normalized: str) -> List[Dict[str, Any]]:
+        """Plans targeted research on the topic named in the goal."""
+        research_topic = normalized.split("research ")[-1] if "research " in normalized else goal
+        return [{"name": "conduct_research", "topic": research_topic, "depth": "medium"}]
+
+    def _plan_validation(self, goal: str, normalized: str) -> List[Dict[str, Any]]:
+        """Plans a comprehensive validation of the code named in the goal."""
+        code_to_validate = normalized.split("validate ")[-1] if "validate " in normalized else "generated code"
+        return [{"name": "validate_code", "code": code_to_validate, "validation_level": "comprehensive"}]
+
+    def _plan_deployment(self, goal: str, normalized: str) -> List[Dict[str, Any]]:
+        """Plans a safe deployment of the target named in the goal."""
+        deployment_target = normalized.split("deploy ")[-1] if "deploy " in normalized else "generated code"
+        return [{"name": "deploy_code", "target": deployment_target, "strategy": "safe"}]
+
+    def _plan_default(self, goal: str, normalized: str) -> List[Dict[str, Any]]:
+        """Plans code generation followed by validation and deployment."""
+        # Default to general code generation/modification with validation and deployment
+        return [
+            {"name": "generate_code", "objective": goal, "code_type": "auto"},
+            {"name": "validate_generated_code", "validation_level": "standard", "dependencies": ["generate_code"]},
+            {"name": "deploy_validated_code", "strategy": "safe", "dependencies": ["validate_generated_code"]}
+        ]
+
+    async def _execute_development_task(self, task: Dict[str, Any], development_record: Dict[str, Any]) -> TaskResult:
         """
-        Executes a single development task.
+        Executes a single development task with the handler registered for its name,
+        after checking that the task carries the fields its handler reads.
         """
         task_name = task.get("name")
-        logger.info(f"Executing task: {task_name}")
-        result = {"name": task_name, "status": "failed", "success": False, "output": {}}
-
+        logger.info("Executing task: %s", task_name)
+        result = TaskResult(task_name)
+
+        handler = self._task_handlers.get(task_name)
+        if handler is None:
+            result.error = f"Unknown self-development task: {task_name}"
+            return result
+        missing = [name for name in TASK_REQUIRED_FIELDS.get(task_name, ()) if name not in task]
+        if missing:
+            result.error = f"Task '{task_name}' is missing required fields: {', '.join(missing)}"
+            return result
         try:
-            if task_name == "generate_skill":
-                gen_result = self.code_generator.generate_skill(
-                    task["skill_name"], task["description"], task["parameters"]
-                )
-                result["output"] = gen_result
-                result["success"] = gen_result["success"]
-                if gen_result["success"]:
-                    # In a real scenario, this would involve writing files and registering the skill
-                    logger.info(f"Generated skill {task["skill_name"]}. Schema: {gen_result["schema"]}")
-                    logger.info(f"Generated skill implementation: {gen_result["implementation"]}")
-                    # Placeholder for writing to file system and registering with orchestrator
-                    result["status"] = "completed"
-
-            elif task_name == "generate_code":
-                gen_result = self.code_generator.generate_code(
-                    task["objective"], task["code_type"], task.get("context")
-                )
-                result["output"] = gen_result
-                result["success"] = gen_result["success"]
-                if gen_result["success"]:
-                    logger.info(f"Generated code for objective: {task["objective"]}")
-                    result["status"] = "completed"
-
-            elif task_name == "modify_code_for_performance" or task_name == "modify_code_for_bug_fix":
-                # This would require fetching the code to modify first
-                # For now, we'll simulate with a placeholder
-                existing_code = "# Placeholder for existing code to modify"
-                mod_result = self.code_generator.modify_code(
-                    existing_code, task["objective"]
-                )
-                result["output"] = mod_result
-                result["success"] = mod_result["success"]
-                if mod_result["success"]:
-                    logger.info(f"Modified code for objective: {task["objective"]}")
-                    result["status"] = "completed"
-
-            elif task_name == "analyze_performance":
-                # In a real scenario, this would involve running target code in SEE and then analyzing
-                # For now, we will collect system metrics and analyze trends
-                self.performance_analyzer.start_monitoring(interval_seconds=5) # Start monitoring
-                time.sleep(10) # Simulate some activity
-                metrics = self.performance_analyzer.collect_system_metrics()
-                self.performance_analyzer.record_metrics(metrics)
-                analysis_result = self.performance_analyzer.analyze_performance_trends(hours_back=1)
-                self.performance_analyzer.stop_monitoring()
-                result["output"] = analysis_result
-                result["success"] = True
-                result["status"] = "completed"
-
-            elif task_name == "identify_improvement_opportunities":
-                opportunities = self.performance_analyzer.identify_improvement_opportunities()
-                result["output"] = opportunities
-                result["success"] = True
-                result["status"] = "completed"
-
-            elif task_name == "analyze_bug":
-                # This would involve analyzing logs and code
-                # For now, simulate with placeholder
-                analysis_result = self.code_analyzer.analyze_code(
-                    "def buggy_func(): return 1/0", language="python"
-                )
-                result["output"] = analysis_result
-                result["success"] = True # Assume success for placeholder
-                result["status"] = "completed"
-
-            elif task_name == "conduct_research":
-                research_result = self.research_agent.conduct_targeted_research(
-                    task["topic"], depth=task.get("depth", "medium")
-                )
-                result["output"] = research_result
-                result["success"] = research_result["status"] == "completed"
-                result["status"] = "completed" if result["success"] else "failed"
-
-            elif task_name == "validate_code":
-                # Validate specific code
-                code_to_validate = task.get("code", "# No code provided")
-                validation_result = self.validation_framework.validate_code(
-                    code_to_validate, 
-                    language="python", 
-                    validation_level=task.get("validation_level", "standard")
-                )
-                result["output"] = validation_result
-                result["success"] = validation_result["passed"]
-                result["status"] = "completed"
-
-            elif task_name == "validate_generated_code":
-                # Validate the last generated code from the development record
-                last_generated_code = None
-                for prev_task in development_record.get("tasks", []):
-                    if prev_task.get("name") == "generate_code" and prev_task.get("success"):
-                        last_generated_code = prev_task.get("output", {}).get("code", "")
-                        break
-                
-                if last_generated_code:
-                    validation_result = self.validation_framework.validate_code(
-                        last_generated_code, 
-                        language="python", 
-                        validation_level=task.get("validation_level", "standard")
-                    )
-                    result["output"] = validation_result
-                    result["success"] = validation_result["passed"]
-                    result["status"] = "completed"
-                else:
-                    result["error"] = "No generated code found to validate"
-                    result["success"] = False
-
-            elif task_name == "deploy_code":
-                # Deploy specific code
-                code_to_deploy = task.get("code", "# No code provided")
-                target_file = task.get("target", "generated_code.py")
-                deployment_result = self.deployment_manager.deploy_code(
-                    code_to_deploy,
-                    target_file,
-                    strategy=task.get("strategy", "safe"),
-                    validation_required=True
-                )
-                result["output"] = deployment_result
-                result["success"] = deployment_result["status"] == "completed"
-                result["status"] = "completed" if result["success"] else "failed"
-
-            elif task_name == "deploy_validated_code":
-                # Deploy the last validated code from the development record
-                last_validated_code = None
-                for prev_task in reversed(development_record.get("tasks", [])):
-                    if prev_task.get("name") == "validate_generated_code" and prev_task.get("success"):
-                        # Find the corresponding generated code
-                        for gen_task in development_record.get("tasks", []):
-                            if gen_task.get("name") == "generate_code" and gen_task.get("success"):
-                                last_validated_code = gen_task.get("output", {}).get("code", "")
-                                break
-                        break
-                
-                if last_validated_code:
-                    target_file = f"self_generated_{int(datetime.now().timestamp())}.py"
-                    deployment_result = self.deployment_manager.deploy_code(
-                        last_validated_code,
-                        target_file,
-                        strategy=task.get("strategy", "safe"),
-                        validation_required=False  # Already validated
-                    )
-                    result["output"] = deployment_result
-                    result["success"] = deployment_result["status"] == "completed"
-                    result["status"] = "completed" if result["success"] else "failed"
-                else:
-                    result["error"] = "No validated code found to deploy"
-                    result["success"] = False
-
-            else:
-                result["error"] = f"Unknown self-development task: {task_name}"
-
+            await handler(task, development_record, result)
         except Exception as e:
-            logger.error(f"Error during task \'{task_name}\': {str(e)}")
-            result["error"] = str(e)
+            logger.error("Error during task '%s': %s", task_name, e)
+            result.error = str(e)
 
         return result
 
-from datetime import datetime
-from typing import List
-
+    async def _task_generate_skill(self, task: Dict[str, Any], development_record: Dict[str, Any], result: TaskResult):
+        """Generates a new skill's schema and implementation."""
+        skill_name = task["skill_name"]
+        gen_result = await asyncio.to_thread(
+            self.code_generator.generate_skill, skill_name, task["description"], task["parameters"]
+        )
+        success = gen_result["success"]
+        result.output = gen_result
+        result.success = success
+        if success:
+            # In a real scenario, this would involve writing files and registering the skill
+            logger.info("Generated skill %s", skill_name)
+            # Schema and implementation can be kilobytes long, so they are only formatted for debugging
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Generated skill schema: %s", gen_result["schema"])
+                logger.debug("Generated skill implementation: %s", gen_result["implementation"])
+            # Placeholder for writing to file system and registering with orchestrator
+            result.status = "completed"
+
+    async def _task_generate_code(self, task: Dict[str, Any], development_record: Dict[str, Any], result: TaskResult):
+        """Generates code for the task's objective."""
+        objective = task["objective"]
+        gen_result = await asyncio.to_thread(
+            self.code_generator.generate_code, objective, task["code_type"], task.get("context")
+        )
+        success = gen_result["success"]
+        result.output = gen_result
+        result.success = success
+        if success:
+            logger.info("Generated code for objective: %s", objective)
+            result.status = "completed"
+
+    async def _task_modify_code(self, task: Dict[str, Any], development_record: Dict[str, Any], result: TaskResult):
+        """Modifies existing code for a performance or bug fix objective."""
+        # This would require fetching the code to modify first
+        # For now, we'll simulate with a placeholder
+        existing_code = "# Placeholder for existing code to modify"
+        objective = task["objective"]
+        mod_result = await asyncio.to_thread(self.code_generator.modify_code, existing_code, objective)
+        success = mod_result["success"]
+        result.output = mod_result
+        result.success = success
+        if success:
+            logger.info("Modified code for objective: %s", objective)
+            result.status = "completed"
+
+    async def _task_analyze_performance(self, task: Dict[str, Any], development_record: Dict[str, Any], result: TaskResult):
+        """Analyzes the performance trends sampled by the background monitor."""
+        # In a real scenario, this would involve running target code in SEE and then analyzing
+        # For now, we will analyze the system metrics trends, including a sample taken now
+        analyzer = self.performance_analyzer
+        metrics = await asyncio.to_thread(analyzer.collect_system_metrics)
+        analyzer.record_metrics(metrics)
+        analysis_result = await asyncio.to_thread(analyzer.analyze_performance_trends, hours_back=1)
+        result.output = analysis_result
+        result.success = True
+        result.status = "completed"
+
+    async def _task_identify_improvement_opportunities(self, task: Dict[str, Any], development_record: Dict[str, Any],
+                                                       result: TaskResult):
+        """Lists improvement opportunities found by the performance analyzer."""
+        result.output = await asyncio.to_thread(self.performance_analyzer.identify_improvement_opportunities)
+        result.success = True
+        result.status = "completed"
+
+    async def _task_analyze_bug(self, task: Dict[str, Any], development_record: Dict[str, Any], result: TaskResult):
+        """Analyzes the code behind a reported bug."""
+        # This would involve analyzing logs and code
+        # For now, simulate with placeholder
+        result.output = await asyncio.to_thread(
+            self.code_analyzer.analyze_code, "def buggy_func(): return 1/0", language="python"
+        )
+        result.success = True # Assume success for placeholder
+        result.status = "completed"
 
+    async def _task_conduct_research(self, task: Dict[str, Any], development_record: Dict[str, Any], result: TaskResult):
+        """Researches the task's topic."""
+        research_result = await self.research_agent.conduct_targeted_research_async(
+            task["topic"], depth=task.get("depth", "medium")
+        )
+        success = research_result["status"] == "completed"
+        result.output = research_result
+        result.success = success
+        result.status = "completed" if success else "failed"
+
+    async def _task_validate_code(self, task: Dict[str, Any], development_record: Dict[str, Any], result: TaskResult):
+        """Validates the code given in the task."""
+        validation_result = await asyncio.to_thread(
+            self.validation_framework.validate_code,
+            task.get("code", "# No code provided"),
+            language="python",
+            validation_level=task.get("validation_level", "standard")
+        )
+        result.output = validation_result
+        result.success = validation_result["passed"]
+        result.status = "completed"
+
+    async def _task_validate_generated_code(self, task: Dict[str, Any], development_record: Dict[str, Any],
+                                            result: TaskResult):
+        """Validates the last generated code from the development record."""
+        last_generated_code = development_record.get("_last_generated_code")
+        if not last_generated_code:
+            result.error = "No generated code found to validate"
+            result.success = False
+            return
+        validation_result = await asyncio.to_thread(
+            self.validation_framework.validate_code,
+            last_generated_code,
+            language="python",
+            validation_level=task.get("validation_level", "standard")
+        )
+        result.output = validation_result
+        result.success = validation_result["passed"]
+        result.status = "completed"
+
+    async def _task_deploy_code(self, task: Dict[str, Any], development_record: Dict[str, Any], result: TaskResult):
+        """Deploys the code given in the task."""
+        deployment_result = await asyncio.to_thread(
+            self.deployment_manager.deploy_code,
+            task.get("code", "# No code provided"),
+            task.get("target", "generated_code.py"),
+            strategy=task.get("strategy", "safe"),
+            validation_required=True
+        )
+        success = deployment_result["status"] == "completed"
+        result.output = deployment_result
+        result.success = success
+        result.status = "completed" if success else "failed"
+
+    async def _task_deploy_validated_code(self, task: Dict[str, Any], development_record: Dict[str, Any],
+                                          result: TaskResult):
+        """Deploys the last validated code from the development record."""
+        last_validated_code = None
+        tasks = development_record.get("tasks", [])
+        validations = development_record.get("_by_name", {}).get("validate_generated_code", [])
+        if any(tasks[index].success for index in validations):
+            # Validation always checks the last generated code
+            last_validated_code = development_record.get("_last_generated_code")
+
+        if not last_validated_code:
+            result.error = "No validated code found to deploy"
+            result.success = False
+            return
+        target_file = f"self_generated_{development_record['_now_ns'] // 1_000_000_000}.py"
+        deployment_result = await asyncio.to_thread(
+            self.deployment_manager.deploy_code,
+            last_validated_code,
+            target_file,
+            strategy=task.get("strategy", "safe"),
+            validation_required=False  # Already validated
+        )
+        success = deployment_result["status"] == "completed"
+        result.output = deployment_result
+        result.success = success
+        result.status = "completed" if success else "failed"
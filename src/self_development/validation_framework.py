@@ -7,18 +7,291 @@ before deployment.
 """
 
 import os
+import atexit
+import copy
+import hashlib
 import json
 import logging
+import re
+import select
 import subprocess
+import threading
 import tempfile
 import shutil
+from collections import Counter, OrderedDict, deque
+from dataclasses import dataclass, field, fields
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
+from itertools import islice
 from typing import Dict, List, Any, Optional
 from datetime import datetime
 import ast
 import sys
 
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
 logger = logging.getLogger(__name__)
 
+AST_CACHE_SIZE = 128  # Parsed sources shared by the validation phases
+TEST_SOURCE_CACHE_SIZE = 256  # Generated test modules, by tested function names
+TEST_WORKER_PATH = os.path.join(os.path.dirname(os.path.abspath(__file__)), "_test_worker.py")
+UNIT_TEST_TIMEOUT = 30  # Seconds a unit test run may take
+VALIDATION_CACHE_SIZE = 256  # Validation results kept for unchanged code
+VALIDATION_PHASE_WORKERS = 4  # Threads running the phases after the syntax check
+VALIDATION_PHASE_TIMEOUT = 60  # Seconds those phases may take together
+TMPFS_TEST_DIR = "/dev/shm/jarvis_validation"  # In-memory home of generated test files on Linux
+KNOWLEDGE_BATCH_SIZE = 16  # Validation results written to the knowledge repository together
+
+# Default safety rules for code validation, shared by every framework until one updates its rules
+_SAFETY_RULES = {
+    'forbidden_imports': [
+        'os.system',
+        'subprocess.call',
+        'eval',
+        'exec',
+        '__import__',
+        'compile',
+        'open',  # Restricted file operations
+        'file',
+        'input',  # Restricted user input
+        'raw_input'
+    ],
+    'forbidden_patterns': [
+        r'rm\s+-rf',  # Dangerous shell commands
+        r'del\s+/[qsf]',  # Windows delete commands
+        r'format\s+c:',  # Format commands
+        r'shutdown',
+        r'reboot',
+        r'kill\s+-9',
+        r'pkill',
+        r'killall'
+    ],
+    'required_patterns': [
+        r'def\s+\w+\(',  # Functions should be properly defined
+        r'""".*?"""',   # Docstrings should be present
+    ],
+    'complexity_limits': {
+        'max_cyclomatic_complexity': 10,
+        'max_function_length': 50,
+        'max_nesting_depth': 4
+    }
+}
+
+@lru_cache(maxsize=AST_CACHE_SIZE)
+def _parse_python(code: str) -> ast.Module:
+    """
+    Parses Python source once for every validation phase that needs its tree.
+    The tree is shared between callers and must not be modified. Compiles
+    straight to an AST without the compiler flags inherited from this module.
+    """
+    return compile(code, '<validation>', 'exec', flags=ast.PyCF_ONLY_AST, dont_inherit=True)
+
+def _build_forbidden_automaton(forbidden_imports: List[str]):
+    """
+    Builds an Aho-Corasick automaton finding every forbidden import/function
+    in one pass over the code.
+
+    Args:
+        forbidden_imports: The forbidden items
+
+    Returns:
+        The automaton, or None when pyahocorasick is not installed
+    """
+    if ahocorasick is None or not forbidden_imports:
+        return None
+    automaton = ahocorasick.Automaton()
+    for forbidden in forbidden_imports:
+        automaton.add_word(forbidden, forbidden)
+    automaton.make_automaton()
+    return automaton
+
+def _compile_forbidden_patterns(forbidden_patterns: List[str]) -> re.Pattern:
+    """
+    Compiles the forbidden patterns into one case-insensitive regex. Each
+    pattern is an alternative named after its index, inside a lookahead so
+    that patterns overlapping in the code are all found.
+
+    Args:
+        forbidden_patterns: The forbidden regex patterns
+
+    Returns:
+        The compiled union of the patterns
+    """
+    alternatives = '|'.join(f'(?P<p{i}>{pattern})' for i, pattern in enumerate(forbidden_patterns))
+    return re.compile(f'(?=(?:{alternatives}))', re.IGNORECASE)
+
+@lru_cache(maxsize=TEST_SOURCE_CACHE_SIZE)
+def _cached_test_source(function_names: tuple) -> str:
+    """
+    Builds the basic test module for the given function names. The source
+    depends on nothing else, so unchanged code reuses its tests.
+    
+    Args:
+        function_names: Sorted names of the functions to test
+        
+    Returns:
+        String containing test code, empty when there are no functions
+    """
+    if not function_names:
+        return ""
+    
+    parts = ["import unittest\n\nclass TestGeneratedCode(unittest.TestCase):\n"]
+    for func_name in function_names:
+        # Generate a basic test
+        parts.append(f"""
+    def test_{func_name}(self):
+        # Basic test for {func_name}
+        try:
+            result = {func_name}()
+            self.assertIsNotNone(result, "Function should return a value")
+        except TypeError:
+            # Function might require arguments
+            pass
+        except Exception as e:
+            self.fail(f"Function {func_name} raised an exception: {{e}}")
+""")
+    parts.append("\nif __name__ == '__main__':\n    unittest.main()\n")
+    return ''.join(parts)
+
+# Matchers for the default rules, built once at import
+_FORBIDDEN_AUTOMATON = _build_forbidden_automaton(_SAFETY_RULES['forbidden_imports'])
+_FORBIDDEN_PATTERN_REGEX = _compile_forbidden_patterns(_SAFETY_RULES['forbidden_patterns'])
+
+class _FusedAnalyzer(ast.NodeVisitor):
+    """
+    Collects what the Python safety check and static analysis need from a
+    tree in a single traversal: dangerous calls, function and class counts,
+    function lengths and decision points.
+    """
+
+    # Issues reported for calls to dangerous builtins, by name
+    _DANGEROUS_CALLS = {
+        'eval': {
+            'type': 'dangerous_function',
+            'function': 'eval',
+            'severity': 'critical',
+            'message': "Dangerous function call: eval"
+        },
+        'exec': {
+            'type': 'dangerous_function',
+            'function': 'exec',
+            'severity': 'critical',
+            'message': "Dangerous function call: exec"
+        },
+        '__import__': {
+            'type': 'dynamic_import',
+            'severity': 'high',
+            'message': "Dynamic import detected: __import__"
+        }
+    }
+
+    def __init__(self):
+        self.safety_issues: List[Dict[str, Any]] = []
+        self.function_lengths: List[tuple] = []  # (name, lines) of each function
+        self.has_docstring = False
+        self.functions = 0
+        self.classes = 0
+        self.complexity = 0
+
+    def visit_Module(self, node: ast.Module):
+        self.has_docstring = bool(ast.get_docstring(node))
+        self.generic_visit(node)
+
+    def visit_Call(self, node: ast.Call):
+        # Only plain names have an id: calls to dangerous builtins and open
+        function_name = getattr(node.func, 'id', None)
+        issue = self._DANGEROUS_CALLS.get(function_name)
+        if issue is not None:
+            self.safety_issues.append(dict(issue))
+        elif function_name == 'open':
+            self._check_open(node)
+        self.generic_visit(node)
+
+    def _check_open(self, node: ast.Call):
+        # Allow read-only operations, flag write, append, create and update modes
+        mode = node.args[1] if len(node.args) > 1 else None
+        if mode is None:
+            mode = next((keyword.value for keyword in node.keywords if keyword.arg == 'mode'), None)
+        if isinstance(mode, ast.Constant) and isinstance(mode.value, str):
+            if any(flag in mode.value for flag in 'wax+'):
+                self.safety_issues.append({
+                    'type': 'file_write',
+                    'severity': 'medium',
+                    'message': "File write operation detected"
+                })
+
+    def visit_FunctionDef(self, node: ast.FunctionDef):
+        self.functions += 1
+        self.function_lengths.append((node.name, (node.end_lineno or node.lineno) - node.lineno))
+        self.generic_visit(node)
+
+    def visit_ClassDef(self, node: ast.ClassDef):
+        self.classes += 1
+        self.generic_visit(node)
+
+    def _visit_decision_point(self, node: ast.AST):
+        self.complexity += 1
+        self.generic_visit(node)
+
+    # Simple complexity calculation (count decision points)
+    visit_If = visit_For = visit_While = visit_Try = visit_With = _visit_decision_point
+
+@dataclass(slots=True)
+class ValidationResult:
+    """
+    Result of validating a piece of code, kept in the validation history.
+    Converted to a dictionary only when handed to callers or the knowledge repository.
+    """
+    code_hash: str
+    language: str
+    validation_level: str
+    timestamp: str
+    status: str = 'initiated'
+    passed: bool = False
+    safety_check: Dict[str, Any] = field(default_factory=lambda: {'passed': False, 'issues': []})
+    syntax_check: Dict[str, Any] = field(default_factory=lambda: {'passed': False, 'issues': []})
+    static_analysis: Dict[str, Any] = field(default_factory=lambda: {'passed': False, 'issues': []})
+    unit_tests: Dict[str, Any] = field(default_factory=lambda: {'passed': False, 'results': {}})
+    integration_tests: Dict[str, Any] = field(default_factory=lambda: {'passed': False, 'results': {}})
+    performance_tests: Dict[str, Any] = field(default_factory=lambda: {'passed': False, 'results': {}})
+    overall_score: float = 0.0
+    recommendations: List[str] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def update(self, values: Dict[str, Any]):
+        """Applies phase results, by field name, to the result."""
+        for key, value in values.items():
+            setattr(self, key, value)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Converts the result to a dictionary, omitting unset optional fields."""
+        result = {}
+        for f in fields(self):
+            value = getattr(self, f.name)
+            if value is not None:
+                result[f.name] = value
+        return result
+
+# Names of the calls the AST safety walk reports; without any of them in the text it finds nothing
+_SAFETY_CALL_NAMES = frozenset(_FusedAnalyzer._DANGEROUS_CALLS) | {'open'}
+
+def _content_hash(code: str) -> str:
+    """Stable digest of code, the same in every process unlike hash()."""
+    return hashlib.blake2b(code.encode('utf-8'), digest_size=16).hexdigest()
+
+def _stop_test_worker(process: subprocess.Popen):
+    """Stops a unit test worker, asking it to exit by closing its input first."""
+    if process.poll() is None:
+        try:
+            process.stdin.close()
+            process.wait(timeout=1)
+        except (OSError, subprocess.TimeoutExpired):
+            process.kill()
+            process.wait()
+
 class ValidationFramework:
     """
     The Validation Framework ensures that all autonomously generated or modified
@@ -27,53 +300,88 @@ class ValidationFramework:
 
     def __init__(self, knowledge_repository=None):
         self.knowledge_repository = knowledge_repository
-        self.validation_history = []
-        self.safety_rules = self._load_safety_rules()
+        self.validation_history: deque = deque(maxlen=100)  # Last 100 ValidationResult records
+        # Running statistics over the records in validation_history
+        self._passed_count = 0
+        self._score_sum = 0.0
+        self._language_counts: Counter = Counter()
+        self._history_lock = threading.Lock()
+        self.safety_rules = _SAFETY_RULES  # Copied before the first update
+        self._forbidden_automaton = _FORBIDDEN_AUTOMATON
+        self._forbidden_pattern_regex = _FORBIDDEN_PATTERN_REGEX
+        self._test_worker = None  # Spare worker for the next unit test run, started on the first one
+        self._test_worker_lock = threading.Lock()
+        self._test_dir = None  # Chosen on the first unit test run
+        self.parallel_phases = True  # Set to False to run the phases one after another, e.g. when debugging
+        self._phase_pool = None  # Started on the first parallel validation
+        self._validation_cache: "OrderedDict[tuple, ValidationResult]" = OrderedDict()  # LRU order
+        self._cache_lock = threading.Lock()
+        self._pending_knowledge_writes: deque = deque()  # Entries not yet written to the knowledge repository
+        self._knowledge_lock = threading.Lock()
+        if knowledge_repository:
+            atexit.register(self.flush_knowledge_writes)
         self.test_environments = {
             'python': self._setup_python_test_environment,
             'javascript': self._setup_javascript_test_environment
         }
         logger.info("Validation Framework initialized")
 
-    def _load_safety_rules(self) -> Dict[str, List[str]]:
+    def _find_forbidden_imports(self, code: str) -> List[str]:
+        """
+        Finds the forbidden imports/functions occurring in the code.
+        
+        Args:
+            code: The code to scan
+            
+        Returns:
+            The forbidden items found, in rule order
+        """
+        forbidden_imports = self.safety_rules['forbidden_imports']
+        if self._forbidden_automaton is None:
+            return [forbidden for forbidden in forbidden_imports if forbidden in code]
+        found = {forbidden for _, forbidden in self._forbidden_automaton.iter(code)}
+        return [forbidden for forbidden in forbidden_imports if forbidden in found]
+
+    def _find_forbidden_patterns(self, code: str) -> List[str]:
         """
-        Loads safety rules for code validation.
+        Finds the forbidden patterns matching the code in one regex pass.
         
+        Args:
+            code: The code to scan
+            
         Returns:
-            Dictionary containing safety rules by category
+            The matching patterns, in rule order
         """
+        forbidden_patterns = self.safety_rules['forbidden_patterns']
+        if not forbidden_patterns:
+            return []
+        found = {int(match.lastgroup[1:]) for match in self._forbidden_pattern_regex.finditer(code)}
+        return [pattern for i, pattern in enumerate(forbidden_patterns) if i in found]
+
+    def _scan_source(self, code: str) -> Dict[str, Any]:
+        """
+        Collects the text-level facts about the code that the validation
+        phases need, so each is read off the source once.
+        
+        Args:
+            code: The code to scan
+            
+        Returns:
+            Dictionary with the line count, the forbidden imports and patterns
+            found, in rule order, and whether the AST safety walk is needed
+        """
+        line_count = code.count('\n')
+        if code and not code.endswith('\n'):
+            line_count += 1  # Last line without a line break
+        forbidden_imports = self._find_forbidden_imports(code)
+        # The safety call names are usually forbidden imports too, already looked for
+        unscanned_names = _SAFETY_CALL_NAMES.difference(self.safety_rules['forbidden_imports'])
         return {
-            'forbidden_imports': [
-                'os.system',
-                'subprocess.call',
-                'eval',
-                'exec',
-                '__import__',
-                'compile',
-                'open',  # Restricted file operations
-                'file',
-                'input',  # Restricted user input
-                'raw_input'
-            ],
-            'forbidden_patterns': [
-                r'rm\s+-rf',  # Dangerous shell commands
-                r'del\s+/[qsf]',  # Windows delete commands
-                r'format\s+c:',  # Format commands
-                r'shutdown',
-                r'reboot',
-                r'kill\s+-9',
-                r'pkill',
-                r'killall'
-            ],
-            'required_patterns': [
-                r'def\s+\w+\(',  # Functions should be properly defined
-                r'""".*?"""',   # Docstrings should be present
-            ],
-            'complexity_limits': {
-                'max_cyclomatic_complexity': 10,
-                'max_function_length': 50,
-                'max_nesting_depth': 4
-            }
+            'line_count': line_count,
+            'forbidden_imports': forbidden_imports,
+            'forbidden_patterns': self._find_forbidden_patterns(code),
+            'needs_safety_walk': bool(_SAFETY_CALL_NAMES.intersection(forbidden_imports))
+                                 or any(name in code for name in unscanned_names)
         }
 
     def validate_code(self, code: str, language: str = "python", 
@@ -89,90 +397,154 @@ class ValidationFramework:
         Returns:
             Dictionary containing validation results
         """
+        code_hash = _content_hash(code)
+        cache_key = (code_hash, language, validation_level)
+        with self._cache_lock:
+            cached = self._validation_cache.get(cache_key)
+            if cached is not None:
+                self._validation_cache.move_to_end(cache_key)
+        if cached is not None:
+            logger.info(f"Reusing {validation_level} validation of unchanged {language} code")
+            validation_result = copy.deepcopy(cached)
+            validation_result.timestamp = datetime.now().isoformat()
+            return validation_result.to_dict()
+
+        validation_result = self._run_validation(code, code_hash, language, validation_level)
+        # A hung or dead test worker says nothing lasting about the code, so retry it next time
+        if validation_result.status != 'error' and not validation_result.unit_tests.get('transient_failure'):
+            with self._cache_lock:
+                self._validation_cache[cache_key] = copy.deepcopy(validation_result)
+                if len(self._validation_cache) > VALIDATION_CACHE_SIZE:
+                    self._validation_cache.popitem(last=False)
+        return validation_result.to_dict()
+
+    def _run_validation(self, code: str, code_hash: str, language: str, validation_level: str) -> ValidationResult:
+        """
+        Runs the validation phases for the given level on code not found in
+        the validation cache.
+        
+        Args:
+            code: The code to validate
+            code_hash: Content hash of the code
+            language: Programming language of the code
+            validation_level: Level of validation ("basic", "standard", "comprehensive")
+            
+        Returns:
+            The validation result
+        """
         logger.info(f"Starting {validation_level} validation for {language} code")
         
-        validation_result = {
-            'code_hash': hash(code),
-            'language': language,
-            'validation_level': validation_level,
-            'timestamp': datetime.now().isoformat(),
-            'status': 'initiated',
-            'passed': False,
-            'safety_check': {'passed': False, 'issues': []},
-            'syntax_check': {'passed': False, 'issues': []},
-            'static_analysis': {'passed': False, 'issues': []},
-            'unit_tests': {'passed': False, 'results': {}},
-            'integration_tests': {'passed': False, 'results': {}},
-            'performance_tests': {'passed': False, 'results': {}},
-            'overall_score': 0.0,
-            'recommendations': []
-        }
+        validation_result = ValidationResult(
+            code_hash=code_hash,
+            language=language,
+            validation_level=validation_level,
+            timestamp=datetime.now().isoformat()
+        )
 
         try:
+            # Scan the source and traverse Python code once for the safety check and static analysis
+            scan = self._scan_source(code)
+            analysis = None
+            needs_analysis = scan['needs_safety_walk'] or validation_level in ['standard', 'comprehensive']
+            if language == 'python' and needs_analysis and not scan['forbidden_patterns']:  # Else the safety check fails without it
+                try:
+                    analysis = self._analyze_python(code)
+                except Exception:
+                    pass  # Reported by the phases themselves
+
             # Step 1: Safety Check (Always performed)
-            safety_result = self._perform_safety_check(code, language)
-            validation_result['safety_check'] = safety_result
+            safety_result = self._perform_safety_check(code, language, analysis, scan)
+            validation_result.safety_check = safety_result
             
             if not safety_result['passed']:
-                validation_result['status'] = 'failed_safety'
-                validation_result['recommendations'].append("Code failed safety checks. Review and fix security issues.")
+                validation_result.status = 'failed_safety'
+                validation_result.recommendations.append("Code failed safety checks. Review and fix security issues.")
                 return validation_result
             
             # Step 2: Syntax Check
             syntax_result = self._perform_syntax_check(code, language)
-            validation_result['syntax_check'] = syntax_result
+            validation_result.syntax_check = syntax_result
             
             if not syntax_result['passed']:
-                validation_result['status'] = 'failed_syntax'
-                validation_result['recommendations'].append("Code has syntax errors. Fix syntax issues.")
+                validation_result.status = 'failed_syntax'
+                validation_result.recommendations.append("Code has syntax errors. Fix syntax issues.")
                 return validation_result
             
+            # Steps 3-6 are independent of each other and run concurrently
+            phases = {}
+            
             # Step 3: Static Analysis
             if validation_level in ['standard', 'comprehensive']:
-                static_result = self._perform_static_analysis(code, language)
-                validation_result['static_analysis'] = static_result
+                phases['static_analysis'] = (self._perform_static_analysis, code, language, analysis, scan)
             
             # Step 4: Unit Tests
             if validation_level in ['standard', 'comprehensive']:
-                unit_result = self._perform_unit_tests(code, language)
-                validation_result['unit_tests'] = unit_result
+                phases['unit_tests'] = (self._perform_unit_tests, code, language, analysis)
             
             # Step 5: Integration Tests
             if validation_level == 'comprehensive':
-                integration_result = self._perform_integration_tests(code, language)
-                validation_result['integration_tests'] = integration_result
+                phases['integration_tests'] = (self._perform_integration_tests, code, language)
             
             # Step 6: Performance Tests
             if validation_level == 'comprehensive':
-                performance_result = self._perform_performance_tests(code, language)
-                validation_result['performance_tests'] = performance_result
+                phases['performance_tests'] = (self._perform_performance_tests, code, language)
+            
+            validation_result.update(self._run_phases(phases))
             
             # Calculate overall score and determine pass/fail
-            validation_result['overall_score'] = self._calculate_validation_score(validation_result)
-            validation_result['passed'] = validation_result['overall_score'] >= 0.7
-            validation_result['status'] = 'passed' if validation_result['passed'] else 'failed'
+            validation_result.overall_score = self._calculate_validation_score(validation_result)
+            validation_result.passed = validation_result.overall_score >= 0.7
+            validation_result.status = 'passed' if validation_result.passed else 'failed'
             
             # Generate recommendations
-            validation_result['recommendations'] = self._generate_validation_recommendations(validation_result)
+            validation_result.recommendations = self._generate_validation_recommendations(validation_result)
             
         except Exception as e:
             logger.error(f"Validation process failed: {str(e)}")
-            validation_result['status'] = 'error'
-            validation_result['error'] = str(e)
-            validation_result['recommendations'].append(f"Validation process encountered an error: {str(e)}")
+            validation_result.status = 'error'
+            validation_result.error = str(e)
+            validation_result.recommendations.append(f"Validation process encountered an error: {str(e)}")
         
         # Store validation result
         self._store_validation_result(validation_result)
         
         return validation_result
 
-    def _perform_safety_check(self, code: str, language: str) -> Dict[str, Any]:
+    def _run_phases(self, phases: Dict[str, tuple]) -> Dict[str, Any]:
+        """
+        Runs validation phases on the phase pool, or one after another when
+        parallel_phases is off or there is only one phase.
+        
+        Args:
+            phases: Phase functions and their arguments, by result key
+            
+        Returns:
+            Dictionary of phase results, by result key
+            
+        Raises:
+            TimeoutError: If the phases take longer than VALIDATION_PHASE_TIMEOUT
+        """
+        if not self.parallel_phases or len(phases) < 2:
+            return {key: function(*args) for key, (function, *args) in phases.items()}
+        
+        if self._phase_pool is None:
+            self._phase_pool = ThreadPoolExecutor(max_workers=VALIDATION_PHASE_WORKERS,
+                                                  thread_name_prefix="validation-phase")
+        futures = {self._phase_pool.submit(function, *args): key for key, (function, *args) in phases.items()}
+        return {futures[future]: future.result() for future in as_completed(futures, timeout=VALIDATION_PHASE_TIMEOUT)}
+
+    def _perform_safety_check(self, code: str, language: str, analysis: Optional[_FusedAnalyzer] = None,
+                              scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Performs safety checks on the code to identify potentially dangerous operations.
+        Stops at the first critical issue, which fails the check on its own: later
+        patterns and the language-specific checks are then skipped.
         
         Args:
             code: The code to check
             language: Programming language
+            analysis: Traversal of the Python code, made here when not given
+            scan: Source scan of the code, made here when not given
             
         Returns:
             Dictionary containing safety check results
@@ -184,32 +556,35 @@ class ValidationFramework:
         }
 
         try:
+            if scan is None:
+                scan = self._scan_source(code)
+            
             # Check for forbidden imports/functions
-            for forbidden in self.safety_rules['forbidden_imports']:
-                if forbidden in code:
-                    safety_result['issues'].append({
-                        'type': 'forbidden_import',
-                        'item': forbidden,
-                        'severity': 'high',
-                        'message': f"Forbidden import/function detected: {forbidden}"
-                    })
-                    safety_result['risk_level'] = 'high'
+            for forbidden in scan['forbidden_imports']:
+                safety_result['issues'].append({
+                    'type': 'forbidden_import',
+                    'item': forbidden,
+                    'severity': 'high',
+                    'message': f"Forbidden import/function detected: {forbidden}"
+                })
+                safety_result['risk_level'] = 'high'
             
             # Check for dangerous patterns using regex
-            import re
-            for pattern in self.safety_rules['forbidden_patterns']:
-                if re.search(pattern, code, re.IGNORECASE):
-                    safety_result['issues'].append({
-                        'type': 'dangerous_pattern',
-                        'pattern': pattern,
-                        'severity': 'critical',
-                        'message': f"Dangerous pattern detected: {pattern}"
-                    })
-                    safety_result['risk_level'] = 'critical'
+            critical_found = False
+            for pattern in scan['forbidden_patterns']:
+                safety_result['issues'].append({
+                    'type': 'dangerous_pattern',
+                    'pattern': pattern,
+                    'severity': 'critical',
+                    'message': f"Dangerous pattern detected: {pattern}"
+                })
+                safety_result['risk_level'] = 'critical'
+                critical_found = True
+                break
             
             # Language-specific safety checks
-            if language == 'python':
-                safety_result.update(self._python_safety_check(code))
+            if language == 'python' and not critical_found:
+                safety_result['issues'].extend(self._python_safety_check(code, analysis, scan)['issues'])
             
             # Determine if safety check passed
             critical_issues = [issue for issue in safety_result['issues'] if issue['severity'] == 'critical']
@@ -235,53 +610,29 @@ class ValidationFramework:
         
         return safety_result
 
-    def _python_safety_check(self, code: str) -> Dict[str, Any]:
+    def _python_safety_check(self, code: str, analysis: Optional[_FusedAnalyzer] = None,
+                             scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
-        Performs Python-specific safety checks.
+        Performs Python-specific safety checks. Skipped when the source scan
+        found none of the call names the checks look for.
         
         Args:
             code: Python code to check
+            analysis: Traversal of the code, made here when not given
+            scan: Source scan of the code, if already made
             
         Returns:
             Dictionary with additional safety check results
         """
         additional_issues = []
+        if scan is not None and not scan['needs_safety_walk']:
+            return {'issues': additional_issues}
         
         try:
-            # Parse AST to check for dangerous constructs
-            tree = ast.parse(code)
-            
-            for node in ast.walk(tree):
-                # Check for eval/exec calls
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Name) and node.func.id in ['eval', 'exec']:
-                        additional_issues.append({
-                            'type': 'dangerous_function',
-                            'function': node.func.id,
-                            'severity': 'critical',
-                            'message': f"Dangerous function call: {node.func.id}"
-                        })
-                
-                # Check for __import__ usage
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Name) and node.func.id == '__import__':
-                        additional_issues.append({
-                            'type': 'dynamic_import',
-                            'severity': 'high',
-                            'message': "Dynamic import detected: __import__"
-                        })
-                
-                # Check for file operations
-                if isinstance(node, ast.Call):
-                    if isinstance(node.func, ast.Name) and node.func.id == 'open':
-                        # Allow read-only operations, flag write operations
-                        if len(node.args) > 1:
-                            if isinstance(node.args[1], ast.Str) and 'w' in node.args[1].s:
-                                additional_issues.append({
-                                    'type': 'file_write',
-                                    'severity': 'medium',
-                                    'message': "File write operation detected"
-                                })
+            # Check the AST for dangerous constructs
+            if analysis is None:
+                analysis = self._analyze_python(code)
+            additional_issues.extend(analysis.safety_issues)
         
         except SyntaxError:
             # Syntax errors will be caught in syntax check
@@ -295,6 +646,24 @@ class ValidationFramework:
         
         return {'issues': additional_issues}
 
+    def _analyze_python(self, code: str) -> _FusedAnalyzer:
+        """
+        Parses Python code and traverses its tree once for the safety check and
+        static analysis.
+        
+        Args:
+            code: Python code to analyze
+            
+        Returns:
+            The completed traversal
+            
+        Raises:
+            SyntaxError: If the code does not parse
+        """
+        analysis = _FusedAnalyzer()
+        analysis.visit(_parse_python(code))
+        return analysis
+
     def _perform_syntax_check(self, code: str, language: str) -> Dict[str, Any]:
         """
         Performs syntax validation on the code.
@@ -314,7 +683,7 @@ class ValidationFramework:
         try:
             if language == 'python':
                 # Use AST to parse Python code
-                ast.parse(code)
+                _parse_python(code)
                 syntax_result['passed'] = True
             elif language == 'javascript':
                 # For JavaScript, we would use a JavaScript parser
@@ -348,13 +717,16 @@ class ValidationFramework:
         
         return syntax_result
 
-    def _perform_static_analysis(self, code: str, language: str) -> Dict[str, Any]:
+    def _perform_static_analysis(self, code: str, language: str, analysis: Optional[_FusedAnalyzer] = None,
+                                 scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Performs static analysis on the code.
         
         Args:
             code: The code to analyze
             language: Programming language
+            analysis: Traversal of the Python code, made here when not given
+            scan: Source scan of the code, made here when not given
             
         Returns:
             Dictionary containing static analysis results
@@ -367,7 +739,7 @@ class ValidationFramework:
 
         try:
             if language == 'python':
-                static_result.update(self._python_static_analysis(code))
+                static_result.update(self._python_static_analysis(code, analysis, scan))
             else:
                 static_result['issues'].append({
                     'type': 'unsupported_language',
@@ -384,63 +756,59 @@ class ValidationFramework:
         
         return static_result
 
-    def _python_static_analysis(self, code: str) -> Dict[str, Any]:
+    def _python_static_analysis(self, code: str, analysis: Optional[_FusedAnalyzer] = None,
+                                scan: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
         """
         Performs Python-specific static analysis.
         
         Args:
             code: Python code to analyze
+            analysis: Traversal of the code, made here when not given
+            scan: Source scan of the code, made here when not given
             
         Returns:
             Dictionary with static analysis results
         """
+        if scan is None:
+            scan = self._scan_source(code)
         analysis_result = {
             'passed': True,
             'issues': [],
             'metrics': {
                 'functions': 0,
                 'classes': 0,
-                'lines_of_code': len(code.splitlines()),
+                'lines_of_code': scan['line_count'],
                 'complexity_score': 0
             }
         }
         
         try:
-            tree = ast.parse(code)
+            if analysis is None:
+                analysis = self._analyze_python(code)
             
             # Count functions and classes
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    analysis_result['metrics']['functions'] += 1
-                    
-                    # Check function length
-                    func_lines = node.end_lineno - node.lineno if hasattr(node, 'end_lineno') else 10
-                    if func_lines > self.safety_rules['complexity_limits']['max_function_length']:
-                        analysis_result['issues'].append({
-                            'type': 'function_too_long',
-                            'function': node.name,
-                            'lines': func_lines,
-                            'severity': 'medium',
-                            'message': f'Function {node.name} is too long ({func_lines} lines)'
-                        })
-                
-                elif isinstance(node, ast.ClassDef):
-                    analysis_result['metrics']['classes'] += 1
+            analysis_result['metrics']['functions'] = analysis.functions
+            analysis_result['metrics']['classes'] = analysis.classes
+            
+            # Check function length
+            max_function_length = self.safety_rules['complexity_limits']['max_function_length']
+            analysis_result['issues'].extend([{
+                'type': 'function_too_long',
+                'function': name,
+                'lines': func_lines,
+                'severity': 'medium',
+                'message': f'Function {name} is too long ({func_lines} lines)'
+            } for name, func_lines in analysis.function_lengths if func_lines > max_function_length])
             
             # Check for docstrings
-            if not ast.get_docstring(tree):
+            if not analysis.has_docstring:
                 analysis_result['issues'].append({
                     'type': 'missing_docstring',
                     'severity': 'low',
                     'message': 'Module docstring is missing'
                 })
             
-            # Simple complexity calculation (count decision points)
-            complexity = 0
-            for node in ast.walk(tree):
-                if isinstance(node, (ast.If, ast.For, ast.While, ast.Try, ast.With)):
-                    complexity += 1
-            
+            complexity = analysis.complexity
             analysis_result['metrics']['complexity_score'] = complexity
             
             if complexity > self.safety_rules['complexity_limits']['max_cyclomatic_complexity']:
@@ -465,13 +833,15 @@ class ValidationFramework:
         
         return analysis_result
 
-    def _perform_unit_tests(self, code: str, language: str) -> Dict[str, Any]:
+    def _perform_unit_tests(self, code: str, language: str,
+                            analysis: Optional[_FusedAnalyzer] = None) -> Dict[str, Any]:
         """
         Performs unit testing on the code.
         
         Args:
             code: The code to test
             language: Programming language
+            analysis: Traversal of the Python code, made here when not given
             
         Returns:
             Dictionary containing unit test results
@@ -489,7 +859,7 @@ class ValidationFramework:
 
         try:
             if language == 'python':
-                unit_result.update(self._python_unit_tests(code))
+                unit_result.update(self._python_unit_tests(code, analysis))
             else:
                 unit_result['test_output'] = f'Unit testing not implemented for {language}'
         
@@ -499,12 +869,84 @@ class ValidationFramework:
         
         return unit_result
 
-    def _python_unit_tests(self, code: str) -> Dict[str, Any]:
+    def _run_in_test_worker(self, code_path: str, test_path: str) -> Dict[str, Any]:
+        """
+        Runs generated tests in a fresh unit test worker. Tested code can
+        patch modules of the interpreter running it, so a worker runs a single
+        job; the next worker is started right away, its start-up overlapping
+        the current job.
+        
+        Args:
+            code_path: Path of the code under test
+            test_path: Path of the test module importing it
+            
+        Returns:
+            Dictionary with whether the tests succeeded and their output
+        """
+        with self._test_worker_lock:
+            worker = self._test_worker
+            if worker is None or worker.poll() is not None:
+                if worker is None:
+                    atexit.register(self._stop_spare_test_worker)
+                worker = self._start_test_worker()
+            self._test_worker = self._start_test_worker()
+        timed_out = False
+        try:
+            worker.stdin.write(json.dumps({'code_path': code_path, 'test_path': test_path}) + "\n")
+            worker.stdin.flush()
+            ready, _, _ = select.select([worker.stdout], [], [], UNIT_TEST_TIMEOUT)
+            timed_out = not ready
+            line = '' if timed_out else worker.stdout.readline()
+        except OSError:
+            line = ''
+        if not line:
+            worker.kill()
+            worker.wait()
+            if timed_out:
+                raise TimeoutError(f"Unit tests timed out after {UNIT_TEST_TIMEOUT} seconds")
+            raise RuntimeError("Unit test worker exited unexpectedly")
+        _stop_test_worker(worker)
+        return json.loads(line)
+
+    @staticmethod
+    def _start_test_worker() -> subprocess.Popen:
+        """Starts a unit test worker process, which waits for its job."""
+        return subprocess.Popen(
+            [sys.executable, '-u', TEST_WORKER_PATH],
+            stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.DEVNULL, text=True
+        )
+
+    def _stop_spare_test_worker(self):
+        """Stops the worker started for the next unit test run, at exit."""
+        with self._test_worker_lock:
+            worker, self._test_worker = self._test_worker, None
+        if worker is not None:
+            _stop_test_worker(worker)
+
+    def _get_test_dir(self) -> str:
+        """
+        Returns the directory for generated test files: a private directory on
+        tmpfs when available, so test runs never touch the disk, else the
+        default temp directory.
+        """
+        if self._test_dir is None:
+            self._test_dir = tempfile.gettempdir()
+            if sys.platform.startswith('linux') and os.path.isdir(os.path.dirname(TMPFS_TEST_DIR)):
+                try:
+                    os.makedirs(TMPFS_TEST_DIR, mode=0o700, exist_ok=True)
+                    if os.stat(TMPFS_TEST_DIR).st_uid == os.getuid():
+                        self._test_dir = TMPFS_TEST_DIR
+                except OSError:
+                    pass
+        return self._test_dir
+
+    def _python_unit_tests(self, code: str, analysis: Optional[_FusedAnalyzer] = None) -> Dict[str, Any]:
         """
         Performs Python unit testing.
         
         Args:
             code: Python code to test
+            analysis: Traversal of the code, made here when not given
             
         Returns:
             Dictionary with unit test results
@@ -522,30 +964,33 @@ class ValidationFramework:
         
         try:
             # Create a temporary test file
-            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', delete=False) as temp_file:
+            with tempfile.NamedTemporaryFile(mode='w', suffix='.py', dir=self._get_test_dir(), delete=False) as temp_file:
                 temp_file.write(code)
                 temp_file_path = temp_file.name
             
             # Generate basic tests for functions found in the code
-            test_code = self._generate_basic_tests(code)
+            test_code = self._generate_basic_tests(code, analysis)
             
             if test_code:
-                with tempfile.NamedTemporaryFile(mode='w', suffix='_test.py', delete=False) as test_file:
-                    test_file.write(f"import sys\nsys.path.append('{os.path.dirname(temp_file_path)}')\n")
+                with tempfile.NamedTemporaryFile(mode='w', suffix='_test.py', dir=self._get_test_dir(), delete=False) as test_file:
                     test_file.write(f"from {os.path.basename(temp_file_path)[:-3]} import *\n")
                     test_file.write(test_code)
                     test_file_path = test_file.name
                 
-                # Run tests using unittest
-                result = subprocess.run([
-                    sys.executable, '-m', 'unittest', 'discover', '-s', os.path.dirname(test_file_path), 
-                    '-p', os.path.basename(test_file_path)
-                ], capture_output=True, text=True, timeout=30)
+                # Run tests in a worker started ahead of time
+                try:
+                    result = self._run_in_test_worker(temp_file_path, test_file_path)
+                except (TimeoutError, RuntimeError):
+                    test_result['transient_failure'] = True  # Keeps the result out of the validation cache
+                    raise
+                finally:
+                    # Cleanup, also when the worker hung or died
+                    os.unlink(test_file_path)
+                    os.unlink(temp_file_path)
                 
-                test_result['test_output'] = result.stdout + result.stderr
+                test_result['test_output'] = result['output']
                 
-                # Parse results (basic parsing)
-                if 'OK' in result.stderr or result.returncode == 0:
+                if result['successful']:
                     test_result['passed'] = True
                     test_result['results']['tests_run'] = 1
                     test_result['results']['tests_passed'] = 1
@@ -553,59 +998,31 @@ class ValidationFramework:
                 else:
                     test_result['results']['tests_run'] = 1
                     test_result['results']['tests_failed'] = 1
-                
-                # Cleanup
-                os.unlink(test_file_path)
             else:
                 test_result['test_output'] = 'No testable functions found in code'
                 test_result['passed'] = True  # Pass if no functions to test
-            
-            os.unlink(temp_file_path)
+                os.unlink(temp_file_path)
         
         except Exception as e:
             test_result['test_output'] = f'Python unit testing failed: {str(e)}'
         
         return test_result
 
-    def _generate_basic_tests(self, code: str) -> str:
+    def _generate_basic_tests(self, code: str, analysis: Optional[_FusedAnalyzer] = None) -> str:
         """
         Generates basic unit tests for functions in the code.
         
         Args:
             code: The code to generate tests for
+            analysis: Traversal of the code, made here when not given
             
         Returns:
             String containing test code
         """
         try:
-            tree = ast.parse(code)
-            test_code = "import unittest\n\nclass TestGeneratedCode(unittest.TestCase):\n"
-            
-            functions_found = False
-            for node in ast.walk(tree):
-                if isinstance(node, ast.FunctionDef):
-                    functions_found = True
-                    func_name = node.name
-                    
-                    # Generate a basic test
-                    test_code += f"""
-    def test_{func_name}(self):
-        # Basic test for {func_name}
-        try:
-            result = {func_name}()
-            self.assertIsNotNone(result, "Function should return a value")
-        except TypeError:
-            # Function might require arguments
-            pass
-        except Exception as e:
-            self.fail(f"Function {func_name} raised an exception: {{e}}")
-"""
-            
-            if functions_found:
-                test_code += "\nif __name__ == '__main__':\n    unittest.main()\n"
-                return test_code
-            else:
-                return ""
+            if analysis is None:
+                analysis = self._analyze_python(code)
+            return _cached_test_source(tuple(sorted({name for name, _ in analysis.function_lengths})))
         
         except Exception:
             return ""
@@ -662,12 +1079,12 @@ class ValidationFramework:
         
         return performance_result
 
-    def _calculate_validation_score(self, validation_result: Dict[str, Any]) -> float:
+    def _calculate_validation_score(self, validation_result: ValidationResult) -> float:
         """
         Calculates an overall validation score based on all test results.
         
         Args:
-            validation_result: The validation result dictionary
+            validation_result: The validation result
             
         Returns:
             Float score between 0.0 and 1.0
@@ -676,43 +1093,43 @@ class ValidationFramework:
         total_weight = 0.0
         
         # Safety check (weight: 40%)
-        if validation_result['safety_check']['passed']:
+        if validation_result.safety_check['passed']:
             score += 0.4
         total_weight += 0.4
         
         # Syntax check (weight: 30%)
-        if validation_result['syntax_check']['passed']:
+        if validation_result.syntax_check['passed']:
             score += 0.3
         total_weight += 0.3
         
         # Static analysis (weight: 15%)
-        if validation_result['static_analysis']['passed']:
+        if validation_result.static_analysis['passed']:
             score += 0.15
         total_weight += 0.15
         
         # Unit tests (weight: 10%)
-        if validation_result['unit_tests']['passed']:
+        if validation_result.unit_tests['passed']:
             score += 0.1
         total_weight += 0.1
         
         # Integration tests (weight: 3%)
-        if validation_result['integration_tests']['passed']:
+        if validation_result.integration_tests['passed']:
             score += 0.03
         total_weight += 0.03
         
         # Performance tests (weight: 2%)
-        if validation_result['performance_tests']['passed']:
+        if validation_result.performance_tests['passed']:
             score += 0.02
         total_weight += 0.02
         
         return score / total_weight if total_weight > 0 else 0.0
 
-    def _generate_validation_recommendations(self, validation_result: Dict[str, Any]) -> List[str]:
+    def _generate_validation_recommendations(self, validation_result: ValidationResult) -> List[str]:
         """
         Generates recommendations based on validation results.
         
         Args:
-            validation_result: The validation result dictionary
+            validation_result: The validation result
             
         Returns:
             List of recommendation strings
@@ -720,25 +1137,25 @@ class ValidationFramework:
         recommendations = []
         
         # Safety recommendations
-        if not validation_result['safety_check']['passed']:
+        if not validation_result.safety_check['passed']:
             recommendations.append("Address all safety issues before deployment")
-            for issue in validation_result['safety_check']['issues']:
+            for issue in validation_result.safety_check['issues']:
                 if issue['severity'] == 'critical':
                     recommendations.append(f"CRITICAL: {issue['message']}")
         
         # Syntax recommendations
-        if not validation_result['syntax_check']['passed']:
+        if not validation_result.syntax_check['passed']:
             recommendations.append("Fix all syntax errors")
         
         # Static analysis recommendations
-        if not validation_result['static_analysis']['passed']:
+        if not validation_result.static_analysis['passed']:
             recommendations.append("Address static analysis issues")
-            for issue in validation_result['static_analysis']['issues']:
+            for issue in validation_result.static_analysis['issues']:
                 if issue['severity'] in ['high', 'medium']:
                     recommendations.append(f"Consider: {issue['message']}")
         
         # General recommendations based on score
-        score = validation_result['overall_score']
+        score = validation_result.overall_score
         if score < 0.5:
             recommendations.append("Code requires significant improvements before deployment")
         elif score < 0.7:
@@ -750,27 +1167,70 @@ class ValidationFramework:
         
         return recommendations
 
-    def _store_validation_result(self, validation_result: Dict[str, Any]):
+    def _store_validation_result(self, validation_result: ValidationResult):
         """
         Stores validation results in history and knowledge repository.
         
         Args:
             validation_result: The validation result to store
         """
-        # Add to validation history
-        self.validation_history.append(validation_result)
+        # Add to validation history, dropping the oldest record beyond the last 100
+        self._record_validation(validation_result)
         
-        # Keep only last 100 validation records
-        if len(self.validation_history) > 100:
-            self.validation_history = self.validation_history[-100:]
-        
-        # Store in knowledge repository if available
+        # Store in knowledge repository if available, a batch at a time
         if self.knowledge_repository:
-            self.knowledge_repository.add_performance_data({
-                'type': 'code_validation',
-                'validation_data': validation_result,
-                'timestamp': validation_result['timestamp']
-            })
+            with self._knowledge_lock:
+                self._pending_knowledge_writes.append({
+                    'type': 'code_validation',
+                    'validation_data': validation_result.to_dict(),
+                    'timestamp': validation_result.timestamp
+                })
+                batch_full = len(self._pending_knowledge_writes) >= KNOWLEDGE_BATCH_SIZE
+            if batch_full:
+                self.flush_knowledge_writes()
+
+    def _record_validation(self, validation_result: ValidationResult):
+        """
+        Appends a result to the validation history, updating the running
+        statistics for it and for the record it evicts.
+        
+        Args:
+            validation_result: The validation result to record
+        """
+        with self._history_lock:
+            history = self.validation_history
+            if len(history) == history.maxlen:
+                evicted = history[0]
+                self._passed_count -= evicted.passed
+                self._score_sum -= evicted.overall_score
+                self._language_counts[evicted.language] -= 1
+                if not self._language_counts[evicted.language]:
+                    del self._language_counts[evicted.language]
+            history.append(validation_result)
+            self._passed_count += validation_result.passed
+            self._score_sum += validation_result.overall_score
+            self._language_counts[validation_result.language] += 1
+
+    def flush_knowledge_writes(self):
+        """
+        Writes the validation results still pending to the knowledge repository,
+        in one batch when the repository supports it. Also runs at exit.
+        """
+        with self._knowledge_lock:
+            entries = list(self._pending_knowledge_writes)
+            self._pending_knowledge_writes.clear()
+        if not entries or not self.knowledge_repository:
+            return
+        
+        try:
+            add_batch = getattr(self.knowledge_repository, 'add_performance_data_batch', None)
+            if add_batch:
+                add_batch(entries)
+            else:
+                for entry in entries:
+                    self.knowledge_repository.add_performance_data(entry)
+        except Exception as e:
+            logger.error(f"Failed to store validation results: {str(e)}")
 
     def _setup_python_test_environment(self) -> str:
         """
@@ -804,7 +1264,8 @@ class ValidationFramework:
         Returns:
             List of validation records
         """
-        return self.validation_history[-limit:] if limit else self.validation_history.copy()
+        start = max(0, len(self.validation_history) - limit) if limit else 0
+        return [record.to_dict() for record in islice(self.validation_history, start, None)]
 
     def get_validation_statistics(self) -> Dict[str, Any]:
         """
@@ -813,18 +1274,11 @@ class ValidationFramework:
         Returns:
             Dictionary containing validation statistics
         """
-        total_validations = len(self.validation_history)
-        passed_validations = sum(1 for v in self.validation_history if v.get('passed', False))
-        
-        # Calculate average scores
-        scores = [v.get('overall_score', 0.0) for v in self.validation_history if 'overall_score' in v]
-        avg_score = sum(scores) / len(scores) if scores else 0.0
-        
-        # Language distribution
-        language_counts = {}
-        for validation in self.validation_history:
-            lang = validation.get('language', 'unknown')
-            language_counts[lang] = language_counts.get(lang, 0) + 1
+        with self._history_lock:
+            total_validations = len(self.validation_history)
+            passed_validations = self._passed_count
+            avg_score = self._score_sum / total_validations if total_validations else 0.0
+            language_counts = dict(self._language_counts)
         
         return {
             'total_validations': total_validations,
@@ -842,12 +1296,18 @@ class ValidationFramework:
         Args:
             new_rules: Dictionary containing new safety rules
         """
+        if self.safety_rules is _SAFETY_RULES:
+            self.safety_rules = copy.deepcopy(_SAFETY_RULES)  # Leave the shared defaults untouched
         for category, rules in new_rules.items():
             if category in self.safety_rules:
                 if isinstance(rules, list):
                     self.safety_rules[category].extend(rules)
                 elif isinstance(rules, dict):
                     self.safety_rules[category].update(rules)
+        self._forbidden_automaton = _build_forbidden_automaton(self.safety_rules['forbidden_imports'])
+        self._forbidden_pattern_regex = _compile_forbidden_patterns(self.safety_rules['forbidden_patterns'])
+        with self._cache_lock:
+            self._validation_cache.clear()  # Cached results were judged by the old rules
         
         logger.info("Safety rules updated")
 
@@ -5,11 +5,20 @@ Handles smart home device control requests
 
 import logging
 import re
-from typing import Dict, Any
-from datetime import datetime
+import sys
+import threading
+import time
+from collections import defaultdict
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, Any, Callable, List, Mapping, Optional, Tuple
+from datetime import datetime, timezone
 
 logger = logging.getLogger(__name__)
 
+PARSE_CACHE_SIZE = 2048  # Parsed messages kept for repeated commands
+TIMESTAMP_RESOLUTION = 0.25  # Seconds a formatted response timestamp is reused
+
 # Simulated device registry
 DEVICES = {
     "living_room_light": {"type": "light", "location": "living room", "state": "off", "brightness": 50},
@@ -20,6 +29,123 @@ DEVICES = {
     "security_system": {"type": "security", "location": "main", "state": "armed", "mode": "home"}
 }
 
+# Device ids by type and by location, in registry order
+_BY_TYPE: Dict[str, List[str]] = defaultdict(list)
+_BY_LOCATION: Dict[str, List[str]] = defaultdict(list)
+
+def _index_device(device_id: str, device_info: Dict[str, Any]):
+    """
+    Adds a registered device to the lookup indices. Its type and location
+    are interned, like the parser vocabularies, so comparing them with
+    parsed values is an identity check.
+    """
+    device_info["type"] = sys.intern(device_info["type"])
+    if "location" in device_info:
+        device_info["location"] = sys.intern(device_info["location"])
+    _BY_TYPE[device_info["type"]].append(device_id)
+    _BY_LOCATION[device_info.get("location", "")].append(device_id)
+
+for _device_id, _device_info in DEVICES.items():
+    _index_device(_device_id, _device_info)
+
+# Serializes changes to DEVICES. Readers use _snapshot instead: a read-only
+# copy of every device state, replaced as a whole after each change, so
+# they never take the lock or see a device mid-update.
+_devices_lock = threading.Lock()
+_snapshot: Dict[str, Mapping[str, Any]] = {
+    device_id: MappingProxyType(dict(device_info)) for device_id, device_info in DEVICES.items()
+}
+
+def _publish(device_id: str):
+    """Publishes the current state of a device to the snapshot. Called with the lock held."""
+    global _snapshot
+    _snapshot = {**_snapshot, device_id: MappingProxyType(dict(DEVICES[device_id]))}
+
+def add_device(device_id: str, device_info: Dict[str, Any]):
+    """
+    Registers a device, or replaces one with the same id, keeping the
+    lookup indices coherent with DEVICES
+    
+    Args:
+        device_id (str): Unique device id
+        device_info (dict): Device type, location and state
+    """
+    with _devices_lock:
+        previous = DEVICES.get(device_id)
+        if previous is not None:
+            _BY_TYPE[previous["type"]].remove(device_id)
+            _BY_LOCATION[previous.get("location", "")].remove(device_id)
+        DEVICES[device_id] = device_info
+        _index_device(device_id, device_info)
+        _publish(device_id)
+
+def _find_devices(device_type: Optional[str], location: Optional[str]) -> List[str]:
+    """
+    Finds devices through the indices instead of scanning the registry
+    
+    Args:
+        device_type (str): Device type to match, if any
+        location (str): Device location to match exactly, if any
+        
+    Returns:
+        list: Ids of the matching devices, in registry order
+    """
+    if not location:
+        return list(_BY_TYPE.get(device_type, ()) if device_type else DEVICES)
+    located_ids = _BY_LOCATION.get(location, ())
+    if not device_type:
+        return list(located_ids)
+    return [device_id for device_id in located_ids if DEVICES[device_id]["type"] == device_type]
+
+def _compile_categories(patterns: Dict[str, str]) -> Tuple[Tuple[str, ...], re.Pattern]:
+    """
+    Compiles the patterns of one category (device type, action, location)
+    into a single regex. Each pattern is an alternative named after its
+    index, inside a lookahead so one scan sees every category present.
+    """
+    alternatives = '|'.join(f'(?P<c{i}>{pattern})' for i, pattern in enumerate(patterns.values()))
+    return tuple(sys.intern(name) for name in patterns), re.compile(f'(?=(?:{alternatives}))')
+
+def _first_category(categories: Tuple[Tuple[str, ...], re.Pattern], message: str) -> Optional[str]:
+    """Returns the earliest listed category whose pattern occurs anywhere in the message."""
+    names, regex = categories
+    best = None
+    for match in regex.finditer(message):
+        index = int(match.lastgroup[1:])  # The earliest listed alternative matching here
+        if best is None or index < best:
+            best = index
+            if best == 0:
+                break
+    return None if best is None else names[best]
+
+# Device type patterns
+_DEVICE_TYPES = _compile_categories({
+    "light": r"light|lamp|lighting",
+    "thermostat": r"thermostat|temperature|heat|cool|ac|air",
+    "lock": r"lock|door",
+    "security": r"security|alarm|system"
+})
+
+# Action patterns
+_ACTIONS = _compile_categories({
+    "on": r"turn on|switch on|activate|enable",
+    "off": r"turn off|switch off|deactivate|disable",
+    "toggle": r"toggle|switch",
+    "set": r"set|adjust|change",
+    "lock": r"lock",
+    "unlock": r"unlock"
+})
+
+# Location patterns
+_LOCATIONS = _compile_categories({
+    "living room": r"living room|lounge",
+    "bedroom": r"bedroom|bed room",
+    "kitchen": r"kitchen",
+    "front door": r"front door|main door|entrance"
+})
+
+_NUMBER_RE = re.compile(r'\d+')
+
 def execute(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Execute device control commands
@@ -30,102 +156,165 @@ def execute(input_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         dict: Result of device control operation
     """
-    try:
-        # Extract message and parse device control intent
-        message = input_data.get("message", "").lower()
-        user_id = input_data.get("user_id", "anonymous")
-        
-        # Parse the device control request
-        parsed_request = parse_device_request(message)
-        
-        if not parsed_request:
-            return {
-                "response": "I couldn't understand which device you want to control. Please specify the device and action.",
-                "success": False
-            }
-        
-        # Execute the device control
-        result = control_device(parsed_request, user_id)
-        
-        return result
-        
-    except Exception as e:
-        logger.exception(f"Error in device_control skill: {e}")
+    # Extract message and parse device control intent
+    message = input_data.get("message", "").strip().lower()
+    user_id = input_data.get("user_id", "anonymous")
+    
+    # Parse the device control request
+    parsed_request = parse_device_request(message, already_normalized=True)
+    
+    if not parsed_request:
         return {
-            "response": "I encountered an error while trying to control the device. Please try again.",
-            "error": str(e),
+            "response": "I couldn't understand which device you want to control. Please specify the device and action.",
             "success": False
         }
+    
+    # Execute the device control
+    try:
+        return control_device(parsed_request, user_id)
+    except Exception as e:
+        return _error_response(e)
+
+def _error_response(error: Exception) -> Dict[str, Any]:
+    """Logs an unexpected error while controlling a device and builds its response. Call from an except block."""
+    logger.exception(f"Error in device_control skill: {error}")
+    return {
+        "response": "I encountered an error while trying to control the device. Please try again.",
+        "error": str(error),
+        "success": False
+    }
 
-def parse_device_request(message: str) -> Dict[str, Any]:
+def parse_device_request(message: str, already_normalized: bool = False) -> Dict[str, Any]:
     """
     Parse natural language device control request
     
     Args:
         message (str): Natural language message
+        already_normalized (bool): Whether the message is already stripped and lowercased
         
     Returns:
         dict: Parsed device control parameters
     """
-    message = message.lower().strip()
-    
-    # Device type patterns
-    device_patterns = {
-        "light": r"light|lamp|lighting",
-        "thermostat": r"thermostat|temperature|heat|cool|ac|air",
-        "lock": r"lock|door",
-        "security": r"security|alarm|system"
-    }
-    
-    # Action patterns
-    action_patterns = {
-        "on": r"turn on|switch on|activate|enable",
-        "off": r"turn off|switch off|deactivate|disable",
-        "toggle": r"toggle|switch",
-        "set": r"set|adjust|change",
-        "lock": r"lock",
-        "unlock": r"unlock"
-    }
-    
-    # Location patterns
-    location_patterns = {
-        "living room": r"living room|lounge",
-        "bedroom": r"bedroom|bed room",
-        "kitchen": r"kitchen",
-        "front door": r"front door|main door|entrance"
-    }
-    
+    parsed = _parse_device_request_cached(message if already_normalized else message.strip().lower())
+    return dict(parsed) if parsed is not None else None
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_device_request_cached(message: str) -> Optional[Tuple[Tuple[str, Any], ...]]:
+    """Parses a normalized message, as immutable items so cached results can be shared."""
     parsed = {}
     
-    # Find device type
-    for device_type, pattern in device_patterns.items():
-        if re.search(pattern, message):
-            parsed["device_type"] = device_type
-            break
-    
-    # Find action
-    for action, pattern in action_patterns.items():
-        if re.search(pattern, message):
-            parsed["action"] = action
-            break
-    
-    # Find location
-    for location, pattern in location_patterns.items():
-        if re.search(pattern, message):
-            parsed["location"] = location
-            break
+    # Find device type, action and location, one scan each
+    for key, categories in (("device_type", _DEVICE_TYPES), ("action", _ACTIONS), ("location", _LOCATIONS)):
+        category = _first_category(categories, message)
+        if category is not None:
+            parsed[key] = category
     
     # Extract numeric values (for temperature, brightness, etc.)
-    numbers = re.findall(r'\d+', message)
+    numbers = _NUMBER_RE.findall(message)
     if numbers:
         parsed["value"] = int(numbers[0])
     
     # If we found at least a device type or action, return the parsed result
     if "device_type" in parsed or "action" in parsed:
-        return parsed
+        return tuple(parsed.items())
     
     return None
 
+# Last formatted timestamp as (epoch seconds, ISO string), replaced as a whole
+_timestamp_cache: Tuple[float, str] = (0.0, "")
+
+def _now_iso() -> str:
+    """
+    Current UTC time in ISO format, reused for TIMESTAMP_RESOLUTION seconds
+    
+    Returns:
+        str: ISO 8601 timestamp with UTC offset
+    """
+    global _timestamp_cache
+    now = time.time()
+    cached_at, formatted = _timestamp_cache
+    if now - cached_at > TIMESTAMP_RESOLUTION:
+        formatted = datetime.fromtimestamp(now, timezone.utc).isoformat()
+        _timestamp_cache = (now, formatted)
+    return formatted
+
+# Response templates, formatted with %
+_TMPL_ON = "I've turned on the %s %s."
+_TMPL_OFF = "I've turned off the %s %s."
+_TMPL_ARMED = "I've armed the %s security system."
+_TMPL_DISARMED = "I've disarmed the %s security system."
+_TMPL_SET_TEMPERATURE = "I've set the thermostat to %s degrees."
+_TMPL_LOCKED = "I've locked the %s."
+_TMPL_UNLOCKED = "I've unlocked the %s."
+_TMPL_TOGGLED = "I've turned %s the %s %s."
+_TMPL_CANNOT_TOGGLE = "I can't toggle the %s. Please specify on or off."
+_TMPL_UNKNOWN_ACTION = "I'm not sure how to %s the %s."
+_MSG_MISSING_TEMPERATURE = "Please specify the temperature you'd like to set."
+
+# Action handlers: each updates the device state and returns the response message
+
+def _turn_on_light(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    device_info["state"] = "on"
+    return _TMPL_ON % (loc, typ)
+
+def _arm_security(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    device_info["state"] = "armed"
+    return _TMPL_ARMED % loc
+
+def _report_on(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    return _TMPL_ON % (loc, typ)
+
+def _turn_off_light(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    device_info["state"] = "off"
+    return _TMPL_OFF % (loc, typ)
+
+def _disarm_security(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    device_info["state"] = "disarmed"
+    return _TMPL_DISARMED % loc
+
+def _report_off(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    return _TMPL_OFF % (loc, typ)
+
+def _set_temperature(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    if not value:
+        return _MSG_MISSING_TEMPERATURE
+    device_info["temperature"] = value
+    return _TMPL_SET_TEMPERATURE % value
+
+def _lock(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    device_info["state"] = "locked"
+    return _TMPL_LOCKED % loc
+
+def _unlock(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    device_info["state"] = "unlocked"
+    return _TMPL_UNLOCKED % loc
+
+def _toggle_light(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    new_state = "off" if device_info["state"] == "on" else "on"
+    device_info["state"] = new_state
+    return _TMPL_TOGGLED % (new_state, loc, typ)
+
+def _cannot_toggle(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    return _TMPL_CANNOT_TOGGLE % typ
+
+def _unknown_action(device_info: Dict[str, Any], loc: str, typ: str, action: str, value: Optional[int]) -> str:
+    return _TMPL_UNKNOWN_ACTION % (action, typ)
+
+# Handlers by (action, device type); "*" matches any other device type
+_ACTION_HANDLERS: Dict[Tuple[str, str], Callable[[Dict[str, Any], str, str, str, Optional[int]], str]] = {
+    ("on", "light"): _turn_on_light,
+    ("on", "security"): _arm_security,
+    ("on", "*"): _report_on,
+    ("off", "light"): _turn_off_light,
+    ("off", "security"): _disarm_security,
+    ("off", "*"): _report_off,
+    ("set", "thermostat"): _set_temperature,
+    ("lock", "lock"): _lock,
+    ("unlock", "lock"): _unlock,
+    ("toggle", "light"): _toggle_light,
+    ("toggle", "*"): _cannot_toggle
+}
+
 def control_device(request: Dict[str, Any], user_id: str) -> Dict[str, Any]:
     """
     Control a specific device based on parsed request
@@ -143,13 +332,7 @@ def control_device(request: Dict[str, Any], user_id: str) -> Dict[str, Any]:
     value = request.get("value")
     
     # Find matching device
-    matching_devices = []
-    for device_id, device_info in DEVICES.items():
-        if device_type and device_info["type"] != device_type:
-            continue
-        if location and location not in device_info.get("location", ""):
-            continue
-        matching_devices.append((device_id, device_info))
+    matching_devices = _find_devices(device_type, location)
     
     if not matching_devices:
         return {
@@ -158,57 +341,17 @@ def control_device(request: Dict[str, Any], user_id: str) -> Dict[str, Any]:
         }
     
     # Use the first matching device
-    device_id, device_info = matching_devices[0]
+    device_id = matching_devices[0]
+    device_info = DEVICES[device_id]
+    loc = device_info["location"]
+    typ = device_info["type"]
     
     # Perform the action
-    response_message = ""
-    
-    if action == "on":
-        if device_info["type"] == "light":
-            DEVICES[device_id]["state"] = "on"
-            response_message = f"I've turned on the {device_info['location']} {device_info['type']}."
-        elif device_info["type"] == "security":
-            DEVICES[device_id]["state"] = "armed"
-            response_message = f"I've armed the {device_info['location']} security system."
-        else:
-            response_message = f"I've turned on the {device_info['location']} {device_info['type']}."
-    
-    elif action == "off":
-        if device_info["type"] == "light":
-            DEVICES[device_id]["state"] = "off"
-            response_message = f"I've turned off the {device_info['location']} {device_info['type']}."
-        elif device_info["type"] == "security":
-            DEVICES[device_id]["state"] = "disarmed"
-            response_message = f"I've disarmed the {device_info['location']} security system."
-        else:
-            response_message = f"I've turned off the {device_info['location']} {device_info['type']}."
-    
-    elif action == "set" and device_info["type"] == "thermostat":
-        if value:
-            DEVICES[device_id]["temperature"] = value
-            response_message = f"I've set the thermostat to {value} degrees."
-        else:
-            response_message = "Please specify the temperature you'd like to set."
-    
-    elif action == "lock" and device_info["type"] == "lock":
-        DEVICES[device_id]["state"] = "locked"
-        response_message = f"I've locked the {device_info['location']}."
-    
-    elif action == "unlock" and device_info["type"] == "lock":
-        DEVICES[device_id]["state"] = "unlocked"
-        response_message = f"I've unlocked the {device_info['location']}."
-    
-    elif action == "toggle":
-        if device_info["type"] == "light":
-            current_state = DEVICES[device_id]["state"]
-            new_state = "off" if current_state == "on" else "on"
-            DEVICES[device_id]["state"] = new_state
-            response_message = f"I've turned {new_state} the {device_info['location']} {device_info['type']}."
-        else:
-            response_message = f"I can't toggle the {device_info['type']}. Please specify on or off."
-    
-    else:
-        response_message = f"I'm not sure how to {action} the {device_info['type']}."
+    handler = _ACTION_HANDLERS.get((action, typ)) or _ACTION_HANDLERS.get((action, "*"), _unknown_action)
+    with _devices_lock:
+        response_message = handler(device_info, loc, typ, action, value)
+        _publish(device_id)
+        new_state = dict(device_info)
     
     # Log the action
     logger.info(f"User {user_id} controlled device {device_id}: {action}")
@@ -217,37 +360,38 @@ def control_device(request: Dict[str, Any], user_id: str) -> Dict[str, Any]:
         "response": response_message,
         "device_controlled": {
             "id": device_id,
-            "type": device_info["type"],
-            "location": device_info["location"],
-            "new_state": DEVICES[device_id]
+            "type": typ,
+            "location": loc,
+            "new_state": new_state
         },
         "success": True,
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _now_iso()
     }
 
 def get_device_status(device_type: str = None, location: str = None) -> Dict[str, Any]:
     """
     Get status of devices
     
+    Device states are read-only snapshots taken after the last change to
+    each device, read without locking; copy them with dict() to modify or
+    serialize them.
+    
     Args:
         device_type (str): Filter by device type
-        location (str): Filter by location
+        location (str): Filter by exact location
         
     Returns:
         dict: Device status information
     """
     filtered_devices = {}
+    snapshot = _snapshot
     
-    for device_id, device_info in DEVICES.items():
-        if device_type and device_info["type"] != device_type:
-            continue
-        if location and location not in device_info.get("location", ""):
-            continue
-        filtered_devices[device_id] = device_info.copy()
+    for device_id in _find_devices(device_type, location):
+        filtered_devices[device_id] = snapshot[device_id]
     
     return {
         "devices": filtered_devices,
         "count": len(filtered_devices),
-        "timestamp": datetime.utcnow().isoformat()
+        "timestamp": _now_iso()
     }
 
@@ -5,11 +5,41 @@ Handles information requests and general questions
 
 import logging
 import re
-from datetime import datetime
-from typing import Dict, Any
+import time
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Dict, Any, Callable, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+PARSE_CACHE_SIZE = 2048  # Parsed messages kept for repeated questions
+
+# Request type patterns, in priority order. Each is an alternative inside a
+# lookahead so one scan sees every type present in the message.
+_REQUEST_TYPES = ("time", "date", "weather", "system_status")
+_REQUEST_TYPE_RE = re.compile(
+    r"(?=(?:(?P<time>what time|current time|time is it)"
+    r"|(?P<date>what date|today's date|current date)"
+    r"|(?P<weather>weather|temperature|forecast|rain|sunny|cloudy)"
+    r"|(?P<system_status>system status|how are you|status|health)))"
+)
+_REQUEST_TYPE_PRIORITY = {request_type: i for i, request_type in enumerate(_REQUEST_TYPES)}
+
+# General request topics, in priority order, matched like the request types
+_GENERAL_TOPICS = ("about", "capabilities")
+_GENERAL_TOPIC_RE = re.compile(
+    r"(?=(?:(?P<about>jarvis|yourself)"
+    r"|(?P<capabilities>capabilities|what can you do)))"
+)
+_GENERAL_TOPIC_PRIORITY = {topic: i for i, topic in enumerate(_GENERAL_TOPICS)}
+
+# Simple location extraction patterns
+_LOCATION_PATTERNS = (
+    re.compile(r"in ([a-zA-Z\s]+)"),
+    re.compile(r"at ([a-zA-Z\s]+)"),
+    re.compile(r"for ([a-zA-Z\s]+)")
+)
+
 def execute(input_data: Dict[str, Any]) -> Dict[str, Any]:
     """
     Execute information request
@@ -20,64 +50,66 @@ def execute(input_data: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         dict: Response with requested information
     """
+    message = input_data.get("message", "").strip().lower()
+    user_id = input_data.get("user_id", "anonymous")
+    
+    # Parse the information request
+    query_info = parse_information_request(message, already_normalized=True)
+    
+    # Handle different types of information requests
+    handler = _REQUEST_HANDLERS.get(query_info["type"], handle_general_request)
     try:
-        message = input_data.get("message", "").lower()
-        user_id = input_data.get("user_id", "anonymous")
-        
-        # Parse the information request
-        query_info = parse_information_request(message)
-        
-        # Handle different types of information requests
-        if query_info["type"] == "time":
-            return handle_time_request()
-        elif query_info["type"] == "date":
-            return handle_date_request()
-        elif query_info["type"] == "weather":
-            return handle_weather_request(query_info.get("location"))
-        elif query_info["type"] == "system_status":
-            return handle_system_status_request()
-        else:
-            return handle_general_request(message, query_info)
-            
+        return handler(message, query_info)
     except Exception as e:
-        logger.exception(f"Error in information_request skill: {e}")
-        return {
-            "response": "I encountered an error while processing your information request. Please try again.",
-            "error": str(e),
-            "success": False
-        }
-
-def parse_information_request(message: str) -> Dict[str, Any]:
+        return _error_response(e)
+
+def _error_response(error: Exception) -> Dict[str, Any]:
+    """Logs an unexpected error while answering a request and builds its response. Call from an except block."""
+    logger.exception(f"Error in information_request skill: {error}")
+    return {
+        "response": "I encountered an error while processing your information request. Please try again.",
+        "error": str(error),
+        "success": False
+    }
+
+def parse_information_request(message: str, already_normalized: bool = False) -> Dict[str, Any]:
     """
     Parse the type of information being requested
     
     Args:
         message (str): User message
+        already_normalized (bool): Whether the message is already stripped and lowercased
         
     Returns:
         dict: Parsed information about the request
     """
-    message = message.lower().strip()
-    
-    # Time-related patterns
-    if re.search(r"what time|current time|time is it", message):
-        return {"type": "time"}
-    
-    # Date-related patterns
-    if re.search(r"what date|today's date|current date", message):
-        return {"type": "date"}
+    return dict(_parse_information_request_cached(message if already_normalized else message.strip().lower()))
+
+@lru_cache(maxsize=PARSE_CACHE_SIZE)
+def _parse_information_request_cached(message: str) -> Tuple[Tuple[str, Any], ...]:
+    """Parses a normalized message, as immutable items so cached results can be shared."""
+    request_type = _first_listed(_REQUEST_TYPE_RE, _REQUEST_TYPES, _REQUEST_TYPE_PRIORITY, message)
     
-    # Weather-related patterns
-    if re.search(r"weather|temperature|forecast|rain|sunny|cloudy", message):
+    if request_type == "weather":
         location = extract_location(message)
-        return {"type": "weather", "location": location}
+        return (("type", "weather"), ("location", location))
     
-    # System status patterns
-    if re.search(r"system status|how are you|status|health", message):
-        return {"type": "system_status"}
+    if request_type is not None:
+        return (("type", request_type),)
     
     # General information request
-    return {"type": "general", "subject": message}
+    return (("type", "general"), ("subject", message))
+
+def _first_listed(regex: re.Pattern, names: Tuple[str, ...], priorities: Dict[str, int], message: str) -> Optional[str]:
+    """Returns the highest-priority name whose pattern occurs anywhere in the message."""
+    best = None
+    for match in regex.finditer(message):
+        priority = priorities[match.lastgroup]  # The highest-priority name matching here
+        if best is None or priority < best:
+            best = priority
+            if best == 0:
+                break
+    return None if best is None else names[best]
 
 def extract_location(message: str) -> str:
     """
@@ -89,26 +121,36 @@ def extract_location(message: str) -> str:
     Returns:
         str: Extracted location or default
     """
-    # Simple location extraction patterns
-    location_patterns = [
-        r"in ([a-zA-Z\s]+)",
-        r"at ([a-zA-Z\s]+)",
-        r"for ([a-zA-Z\s]+)"
-    ]
-    
-    for pattern in location_patterns:
-        match = re.search(pattern, message)
+    for pattern in _LOCATION_PATTERNS:
+        match = pattern.search(message)
         if match:
             return match.group(1).strip()
     
     return "your location"
 
+# Last time and date responses as (epoch seconds they expire at, response)
+_time_response: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+_date_response: Tuple[float, Optional[Dict[str, Any]]] = (0.0, None)
+
+def _copy_response(response: Dict[str, Any]) -> Dict[str, Any]:
+    """Copies a cached response so callers can modify it and its data."""
+    if "data" not in response:
+        return dict(response)
+    data = {key: list(value) if isinstance(value, list) else value for key, value in response["data"].items()}
+    return {**response, "data": data}
+
 def handle_time_request() -> Dict[str, Any]:
-    """Handle time information request"""
-    current_time = datetime.now()
+    """Handle time information request, reusing the response until the minute changes"""
+    global _time_response
+    now = time.time()
+    expires_at, response = _time_response
+    if response is not None and now < expires_at:
+        return _copy_response(response)
+    
+    current_time = datetime.fromtimestamp(now)
     time_str = current_time.strftime("%I:%M %p")
     
-    return {
+    response = {
         "response": f"The current time is {time_str}.",
         "data": {
             "time": time_str,
@@ -117,13 +159,21 @@ def handle_time_request() -> Dict[str, Any]:
         },
         "success": True
     }
+    _time_response = (now - now % 60 + 60, response)
+    return _copy_response(response)
 
 def handle_date_request() -> Dict[str, Any]:
-    """Handle date information request"""
-    current_date = datetime.now()
+    """Handle date information request, reusing the response until local midnight"""
+    global _date_response
+    now = time.time()
+    expires_at, response = _date_response
+    if response is not None and now < expires_at:
+        return _copy_response(response)
+    
+    current_date = datetime.fromtimestamp(now)
     date_str = current_date.strftime("%A, %B %d, %Y")
     
-    return {
+    response = {
         "response": f"Today is {date_str}.",
         "data": {
             "date": date_str,
@@ -133,6 +183,9 @@ def handle_date_request() -> Dict[str, Any]:
         },
         "success": True
     }
+    midnight = datetime.combine(current_date.date() + timedelta(days=1), datetime.min.time())
+    _date_response = (midnight.timestamp(), response)
+    return _copy_response(response)
 
 def handle_weather_request(location: str = None) -> Dict[str, Any]:
     """Handle weather information request"""
@@ -184,42 +237,50 @@ def handle_system_status_request() -> Dict[str, Any]:
         "success": True
     }
 
+# Prebuilt general responses by topic; None is the response for any other request
+_GENERAL_RESPONSES: Dict[Optional[str], Dict[str, Any]] = {
+    "about": {
+        "response": "I'm JARVIS, your AI assistant. I can help you control smart home devices, answer questions, provide information, and assist with various tasks. I'm designed to learn from your preferences and become more helpful over time.",
+        "data": {
+            "name": "JARVIS",
+            "type": "AI Assistant",
+            "capabilities": ["device_control", "information_retrieval", "task_assistance", "learning"]
+        },
+        "success": True
+    },
+    "capabilities": {
+        "response": "I can help you with many things including: controlling smart home devices (lights, thermostat, locks), answering questions, providing weather and time information, managing your schedule, and learning your preferences to provide better assistance over time.",
+        "data": {
+            "capabilities": [
+                "Smart home device control",
+                "Information retrieval", 
+                "Weather and time queries",
+                "System status monitoring",
+                "Learning and adaptation",
+                "General conversation"
+            ]
+        },
+        "success": True
+    },
+    # For other general requests, provide a helpful response
+    None: {
+        "response": "I'd be happy to help you with that. Could you please provide more specific details about what information you're looking for? I can assist with device control, weather, time, system status, and general questions.",
+        "suggestion": "Try asking about specific topics like 'What's the weather?', 'What time is it?', or 'Turn on the lights'.",
+        "success": True
+    }
+}
+
 def handle_general_request(message: str, query_info: Dict[str, Any]) -> Dict[str, Any]:
     """Handle general information requests"""
-    
     # Check for specific topics we can handle
-    if "jarvis" in message or "yourself" in message:
-        return {
-            "response": "I'm JARVIS, your AI assistant. I can help you control smart home devices, answer questions, provide information, and assist with various tasks. I'm designed to learn from your preferences and become more helpful over time.",
-            "data": {
-                "name": "JARVIS",
-                "type": "AI Assistant",
-                "capabilities": ["device_control", "information_retrieval", "task_assistance", "learning"]
-            },
-            "success": True
-        }
-    
-    elif "capabilities" in message or "what can you do" in message:
-        return {
-            "response": "I can help you with many things including: controlling smart home devices (lights, thermostat, locks), answering questions, providing weather and time information, managing your schedule, and learning your preferences to provide better assistance over time.",
-            "data": {
-                "capabilities": [
-                    "Smart home device control",
-                    "Information retrieval", 
-                    "Weather and time queries",
-                    "System status monitoring",
-                    "Learning and adaptation",
-                    "General conversation"
-                ]
-            },
-            "success": True
-        }
-    
-    else:
-        # For other general requests, provide a helpful response
-        return {
-            "response": "I'd be happy to help you with that. Could you please provide more specific details about what information you're looking for? I can assist with device control, weather, time, system status, and general questions.",
-            "suggestion": "Try asking about specific topics like 'What's the weather?', 'What time is it?', or 'Turn on the lights'.",
-            "success": True
-        }
+    topic = _first_listed(_GENERAL_TOPIC_RE, _GENERAL_TOPICS, _GENERAL_TOPIC_PRIORITY, message)
+    return _copy_response(_GENERAL_RESPONSES[topic])
 
+# Handlers by request type, called with the message and the parsed request;
+# other types are general requests
+_REQUEST_HANDLERS: Dict[str, Callable[[str, Dict[str, Any]], Dict[str, Any]]] = {
+    "time": lambda message, query_info: handle_time_request(),
+    "date": lambda message, query_info: handle_date_request(),
+    "weather": lambda message, query_info: handle_weather_request(query_info.get("location")),
+    "system_status": lambda message, query_info: handle_system_status_request()
+}